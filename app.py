@@ -2,9 +2,11 @@
 
 Entry point only:
 - Page config + global CSS
+- Edition catalog (hot-reloaded) + year filter (only the selected editions are loaded)
 - Data load + validation
 - Sidebar filters
-- Tab routing
+- Tab routing (lazy: only the open tab renders)
+- Opt-in profiling (SIH_PROFILE=1 or ?profile=1)
 
 Run:
   streamlit run app.py
@@ -22,9 +24,21 @@ from sih_dashboard.tabs import (
     problem_statements,
     teams_status,
 )
-from sih_dashboard.utils.config import DATA_PATH
-from sih_dashboard.utils.data import load_data, validate_required_columns
-from sih_dashboard.utils.filters import render_sidebar_filters
+from sih_dashboard.utils.config import DATA_DIR
+from sih_dashboard.utils.data import (
+    delta_errors,
+    load_catalog_watcher,
+    load_dataset,
+    validate_required_columns,
+)
+from sih_dashboard.utils.filters import (
+    distinct_counter,
+    render_edition_filter,
+    render_sidebar_filters,
+    selected_frame,
+)
+from sih_dashboard.utils.instrumentation import profiled_rerun
+from sih_dashboard.utils.profiling import stage
 from sih_dashboard.utils.styles import inject_global_css
 
 
@@ -36,6 +50,11 @@ st.set_page_config(
 
 
 def main() -> None:
+    with profiled_rerun():
+        render_dashboard()
+
+
+def render_dashboard() -> None:
     inject_global_css()
 
     st.title("🏆 Smart India Hackathon — Analytics Dashboard")
@@ -43,11 +62,18 @@ def main() -> None:
     st.divider()
 
     try:
-        df = load_data(DATA_PATH)
+        with stage("catalog"):
+            watcher = load_catalog_watcher(DATA_DIR)
+            source, years = render_edition_filter(watcher.catalog, watcher.error)
+        with stage("load_data"):
+            dataset = load_dataset(source)
     except Exception as exc:
         st.error(f"Failed to load dataset. Details: {exc}")
         return
 
+    for error in delta_errors(source):
+        st.sidebar.warning(f"Skipped a result delta that could not be applied. {error}")
+
     # Expanded required columns to safely support all tabs
     required_columns = {
         "edition_year",
@@ -67,31 +93,31 @@ def main() -> None:
         "institute_state",
     }
 
-    missing = validate_required_columns(df, required_columns)
+    missing = validate_required_columns(dataset.frame, required_columns)
     if missing:
         st.error(f"The dataset is missing required columns needed for analysis: {missing}")
 
         return
 
-    filtered_df = render_sidebar_filters(df)
+    with stage("sidebar_filters"):
+        rows = render_sidebar_filters(dataset, years)
+        filtered_df = selected_frame(dataset, rows)
 
-    # Correct winner logic (status-based, not prize_money-based)
-    winner_count = filtered_df[
-        filtered_df["status"].isin(['Winner', 'Joint Winner', 'Consolation Prize', 'Third Prize',
-       'Second Prize', 'Future Innovators Award', 'First Prize',
-       'Girls Achiever Award', 'Quantum Frontier Award'])
-    ].shape[0]
+    # Correct winner logic (status-based, not prize_money-based; see utils/status.py)
+    winner_count = int(filtered_df["is_winner"].sum())
 
     st.markdown(
         f"""
         **Current Dataset Context:**  
         - Total Team Submissions: `{len(filtered_df)}`  
-        - Participating Institutes: `{filtered_df['institute_name'].nunique()}`  
+        - Participating Institutes: `{distinct_counter(dataset)(filtered_df, 'institute_name')}`  
         - Teams with Declared Awards: `{winner_count}`
         """
     )
     st.divider()
 
+    # Stateful tabs: only the open tab's body runs on each rerun, the others
+    # are computed when the user switches to them.
     tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(
         [
             "📊 Overview",
@@ -100,27 +126,34 @@ def main() -> None:
             "👥 Teams & Outcomes",
             "🔬 Data Explorer",
             "📖 About Dataset",
-        ]
+        ],
+        key="active_tab",
+        on_change="rerun",
     )
 
-    with tab1:
-        overview.render(filtered_df)
-
-    with tab2:
-        problem_statements.render(filtered_df)
+    if tab1.open:
+        with tab1, stage("tab.overview"):
+            overview.render(filtered_df, dataset)
 
-    with tab3:
-        institutes_geography.render(filtered_df)
+    if tab2.open:
+        with tab2, stage("tab.problem_statements"):
+            problem_statements.render(filtered_df, dataset)
 
-    with tab4:
-        teams_status.render(filtered_df)
+    if tab3.open:
+        with tab3, stage("tab.institutes_geography"):
+            institutes_geography.render(filtered_df, dataset)
 
-    with tab5:
-        data_explorer.render(filtered_df)
+    if tab4.open:
+        with tab4, stage("tab.teams_status"):
+            teams_status.render(filtered_df, dataset)
 
-    with tab6:
-        about_dataset.render()
+    if tab5.open:
+        with tab5, stage("tab.data_explorer"):
+            data_explorer.render(filtered_df, dataset)
 
+    if tab6.open:
+        with tab6, stage("tab.about_dataset"):
+            about_dataset.render()
 
 if __name__ == "__main__":
     main()
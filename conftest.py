@@ -0,0 +1 @@
+"""Lets pytest import `sih_dashboard` from the repository root."""
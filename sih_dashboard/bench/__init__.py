@@ -0,0 +1 @@
+"""Synthetic datasets and scaling benchmarks (no Streamlit widget calls)."""
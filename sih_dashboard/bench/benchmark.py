@@ -0,0 +1,338 @@
+"""Scaling benchmark: load, filtering and tab view models.
+
+Generates (and caches) a synthetic dataset per scale, then times each stage
+outside Streamlit (no widget calls, no `st.cache_*`); export stages also
+record the encoded size, a result delta is timed applied in place and
+rebuilt, and with duckdb or polars installed the tab view models are timed
+through each query engine. Results are appended as JSON
+lines, one record per (scale, stage, scenario), tagged with the git commit
+so runs can be compared across commits.
+
+Run:
+  python -m sih_dashboard.bench.benchmark --rows 100000 1000000 --out bench_results.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from ..engines.base import FilterQuery, QueryEngine
+from ..engines.duckdb_engine import DuckDBEngine, duckdb_available
+from ..engines.pandas_engine import PandasEngine
+from ..engines.polars_engine import PolarsEngine, polars_available, scan_prepared
+from ..utils.bitmap_index import BitmapIndex
+from ..utils.catalog import discover_editions, read_partition, write_partitions
+from ..utils.config import FILTER_COLUMNS, SEARCH_COLUMNS, SORT_INDEX_COLUMNS
+from ..utils.data import observed_counts, prepare_data, read_csv_chunked, read_dataset
+from ..utils.dataset import Dataset
+from ..utils.delta import apply_delta, read_delta, upsert_frame
+from ..utils.export import available_formats, encode
+from ..utils.ps_summary import PSFactTable, build_ps_fact_table
+from ..utils.sort_index import SortIndex, sort_order
+from ..utils.status import WINNER_STATUSES
+from ..utils.text_index import SearchIndex
+from ..views.data_explorer import DEFAULT_COLUMNS, explore
+from ..views.institutes_geography import compute_institutes
+from ..views.overview import compute_overview
+from ..views.problem_statements import compute_problem_statements
+from ..views.teams_status import compute_teams, team_table
+from .synthetic import generate, write_csv
+
+
+DEFAULT_DATA_DIR = "data/.cache/synthetic"
+
+# Teams per synthetic result delta (one round of announcements).
+DELTA_ROWS = 500
+
+
+def git_revision() -> dict[str, Any]:
+    """Current commit and whether the work tree has uncommitted changes."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(
+            subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=no"],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": "unknown", "dirty": None}
+    return {"commit": commit, "dirty": dirty}
+
+
+def dataset_path(data_dir: str, rows: int, editions: int, seed: int) -> Path:
+    """Synthetic CSV for one scale, generated on first use."""
+    path = Path(data_dir) / f"sih_synthetic_{rows}_e{editions}_s{seed}.csv"
+    if not path.exists():
+        write_csv(generate(rows, editions, seed), path)
+    return path
+
+
+def delta_path(data_dir: str, df: pd.DataFrame, seed: int) -> Path:
+    """Result delta for the latest edition of `df`: new statuses for DELTA_ROWS teams."""
+    year = int(df["edition_year"].max())
+    path = Path(data_dir) / "deltas" / f"sih_{year}_results_{len(df)}_s{seed}.csv"
+    if not path.exists():
+        rng = np.random.default_rng(seed)
+        latest = np.flatnonzero(df["edition_year"].to_numpy() == year)
+        rows = df.iloc[rng.choice(latest, min(DELTA_ROWS, len(latest)), replace=False)]
+        delta = rows[["ps_id", "team_id", "idea_id", "team_name"]].copy()
+        delta["status"] = rng.choice(WINNER_STATUSES + ["Shortlisted"], len(delta))
+        delta["prize_money"] = np.where(delta["status"] == "Shortlisted", np.nan, 100000.0)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        delta.to_csv(path, index=False)
+    return path
+
+
+def measure(fn: Callable[[], Any], repeat: int, memory: bool) -> tuple[Any, list[float], int | None]:
+    """Run `fn` `repeat` times; optionally one extra traced run for peak memory."""
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result, times, peak
+
+
+def filter_scenarios(df: pd.DataFrame) -> dict[str, tuple[dict[str, list], dict[str, str]]]:
+    """Representative sidebar states: ({column: values}, {column: search text})."""
+    return {
+        "none": ({}, {}),
+        "latest_year": ({"edition_year": [int(df["edition_year"].max())]}, {}),
+        "top_state": ({"institute_state": [observed_counts(df["institute_state"]).index[0]]}, {}),
+        "category_status": ({"category": ["Software"], "status": WINNER_STATUSES}, {}),
+        "search_institute": ({}, {"institute_name": "tech"}),
+    }
+
+
+def apply_filters(
+    df: pd.DataFrame,
+    index: BitmapIndex,
+    search_index: SearchIndex,
+    selections: dict[str, list],
+    searches: dict[str, str],
+) -> pd.DataFrame:
+    """Same mask algebra and single `take` as `render_sidebar_filters`."""
+    mask = index.filter(selections)
+    for column, query in searches.items():
+        mask = index.intersect(mask, np.packbits(search_index.contains(df[column], query)))
+    return df if mask is None else df.take(index.rows(mask))
+
+
+def views(fact: PSFactTable, search_index: SearchIndex) -> dict[str, Callable[[pd.DataFrame], Any]]:
+    """Each tab's view model(s), computed from the filtered frame."""
+    return {
+        "overview": compute_overview,
+        "problem_statements": lambda df: compute_problem_statements(df, fact),
+        "institutes_geography": compute_institutes,
+        "teams_status": compute_teams,
+        "teams_status.table": lambda df: team_table(df, "", search_index),
+        "data_explorer": lambda df: explore(df, DEFAULT_COLUMNS, [], 0),
+    }
+
+
+def run_scale(
+    rows: int,
+    editions: int,
+    seed: int,
+    data_dir: str,
+    repeat: int,
+    memory: bool,
+) -> list[dict[str, Any]]:
+    """Time every stage for one dataset size."""
+    path = str(dataset_path(data_dir, rows, editions, seed))
+    results: list[dict[str, Any]] = []
+
+    def record(stage: str, fn: Callable[[], Any], scenario: str | None = None) -> Any:
+        value, times, peak = measure(fn, repeat, memory)
+        results.append(
+            {
+                "stage": stage,
+                "scenario": scenario,
+                "min_s": min(times),
+                "median_s": statistics.median(times),
+                "peak_mb": None if peak is None else peak / 2**20,
+            }
+        )
+        return value
+
+    # ---- Load ----
+    record("load.csv", lambda: prepare_data(pd.read_csv(path)))
+    record("load.csv_streaming", lambda: read_csv_chunked(path))
+    if polars_available():
+        record("load.csv_polars_lazy", lambda: scan_prepared(path).collect())
+    read_dataset(path)  # writes the prepared Arrow copy
+    df = record("load.prepared", lambda: read_dataset(path))
+
+    # ---- Edition catalog (one hive partition per year, generated on first use) ----
+    partitions = Path(path).with_suffix("")
+    if not partitions.exists():
+        write_partitions(pd.read_csv(path), partitions)
+    catalog = discover_editions(partitions)
+    record("load.partitions", lambda: [prepare_data(read_partition(e.path)) for e in catalog.editions])
+    for edition in catalog.editions:
+        read_dataset(edition.path)  # writes the prepared Arrow copies
+    record("load.catalog.all_years", lambda: [read_dataset(e.path) for e in catalog.editions])
+    record(
+        "load.catalog.latest_year",
+        lambda: [read_dataset(e.path) for e in catalog.editions[-1:]],
+    )
+
+    # ---- Indexes (built once per process in the app) ----
+    index = record("index.bitmap", lambda: BitmapIndex.build(df, list(FILTER_COLUMNS.values())))
+    search_index = record("index.search", lambda: SearchIndex.build(df, SEARCH_COLUMNS))
+    fact = record("index.ps_fact", lambda: build_ps_fact_table(df))
+    sort_index = record("index.sort", lambda: SortIndex.build(df, SORT_INDEX_COLUMNS))
+
+    # ---- Result deltas: applied to the loaded dataset vs rebuilt from the prepared frame ----
+    delta = read_delta(delta_path(data_dir, df, seed))
+    dataset = Dataset.build(df, "base")
+    # Built before results arrive in the app (the delta updates them).
+    dataset.sort_index
+    dataset.ps_fact_table
+    apply_delta(dataset, delta)  # builds the row keys, once per dataset lineage
+    record("delta.apply", lambda: apply_delta(dataset, delta), f"{len(delta.frame)}_rows")
+
+    def rebuild() -> Dataset:
+        rebuilt = Dataset.build(upsert_frame(df, delta), "rebuilt")
+        return rebuilt.sort_index, rebuilt.ps_fact_table
+
+    record("delta.rebuild", rebuild, f"{len(delta.frame)}_rows")
+
+    # ---- Filtering ----
+    frames: dict[str, pd.DataFrame] = {}
+    for name, (selections, searches) in filter_scenarios(df).items():
+        frames[name] = record(
+            "filter.apply",
+            lambda: apply_filters(df, index, search_index, selections, searches),
+            name,
+        )
+        record(
+            "filter.cascade_options",
+            lambda: [index.values(col, index.filter(selections)) for col in FILTER_COLUMNS.values()],
+            name,
+        )
+
+    # ---- Tab view models (unfiltered and filtered) ----
+    for stage, compute in views(fact, search_index).items():
+        for name in ("none", "top_state", "category_status"):
+            record(f"view.{stage}", lambda: compute(frames[name]), name)
+
+    # ---- Tab view models through the optional engines (prepared Parquet copy) ----
+    engines: dict[str, QueryEngine] = {"pandas": PandasEngine(lambda: fact)}
+    if duckdb_available() or polars_available():
+        parquet = Path(path).with_suffix(".parquet")
+        df.to_parquet(parquet, index=False, compression="zstd")
+        if duckdb_available():
+            engines["duckdb"] = DuckDBEngine(parquet)
+        if polars_available():
+            engines["polars"] = PolarsEngine(scan_prepared(parquet))
+    if len(engines) > 1:
+        for name in ("none", "top_state", "category_status", "search_institute"):
+            selections, searches = filter_scenarios(df)[name]
+            query = FilterQuery.from_selections({**selections, **searches})
+            for engine_name, engine in engines.items():
+                for method in ("overview", "problem_statements", "institutes", "teams"):
+                    record(
+                        f"engine.{engine_name}.{method}",
+                        lambda: getattr(engine, method)(frames[name], query),
+                        name,
+                    )
+
+    # ---- Table sorting: sorting the filtered frame vs. the load-time permutation ----
+    for column, ascending in (("prize_money", False), ("institute_name", True)):
+        for name in ("none", "top_state", "category_status"):
+            frame = frames[name]
+            record(f"sort.frame.{column}", lambda: sort_order(frame, column, ascending), name)
+            record(
+                f"sort.index.{column}",
+                lambda: sort_index.order(column, frame.index.to_numpy(), ascending),
+                name,
+            )
+
+    # ---- Download exports (filtered rows, every installed format) ----
+    for fmt in available_formats():
+        for name in ("none", "top_state"):
+            if fmt.max_rows is not None and len(frames[name]) > fmt.max_rows:
+                continue
+            data = record(f"export.{fmt.key}", lambda: encode(frames[name], fmt), name)
+            results[-1]["bytes"] = len(data)
+
+    for result in results:
+        scenario = result["scenario"]
+        result.update(
+            rows=rows,
+            filtered_rows=len(frames[scenario]) if scenario in frames else None,
+            editions=editions,
+            seed=seed,
+        )
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--editions", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="also record peak tracemalloc memory (Python/NumPy; Arrow buffers are not traced)",
+    )
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR)
+    parser.add_argument("--out", default="bench_results.jsonl", help="JSON-lines file to append to")
+    args = parser.parse_args(argv)
+
+    run = {
+        "run_id": uuid.uuid4().hex[:12],
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        **git_revision(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+    }
+
+    with open(args.out, "a", encoding="utf-8") as out:
+        for rows in args.rows:
+            for result in run_scale(
+                rows, args.editions, args.seed, args.data_dir, args.repeat, args.memory
+            ):
+                out.write(json.dumps({**run, **result}) + "\n")
+                scenario = f" [{result['scenario']}]" if result["scenario"] else ""
+                size = f" {result['bytes'] / 2**20:>9.2f} MB" if "bytes" in result else ""
+                print(
+                    f"{rows:>11,}  {result['stage'] + scenario:<55} "
+                    f"{result['min_s'] * 1000:>10.1f} ms{size}"
+                )
+
+    print(f"Appended results of run {run['run_id']} ({run['commit']}) to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""Seeded synthetic SIH datasets for scaling tests.
+
+Frames have the columns and dtypes of
+`data/sih_2025_problem_statements_team_outcomes.csv`, spread over several
+editions. Cardinalities grow with the row count the way a multi-edition
+dataset would: about seven teams per problem statement, Zipf-skewed
+institutes / states / organizations, and the real status mix.
+
+Run:
+  python -m sih_dashboard.bench.synthetic --rows 1000000 --editions 5 --out data/.cache/synthetic/sih_1m.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+COLUMNS = [
+    "edition_year",
+    "ps_id",
+    "problem_statement_title",
+    "category",
+    "theme",
+    "organization",
+    "department",
+    "total_submission",
+    "max_submission",
+    "serial_no",
+    "idea_id",
+    "team_id",
+    "team_name",
+    "team_leader_name",
+    "status",
+    "prize_money",
+    "aishe_code",
+    "institute_name",
+    "institute_city",
+    "institute_state",
+]
+
+# Row count of the shipped 2025 dataset; cardinalities below are scaled from it.
+REFERENCE_ROWS = 1870
+
+# Observed status counts in the 2025 dataset, and the prize each status carries.
+STATUS_COUNTS = {
+    "Shortlisted": 1041,
+    "Waitlist": 507,
+    "Winner": 204,
+    "Joint Winner": 106,
+    "Consolation Prize": 4,
+    "Future Innovators Award": 3,
+    "First Prize": 1,
+    "Second Prize": 1,
+    "Third Prize": 1,
+    "Girls Achiever Award": 1,
+    "Quantum Frontier Award": 1,
+}
+STATUS_PRIZES = {
+    "Winner": 150000.0,
+    "Joint Winner": 75000.0,
+    "First Prize": 100000.0,
+    "Second Prize": 75000.0,
+    "Third Prize": 50000.0,
+    "Consolation Prize": 15000.0,
+    "Future Innovators Award": 10000.0,
+    "Girls Achiever Award": 20000.0,
+    "Quantum Frontier Award": 20000.0,
+}
+
+CATEGORIES = ["Software", "Hardware"]
+CATEGORY_WEIGHTS = [0.7, 0.3]
+
+THEMES = [
+    "Agriculture, FoodTech & Rural Development",
+    "Blockchain & Cybersecurity",
+    "Clean & Green Technology",
+    "Disaster Management",
+    "Fitness & Sports",
+    "Heritage & Culture",
+    "MedTech / BioTech / HealthTech",
+    "Miscellaneous",
+    "Robotics and Drones",
+    "Smart Automation",
+    "Smart Education",
+    "Smart Vehicles",
+    "Space Technology",
+    "Transportation & Logistics",
+    "Travel & Tourism",
+    "Renewable / Sustainable Energy",
+    "Student Innovation",
+]
+
+STATES = [
+    "Andhra Pradesh", "Arunachal Pradesh", "Assam", "Bihar", "Chhattisgarh",
+    "Delhi", "Goa", "Gujarat", "Haryana", "Himachal Pradesh", "Jammu and Kashmir",
+    "Jharkhand", "Karnataka", "Kerala", "Madhya Pradesh", "Maharashtra",
+    "Manipur", "Meghalaya", "Mizoram", "Nagaland", "Odisha", "Puducherry",
+    "Punjab", "Rajasthan", "Sikkim", "Tamil Nadu", "Telangana", "Tripura",
+    "Uttar Pradesh", "Uttarakhand", "West Bengal", "Chandigarh",
+]
+
+_TITLE_PARTS = [
+    ["Smart", "AI-Based", "Blockchain-Enabled", "IoT-Driven", "Low-Cost", "Real-Time",
+     "Automated", "Community-Led", "Data-Driven", "Offline-First", "Secure", "Scalable"],
+    ["Water Quality Monitoring", "Crop Disease Detection", "Grievance Redressal",
+     "Traffic Management", "Flood Early Warning", "Student Attendance Tracking",
+     "Waste Segregation", "Supply Chain Traceability", "Telemedicine Platform",
+     "Energy Metering", "Skill Mapping", "Tourism Recommendation", "Document Verification",
+     "Air Pollution Forecasting", "Cold Chain Management", "Land Record Digitisation"],
+    ["System", "Platform", "Framework", "Dashboard", "Mobile Application", "Toolkit"],
+    ["for Rural Communities", "for Urban Local Bodies", "for Government Schools",
+     "in Coastal Districts", "for Small Farmers", "for Public Hospitals",
+     "in Northeast India", "for MSMEs", "for Tribal Regions", "at Scale"],
+]
+_ORG_PARTS = [
+    ["Ministry of", "Department of", "Government of", "Directorate of", "Council of"],
+    ["Agriculture", "Education", "Health", "Jal Shakti", "Railways", "Power", "Defence",
+     "Culture", "Tourism", "Textiles", "Mines", "Coal", "Housing and Urban Affairs",
+     "Rural Development", "Science and Technology", "Electronics and IT"],
+]
+_DEPT_PARTS = [
+    ["Division of", "Office of", "Bureau of", "Cell for", "Wing of"],
+    ["Planning", "Research", "Monitoring", "Innovation", "Policy", "Operations",
+     "Training", "Infrastructure", "Quality Control", "Public Outreach"],
+    ["(North)", "(South)", "(East)", "(West)", "(Central)", "(HQ)"],
+]
+_INSTITUTE_PARTS = [
+    ["Sri", "National", "Government", "Global", "Rajiv Gandhi", "Indian", "Modern",
+     "Dr. B. R. Ambedkar", "Vidya", "Saraswati", "Swami Vivekananda", "Shri Ram"],
+    ["Institute of Technology", "Engineering College", "University",
+     "College of Engineering", "Institute of Information Technology",
+     "Polytechnic", "Institute of Science and Technology"],
+]
+_CITY_PARTS = [
+    ["Ram", "Shiv", "Chand", "Nav", "Hari", "Sundar", "Krishna", "Raj", "Dev", "Anand",
+     "Gopal", "Vijay", "Lakshmi", "Surya", "Indra"],
+    ["pur", "nagar", "abad", "garh", "puram", "ganj", "kot", "pet", "wadi", "gram"],
+]
+_FIRST_NAMES = [
+    "Aarav", "Aditi", "Akash", "Ananya", "Arjun", "Diya", "Ishaan", "Kavya", "Krishna",
+    "Meera", "Neha", "Nikhil", "Pooja", "Priya", "Rahul", "Riya", "Rohan", "Saanvi",
+    "Sahil", "Shreya", "Siddharth", "Sneha", "Tanvi", "Varun", "Vivek", "Yash",
+]
+_LAST_NAMES = [
+    "Agarwal", "Bansal", "Chatterjee", "Das", "Gupta", "Iyer", "Jain", "Kumar", "Mehta",
+    "Nair", "Patel", "Rao", "Reddy", "Sharma", "Singh", "Srinivasan", "Verma", "Yadav",
+]
+_TEAM_WORDS = [
+    "Innovators", "CodeCrafters", "ByteBuilders", "TechTitans", "Pixels", "Quantum",
+    "Nexus", "Phoenix", "Hackers", "Spark", "Vortex", "Catalyst", "Orbit", "Zenith",
+]
+
+
+def _scaled(reference: int, rows: int, exponent: float, cap: int) -> int:
+    """Cardinality grown sub-linearly from its value in the reference dataset."""
+    return int(min(cap, max(1, round(reference * (rows / REFERENCE_ROWS) ** exponent))))
+
+
+def _zipf_weights(n: int, skew: float) -> np.ndarray:
+    weights = 1.0 / np.arange(1, n + 1) ** skew
+    return weights / weights.sum()
+
+
+def _labels(rng: np.random.Generator, parts: list[list[str]], n: int, sep: str = " ") -> np.ndarray:
+    """`n` distinct labels drawn from the product of `parts` (numbered once exhausted)."""
+    combos = [sep.join(p) for p in itertools.product(*parts)]
+    rng.shuffle(combos)
+    labels = combos[:n]
+    round_no = 2
+    while len(labels) < n:
+        labels.extend(f"{c} {round_no}" for c in combos[: n - len(labels)])
+        round_no += 1
+    return np.asarray(labels, dtype=object)
+
+
+def _concat(*parts) -> np.ndarray:
+    """Element-wise string concatenation of equal-length arrays and scalar strings."""
+    n = next(len(p) for p in parts if not isinstance(p, str))
+    out = pd.Series("", index=range(n), dtype=object)
+    for p in parts:
+        out = out + (p if isinstance(p, str) else pd.Series(p).astype(str).to_numpy(dtype=object))
+    return out.to_numpy(dtype=object)
+
+
+def _dedupe(names: np.ndarray) -> np.ndarray:
+    """Suffix repeated names with ' (k)' so every entry is unique."""
+    repeat = pd.Series(names).groupby(names).cumcount().to_numpy()
+    suffix = np.where(repeat > 0, _concat(" (", repeat + 1, ")"), "")
+    return _concat(names, suffix)
+
+
+def generate(rows: int, editions: int = 5, seed: int = 0, last_year: int = 2025) -> pd.DataFrame:
+    """Synthetic SIH frame with `rows` team rows over `editions` consecutive years."""
+    rng = np.random.default_rng(seed)
+
+    # Editions grow ~15% per year.
+    years = np.arange(last_year - editions + 1, last_year + 1)
+    growth = 1.15 ** np.arange(editions)
+    edition_rows = rng.multinomial(rows, growth / growth.sum())
+
+    # ---- Shared dimensions (scaled from the reference dataset) ----
+    states = np.asarray(STATES, dtype=object)
+    n_cities = _scaled(227, rows, 0.35, 5_000)
+    cities = _labels(rng, _CITY_PARTS, n_cities, sep="")
+    city_states = rng.choice(len(states), n_cities, p=_zipf_weights(len(states), 0.8))
+
+    n_institutes = _scaled(917, rows, 0.5, 45_000)
+    inst_cities = rng.choice(n_cities, n_institutes, p=_zipf_weights(n_cities, 1.0))
+    institutes = _dedupe(
+        _concat(_labels(rng, _INSTITUTE_PARTS, n_institutes), ", ", cities[inst_cities])
+    )
+    aishe_kind = rng.choice(np.array(["C-", "U-", "S-"], dtype=object), n_institutes, p=[0.8, 0.15, 0.05])
+    aishe_codes = _concat(aishe_kind, rng.permutation(n_institutes) + 100)
+
+    n_orgs = _scaled(41, rows, 0.25, 400)
+    organizations = _labels(rng, _ORG_PARTS, n_orgs)
+    n_depts = _scaled(97, rows, 0.3, 2_000)
+    departments = _labels(rng, _DEPT_PARTS, n_depts)
+
+    frames = []
+    next_id = 10_000
+    for year, n_rows in zip(years, edition_rows):
+        if n_rows == 0:
+            continue
+
+        # ---- Problem statements: ~7 teams each ----
+        team_counts = rng.choice([6, 7, 7, 7, 8], n_rows // 6 + 1)
+        ps_of_row = np.repeat(np.arange(len(team_counts)), team_counts)[:n_rows]
+        n_ps = int(ps_of_row[-1]) + 1
+        serial_no = np.arange(n_rows) - np.searchsorted(ps_of_row, ps_of_row) + 1
+
+        width = max(3, len(str(n_ps)))
+        ps_ids = _concat(f"SIH{year % 100:02d}", np.char.zfill(np.arange(1, n_ps + 1).astype(str), width))
+        # A few problem statements share a title (as in the real data).
+        title_idx = np.arange(n_ps)
+        shared = rng.random(n_ps) < 0.06
+        title_idx[shared] = rng.integers(0, n_ps, int(shared.sum()))
+        ps_titles = _labels(rng, _TITLE_PARTS, n_ps)[title_idx]
+        ps_category = rng.choice(len(CATEGORIES), n_ps, p=CATEGORY_WEIGHTS)
+        ps_theme = rng.choice(len(THEMES), n_ps, p=_zipf_weights(len(THEMES), 0.7))
+        ps_org = rng.choice(n_orgs, n_ps, p=_zipf_weights(n_orgs, 1.1))
+        ps_dept = rng.choice(n_depts, n_ps, p=_zipf_weights(n_depts, 1.0))
+        ps_total = np.minimum(500, rng.lognormal(5.3, 0.7, n_ps).astype(np.int64) + 20)
+
+        # ---- Teams ----
+        status_names = np.asarray(list(STATUS_COUNTS), dtype=object)
+        status_p = np.asarray(list(STATUS_COUNTS.values()), dtype=float)
+        status = status_names[rng.choice(len(status_names), n_rows, p=status_p / status_p.sum())]
+        prize = pd.Series(status).map(STATUS_PRIZES).to_numpy(dtype=float)
+
+        ids = next_id + rng.permutation(n_rows * 3)[:n_rows]
+        next_id += n_rows * 3
+        team_ids = ids.copy()
+        # ~1% of teams submitted more than one idea.
+        repeats = rng.random(n_rows) < 0.01
+        team_ids[repeats] = rng.choice(team_ids, int(repeats.sum()))
+
+        team_names = _concat(
+            np.asarray(_TEAM_WORDS, dtype=object)[rng.integers(0, len(_TEAM_WORDS), n_rows)],
+            "_",
+            team_ids % 100_000,
+        )
+        leaders = _concat(
+            np.asarray(_FIRST_NAMES, dtype=object)[rng.integers(0, len(_FIRST_NAMES), n_rows)],
+            " ",
+            np.asarray(list("ABCDEFGHIJKLMNOPRSTVY"), dtype=object)[rng.integers(0, 21, n_rows)],
+            ". ",
+            np.asarray(_LAST_NAMES, dtype=object)[rng.integers(0, len(_LAST_NAMES), n_rows)],
+        )
+        inst = rng.choice(n_institutes, n_rows, p=_zipf_weights(n_institutes, 0.9))
+
+        frames.append(
+            pd.DataFrame(
+                {
+                    "edition_year": year,
+                    "ps_id": ps_ids[ps_of_row],
+                    "problem_statement_title": ps_titles[ps_of_row],
+                    "category": np.asarray(CATEGORIES, dtype=object)[ps_category][ps_of_row],
+                    "theme": np.asarray(THEMES, dtype=object)[ps_theme][ps_of_row],
+                    "organization": organizations[ps_org][ps_of_row],
+                    "department": departments[ps_dept][ps_of_row],
+                    "total_submission": ps_total[ps_of_row],
+                    "max_submission": 500,
+                    "serial_no": serial_no,
+                    "idea_id": ids,
+                    "team_id": team_ids,
+                    "team_name": team_names,
+                    "team_leader_name": leaders,
+                    "status": status,
+                    "prize_money": prize,
+                    "aishe_code": aishe_codes[inst],
+                    "institute_name": institutes[inst],
+                    "institute_city": cities[inst_cities][inst],
+                    "institute_state": states[city_states[inst_cities]][inst],
+                },
+                columns=COLUMNS,
+            )
+        )
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def write_csv(df: pd.DataFrame, path: str | Path, chunk_rows: int = 500_000) -> Path:
+    """Write `df` as CSV in row chunks (bounded temporary memory)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for start in range(0, len(df), chunk_rows):
+        df.iloc[start : start + chunk_rows].to_csv(
+            path, mode="w" if start == 0 else "a", header=start == 0, index=False
+        )
+    return path
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, required=True)
+    parser.add_argument("--editions", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", required=True, help="CSV path to write")
+    args = parser.parse_args(argv)
+
+    path = write_csv(generate(args.rows, args.editions, args.seed), args.out)
+    print(f"Wrote {args.rows:,} rows to {path}")
+
+
+if __name__ == "__main__":
+    main()
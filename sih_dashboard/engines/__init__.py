@@ -0,0 +1,10 @@
+"""Query engines for the tab view models (no Streamlit calls).
+
+An engine turns the sidebar filters into the `sih_dashboard.views` view
+models. `PandasEngine` (the default) runs the view functions on the
+in-memory filtered frame; `DuckDBEngine` pushes the filters down as SQL
+predicates and the aggregations as grouped queries over a prepared file;
+`PolarsEngine` runs them as lazy Polars queries over the same file.
+Both return the same dataclasses, so tab renderers do not care which one
+is configured (see `utils.query_engine`).
+"""
@@ -0,0 +1,77 @@
+"""Engine interface and the filter predicates engines push down."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from ..views.base import DistinctCounter, exact_nunique
+from ..views.institutes_geography import InstitutesView
+from ..views.overview import OverviewView
+from ..views.problem_statements import ProblemStatementsView
+from ..views.teams_status import TeamsView
+
+
+def _plain(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+@dataclass(frozen=True)
+class FilterQuery:
+    """The applied sidebar filters as predicates.
+
+    `values` holds (column, selected values) pairs, combined with AND;
+    `searches` holds (column, text) case-insensitive substring matches.
+    """
+
+    values: tuple[tuple[str, tuple], ...] = ()
+    searches: tuple[tuple[str, str], ...] = ()
+
+    @classmethod
+    def from_selections(cls, selections: dict[str, Any]) -> "FilterQuery":
+        """From {column: selected values, or search text} (see `filters.render_sidebar_filters`)."""
+        values = []
+        searches = []
+        for column, selected in sorted(selections.items()):
+            if not selected:
+                continue
+            if isinstance(selected, str):
+                searches.append((column, selected))
+            else:
+                values.append((column, tuple(_plain(v) for v in selected)))
+        return cls(tuple(values), tuple(searches))
+
+
+class QueryEngine(ABC):
+    """Computes the tab view models for one dataset.
+
+    `df` is the sidebar-filtered frame and `query` the same filters as
+    predicates; an engine aggregates whichever of the two it runs on.
+    `nunique` is the distinct counter of the pandas view functions.
+    """
+
+    name: str
+
+    @abstractmethod
+    def overview(
+        self, df: pd.DataFrame, query: FilterQuery, nunique: DistinctCounter = exact_nunique
+    ) -> OverviewView: ...
+
+    @abstractmethod
+    def problem_statements(
+        self, df: pd.DataFrame, query: FilterQuery, nunique: DistinctCounter = exact_nunique
+    ) -> ProblemStatementsView: ...
+
+    @abstractmethod
+    def institutes(
+        self, df: pd.DataFrame, query: FilterQuery, nunique: DistinctCounter = exact_nunique
+    ) -> InstitutesView: ...
+
+    @abstractmethod
+    def teams(
+        self, df: pd.DataFrame, query: FilterQuery, nunique: DistinctCounter = exact_nunique
+    ) -> TeamsView: ...
@@ -0,0 +1,326 @@
+"""DuckDB engine: filters and aggregations pushed down to an embedded database.
+
+Queries read the prepared edition files (Parquet, or a cleaned CSV) in
+place, with the sidebar filters as SQL predicates (`where_clause`), so only
+aggregate results are materialised in Python. DuckDB runs them on every
+core and spills to its temp directory when a query needs more than the
+configured memory limit.
+
+Limitation: this makes the tab aggregations out-of-core, not the app. The
+dashboard still loads the selected editions into memory (`data.load_dataset`)
+and the sidebar materialises the filtered pandas frame for the header
+metrics, row tables, detail views and exports; the view methods receive
+that frame and ignore it. Datasets must therefore still fit in RAM; DuckDB
+only moves the grouping work and its intermediate state off the frame.
+That working memory comes on top of the frame (cap it with
+SIH_DUCKDB_MEMORY_LIMIT), so the catalog warm-up skips the fact table only
+the pandas engine reads.
+
+Top-N tables order ties by label, like `data.ranked_counts` and the Polars
+engine, so every engine cuts a run of equal counts at the same rows.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any, Sequence
+
+import pandas as pd
+
+from ..utils.ps_summary import PS_KEY_COLUMNS
+from ..views.base import DistinctCounter, exact_nunique
+from ..views.institutes_geography import InstitutesView
+from ..views.overview import OverviewView
+from ..views.problem_statements import ProblemStatementsView
+from ..views.teams_status import TeamsView, order_status_counts
+from .base import FilterQuery, QueryEngine
+
+try:
+    import duckdb
+except ImportError:  # pragma: no cover - optional dependency
+    duckdb = None
+
+
+def duckdb_available() -> bool:
+    return duckdb is not None
+
+
+def quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _quote_literal(text: str) -> str:
+    return "'" + text.replace("'", "''") + "'"
+
+
+def where_clause(query: FilterQuery, *not_null: str) -> tuple[str, list[Any]]:
+    """SQL `WHERE` for `query` (empty without predicates) and its parameters.
+
+    `not_null` columns are required to have a value, as pandas drops missing
+    keys from value counts and group-bys.
+    """
+    clauses: list[str] = []
+    params: list[Any] = []
+    for column, values in query.values:
+        clauses.append(f"{quote_identifier(column)} IN ({', '.join('?' * len(values))})")
+        params.extend(values)
+    for column, text in query.searches:
+        clauses.append(f"contains(lower(CAST({quote_identifier(column)} AS VARCHAR)), lower(?))")
+        params.append(text)
+    clauses.extend(f"{quote_identifier(column)} IS NOT NULL" for column in not_null)
+    return ("WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+class DuckDBEngine(QueryEngine):
+    """Grouped SQL over `path` (.parquet, or .csv with the prepared columns).
+
+    A sequence of Parquet paths (one per edition) is scanned as one table,
+    matching columns by name.
+    """
+
+    name = "duckdb"
+
+    def __init__(
+        self,
+        path: str | Path | Sequence[str | Path],
+        *,
+        threads: int = 0,
+        memory_limit: str = "",
+        temp_directory: str | Path | None = None,
+        approx_distinct: bool = False,
+    ):
+        if duckdb is None:
+            raise ImportError("The DuckDB query engine needs the duckdb package.")
+        config: dict[str, Any] = {}
+        if threads:
+            config["threads"] = threads
+        if memory_limit:
+            config["memory_limit"] = memory_limit
+        if temp_directory is not None:
+            config["temp_directory"] = str(temp_directory)
+        paths = [Path(path)] if isinstance(path, (str, Path)) else [Path(p) for p in path]
+        self.paths = paths
+        self.approx_distinct = approx_distinct
+        self._con = duckdb.connect(":memory:", config=config)
+        if len(paths) == 1 and paths[0].suffix == ".csv":
+            scan = f"read_csv_auto({_quote_literal(str(paths[0]))})"
+        else:
+            files = ", ".join(_quote_literal(str(p)) for p in paths)
+            scan = f"read_parquet([{files}], union_by_name = true)"
+        self._con.execute(f"CREATE VIEW sih AS SELECT * FROM {scan}")
+        self._lock = threading.Lock()
+
+    # ---- Query helpers ----
+
+    def _frame(self, sql: str, params: list[Any]) -> pd.DataFrame:
+        # One cursor per query: a DuckDB connection is not safe to share
+        # between the threads Streamlit runs sessions on.
+        with self._lock:
+            cursor = self._con.cursor()
+        try:
+            return cursor.execute(sql, params).df()
+        finally:
+            cursor.close()
+
+    def _nunique(self, column: str) -> str:
+        if self.approx_distinct:
+            return f"approx_count_distinct({quote_identifier(column)})"
+        return f"count(DISTINCT {quote_identifier(column)})"
+
+    def _scalars(self, query: FilterQuery, **expressions: str) -> dict[str, Any]:
+        """One row of named aggregate expressions over the filtered rows."""
+        where, params = where_clause(query)
+        select = ", ".join(f"{expr} AS {quote_identifier(name)}" for name, expr in expressions.items())
+        row = self._frame(f"SELECT {select} FROM sih {where}", params).iloc[0]
+        return {name: (None if pd.isna(value) else value) for name, value in row.items()}
+
+    def _counts(
+        self,
+        query: FilterQuery,
+        column: str,
+        label: str,
+        *,
+        count: str = "*",
+        limit: int | None = None,
+        by_value: bool = False,
+    ) -> pd.DataFrame:
+        """`label`, Teams rows: most frequent first (or ordered by value)."""
+        where, params = where_clause(query, column)
+        order = "1" if by_value else "2 DESC, 1"
+        sql = (
+            f"SELECT {quote_identifier(column)} AS {quote_identifier(label)}, "
+            f"count({count}) AS Teams FROM sih {where} GROUP BY 1 ORDER BY {order}"
+        )
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return self._frame(sql, params)
+
+    # ---- View models ----
+
+    def overview(
+        self, df: pd.DataFrame, query: FilterQuery, nunique: DistinctCounter = exact_nunique
+    ) -> OverviewView:
+        scalars = self._scalars(
+            query,
+            total_teams="count(*)",
+            unique_ps=self._nunique("ps_id"),
+            institutes=self._nunique("institute_name"),
+            states=self._nunique("institute_state"),
+            winning_teams="count(*) FILTER (WHERE is_ps_winner)",
+        )
+        return OverviewView(
+            total_teams=int(scalars["total_teams"]),
+            unique_ps=int(scalars["unique_ps"]),
+            institutes=int(scalars["institutes"]),
+            states=int(scalars["states"]),
+            winning_teams=int(scalars["winning_teams"]),
+            year_counts=self._counts(query, "edition_year", "Edition Year", by_value=True),
+            category_counts=self._counts(query, "category", "category"),
+            theme_counts=self._counts(query, "theme", "Theme", limit=10),
+            state_counts=self._counts(query, "institute_state", "State", limit=10),
+        )
+
+    def problem_statements(
+        self, df: pd.DataFrame, query: FilterQuery, nunique: DistinctCounter = exact_nunique
+    ) -> ProblemStatementsView:
+        scalars = self._scalars(
+            query,
+            unique_ps=self._nunique("ps_id"),
+            organizations=self._nunique("organization"),
+            departments=self._nunique("department"),
+        )
+        where, params = where_clause(query, "ps_id")
+        avg_teams = self._frame(
+            f"SELECT avg(teams) AS avg_teams FROM "
+            f"(SELECT count(team_id) AS teams FROM sih {where} GROUP BY ps_id)",
+            params,
+        )["avg_teams"].iloc[0]
+
+        where, params = where_clause(query, "ps_id", "problem_statement_title")
+        ps_counts = self._frame(
+            f"SELECT ps_id, problem_statement_title, count(team_id) AS Teams FROM sih {where} "
+            f"GROUP BY 1, 2 ORDER BY 3 DESC, 1, 2 LIMIT 20",
+            params,
+        )
+
+        key_list = ", ".join(quote_identifier(k) for k in PS_KEY_COLUMNS)
+        where, params = where_clause(query, *PS_KEY_COLUMNS)
+        summary = self._frame(
+            f"SELECT {key_list}, "
+            f"count(team_id) AS teams, "
+            f"count(DISTINCT institute_name) AS institutes, "
+            f"count(DISTINCT institute_state) AS states, "
+            f"count(*) FILTER (WHERE is_winner) AS winners, "
+            f"max(total_submission) AS total_submission, "
+            f"max(max_submission) AS max_submission, "
+            f"max(total_submission) / nullif(max(max_submission), 0) AS submission_ratio "
+            f"FROM sih {where} GROUP BY {key_list} ORDER BY {key_list}",
+            params,
+        )
+
+        return ProblemStatementsView(
+            unique_ps=int(scalars["unique_ps"]),
+            organizations=int(scalars["organizations"]),
+            departments=int(scalars["departments"]),
+            avg_teams=float("nan") if pd.isna(avg_teams) else float(avg_teams),
+            ps_counts=ps_counts,
+            org_counts=self._counts(query, "organization", "Organization", limit=15),
+            dept_counts=self._counts(query, "department", "Department", limit=15),
+            summary=summary,
+        )
+
+    def institutes(
+        self, df: pd.DataFrame, query: FilterQuery, nunique: DistinctCounter = exact_nunique
+    ) -> InstitutesView:
+        scalars = self._scalars(
+            query,
+            institutes=self._nunique("institute_name"),
+            cities=self._nunique("institute_city"),
+            states=self._nunique("institute_state"),
+        )
+        where, params = where_clause(query, "institute_name")
+        avg_teams = self._frame(
+            f"SELECT avg(teams) AS avg_teams FROM "
+            f"(SELECT count(team_id) AS teams FROM sih {where} GROUP BY institute_name)",
+            params,
+        )["avg_teams"].iloc[0]
+
+        inst_counts = self._counts(
+            query, "institute_name", "institute_name", count="team_id", limit=15
+        )
+        state_counts = self._counts(
+            query, "institute_state", "institute_state", count="team_id", limit=15
+        )
+
+        # Category shares within the top 10 states.
+        top_states = tuple(state_counts["institute_state"].head(10))
+        if top_states:
+            where, params = where_clause(
+                FilterQuery(query.values + (("institute_state", top_states),), query.searches),
+                "category",
+            )
+            state_category_share = self._frame(
+                f"SELECT institute_state, category, count(*) AS count, "
+                f"count(*) / sum(count(*)) OVER (PARTITION BY institute_state) AS share "
+                f"FROM sih {where} GROUP BY 1, 2 ORDER BY 1, 2",
+                params,
+            )
+        else:
+            state_category_share = pd.DataFrame(
+                columns=["institute_state", "category", "count", "share"]
+            )
+
+        keys = "institute_name, institute_city, institute_state"
+        where, params = where_clause(query, "institute_name", "institute_city", "institute_state")
+        summary = self._frame(
+            f"SELECT {keys}, count(team_id) AS teams, count(DISTINCT ps_id) AS unique_ps, "
+            f"count(*) FILTER (WHERE is_ps_winner) AS winners, "
+            f"count(*) FILTER (WHERE is_ps_winner) / count(team_id) AS win_rate "
+            f"FROM sih {where} GROUP BY {keys} ORDER BY {keys}",
+            params,
+        )
+
+        return InstitutesView(
+            institutes=int(scalars["institutes"]),
+            cities=int(scalars["cities"]),
+            states=int(scalars["states"]),
+            avg_teams=float("nan") if pd.isna(avg_teams) else float(avg_teams),
+            inst_counts=inst_counts,
+            state_counts=state_counts,
+            state_category_share=state_category_share,
+            summary=summary,
+        )
+
+    def teams(
+        self, df: pd.DataFrame, query: FilterQuery, nunique: DistinctCounter = exact_nunique
+    ) -> TeamsView:
+        scalars = self._scalars(
+            query,
+            total_teams=self._nunique("team_id"),
+            winning_teams="count(DISTINCT team_id) FILTER (WHERE is_winner)",
+            total_prize="coalesce(sum(prize_money) FILTER (WHERE is_winner), 0)",
+        )
+
+        where, params = where_clause(query, "status")
+        status_counts = self._frame(
+            f"SELECT status AS Status, count(*) AS Teams, max(prize_money) AS Prize "
+            f"FROM sih {where} GROUP BY 1 ORDER BY 2 DESC, 1",
+            params,
+        )
+
+        where, params = where_clause(query, "prize_money")
+        where += " AND is_winner"
+        prize_counts = self._frame(
+            f'SELECT CAST(trunc(prize_money) AS BIGINT) AS "Prize Amount", count(*) AS Teams '
+            f"FROM sih {where} GROUP BY 1 ORDER BY 1 DESC",
+            params,
+        )
+
+        return TeamsView(
+            total_teams=int(scalars["total_teams"]),
+            winning_teams=int(scalars["winning_teams"]),
+            total_prize=float(scalars["total_prize"]),
+            status_counts=order_status_counts(status_counts),
+            prize_counts=prize_counts,
+        )
@@ -0,0 +1,44 @@
+"""Default engine: the view functions over the in-memory filtered frame."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import pandas as pd
+
+from ..utils.ps_summary import PSFactTable
+from ..views.base import DistinctCounter, exact_nunique
+from ..views.institutes_geography import InstitutesView, compute_institutes
+from ..views.overview import OverviewView, compute_overview
+from ..views.problem_statements import ProblemStatementsView, compute_problem_statements
+from ..views.teams_status import TeamsView, compute_teams
+from .base import FilterQuery, QueryEngine
+
+
+class PandasEngine(QueryEngine):
+    """`ps_fact` returns the fact table of the unfiltered dataset (built lazily)."""
+
+    name = "pandas"
+
+    def __init__(self, ps_fact: Callable[[], PSFactTable]):
+        self.ps_fact = ps_fact
+
+    def overview(
+        self, df: pd.DataFrame, query: FilterQuery, nunique: DistinctCounter = exact_nunique
+    ) -> OverviewView:
+        return compute_overview(df, nunique)
+
+    def problem_statements(
+        self, df: pd.DataFrame, query: FilterQuery, nunique: DistinctCounter = exact_nunique
+    ) -> ProblemStatementsView:
+        return compute_problem_statements(df, self.ps_fact(), nunique)
+
+    def institutes(
+        self, df: pd.DataFrame, query: FilterQuery, nunique: DistinctCounter = exact_nunique
+    ) -> InstitutesView:
+        return compute_institutes(df, nunique)
+
+    def teams(
+        self, df: pd.DataFrame, query: FilterQuery, nunique: DistinctCounter = exact_nunique
+    ) -> TeamsView:
+        return compute_teams(df, nunique)
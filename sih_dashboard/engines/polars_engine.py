@@ -0,0 +1,341 @@
+"""Polars engine: lazy frames run by the multithreaded Polars query optimizer.
+
+Each view model is a handful of `LazyFrame` queries over the same filtered
+source, collected together (`pl.collect_all`) so common subplans run once;
+projection and predicate pushdown mean only the columns a view needs are
+read. The source is the prepared Parquet copy of each edition, or the raw
+CSV / partition cleaned lazily by `prepare_lazy` (same columns and values
+as `data.prepare_data`, with plain strings where pandas uses categoricals).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Sequence
+
+import pandas as pd
+
+from ..utils.catalog import partition_files, partition_year
+from ..utils.ps_summary import PS_KEY_COLUMNS
+from ..utils.status import AWARD_TIER_NONE, AWARD_TIER_WINNER, STATUS_AWARD_TIERS
+from ..views.base import DistinctCounter, exact_nunique
+from ..views.institutes_geography import InstitutesView
+from ..views.overview import OverviewView
+from ..views.problem_statements import ProblemStatementsView
+from ..views.teams_status import TeamsView, order_status_counts
+from .base import FilterQuery, QueryEngine
+
+try:
+    import polars as pl
+    import polars.selectors as cs
+except ImportError:  # pragma: no cover - optional dependency
+    pl = None
+
+
+def polars_available() -> bool:
+    return pl is not None
+
+
+def prepare_lazy(lf: "pl.LazyFrame") -> "pl.LazyFrame":
+    """Lazy `data.prepare_data` over a raw SIH scan."""
+    schema = lf.collect_schema()
+    strings = [col for col, dtype in schema.items() if dtype == pl.String]
+
+    # Strip, then normalise string placeholders to missing.
+    lf = lf.with_columns(pl.col(strings).str.strip_chars())
+    lf = lf.with_columns(
+        pl.when(pl.col(col).is_in(["nan", ""])).then(None).otherwise(pl.col(col)).alias(col)
+        for col in strings
+    )
+
+    if "edition_year" in schema:
+        year = pl.col("edition_year").cast(pl.Float64, strict=False).fill_null(0).cast(pl.Int64)
+    else:
+        year = pl.lit(0, dtype=pl.Int64)
+    lf = lf.with_columns(year.alias("edition_year"))
+
+    # 'a/b' submission counts (numeric columns never hold that form).
+    if schema.get("total_submission") == pl.String:
+        parts = pl.col("total_submission").str.split_exact("/", 1)
+        lf = lf.with_columns(
+            parts.struct.field("field_0").cast(pl.Int64, strict=False).fill_null(0).alias("submissions_received"),
+            parts.struct.field("field_1").cast(pl.Int64, strict=False).fill_null(0).alias("submissions_limit"),
+        )
+
+    lf = lf.with_columns(pl.col(strings).fill_null("Unknown"))
+
+    if "status" in schema:
+        tier = pl.col("status").replace_strict(
+            STATUS_AWARD_TIERS, default=AWARD_TIER_NONE, return_dtype=pl.Int8
+        )
+        lf = lf.with_columns(tier.alias("award_tier")).with_columns(
+            (pl.col("award_tier") > AWARD_TIER_NONE).alias("is_winner"),
+            (pl.col("award_tier") == AWARD_TIER_WINNER).alias("is_ps_winner"),
+        )
+        if "prize_money" in schema:
+            lf = lf.with_columns(pl.col("prize_money").cast(pl.Float64, strict=False))
+    return lf
+
+
+def _scan_one(path: Path) -> "pl.LazyFrame":
+    if path.suffix == ".parquet":
+        return pl.scan_parquet(path)
+    if path.is_dir():
+        raw = pl.scan_parquet(partition_files(path), hive_partitioning=False)
+        year = pl.lit(partition_year(path), dtype=pl.Int64).alias("edition_year")
+        return prepare_lazy(raw.with_columns(year))
+    return prepare_lazy(pl.scan_csv(path, infer_schema_length=10_000))
+
+
+def scan_prepared(path: str | Path | Sequence[str | Path]) -> "pl.LazyFrame":
+    """Lazy prepared dataset over one or more editions.
+
+    Prepared Parquet copies are scanned as they are; raw CSVs and
+    `edition_year=YYYY` partitions are cleaned lazily.
+    """
+    paths = [Path(path)] if isinstance(path, (str, Path)) else [Path(p) for p in path]
+    frames = [_scan_one(p) for p in paths]
+    return frames[0] if len(frames) == 1 else pl.concat(frames, how="diagonal_relaxed")
+
+
+def filter_predicate(query: FilterQuery) -> "pl.Expr | None":
+    """`query` as one Polars predicate (None without filters)."""
+    predicates = [pl.col(column).is_in(list(values)) for column, values in query.values]
+    predicates += [
+        pl.col(column).cast(pl.String).str.to_lowercase().str.contains(text.lower(), literal=True)
+        for column, text in query.searches
+    ]
+    return pl.all_horizontal(predicates) if predicates else None
+
+
+def _collect(*frames: "pl.LazyFrame") -> list[pd.DataFrame]:
+    return [frame.to_pandas() for frame in pl.collect_all(list(frames))]
+
+
+class PolarsEngine(QueryEngine):
+    """Lazy queries over `source` (see `scan_prepared`)."""
+
+    name = "polars"
+
+    def __init__(self, source: "pl.LazyFrame", *, approx_distinct: bool = False):
+        if pl is None:
+            raise ImportError("The Polars query engine needs the polars package.")
+        # Categorical columns (from Parquet dictionaries) sort and compare as text.
+        self.source = source.with_columns(cs.categorical().cast(pl.String))
+        self.approx_distinct = approx_distinct
+
+    # ---- Query helpers ----
+
+    def _filtered(self, query: FilterQuery) -> "pl.LazyFrame":
+        predicate = filter_predicate(query)
+        return self.source if predicate is None else self.source.filter(predicate)
+
+    def _nunique(self, column: str) -> "pl.Expr":
+        values = pl.col(column).drop_nulls()
+        distinct = values.approx_n_unique() if self.approx_distinct else values.n_unique()
+        return distinct.cast(pl.Int64).alias(column)
+
+    @staticmethod
+    def _counts(
+        frame: "pl.LazyFrame",
+        column: str,
+        label: str,
+        *,
+        count: str | None = None,
+        limit: int | None = None,
+        by_value: bool = False,
+    ) -> "pl.LazyFrame":
+        """`label`, Teams rows: most frequent first (or ordered by value)."""
+        teams = pl.len() if count is None else pl.col(count).count()
+        counts = (
+            frame.filter(pl.col(column).is_not_null())
+            .group_by(column)
+            .agg(teams.cast(pl.Int64).alias("Teams"))
+            .rename({column: label})
+        )
+        if by_value:
+            counts = counts.sort(label)
+        else:
+            counts = counts.sort(["Teams", label], descending=[True, False])
+        return counts if limit is None else counts.head(limit)
+
+    @staticmethod
+    def _mean_group_size(frame: "pl.LazyFrame", column: str) -> "pl.LazyFrame":
+        return (
+            frame.filter(pl.col(column).is_not_null())
+            .group_by(column)
+            .agg(pl.col("team_id").count().alias("teams"))
+            .select(pl.col("teams").mean().alias("avg_teams"))
+        )
+
+    # ---- View models ----
+
+    def overview(
+        self, df: pd.DataFrame, query: FilterQuery, nunique: DistinctCounter = exact_nunique
+    ) -> OverviewView:
+        f = self._filtered(query)
+        scalars, year_counts, category_counts, theme_counts, state_counts = _collect(
+            f.select(
+                pl.len().cast(pl.Int64).alias("total_teams"),
+                self._nunique("ps_id"),
+                self._nunique("institute_name"),
+                self._nunique("institute_state"),
+                pl.col("is_ps_winner").sum().cast(pl.Int64).alias("winning_teams"),
+            ),
+            self._counts(f, "edition_year", "Edition Year", by_value=True),
+            self._counts(f, "category", "category"),
+            self._counts(f, "theme", "Theme", limit=10),
+            self._counts(f, "institute_state", "State", limit=10),
+        )
+        row = scalars.iloc[0]
+        return OverviewView(
+            total_teams=int(row["total_teams"]),
+            unique_ps=int(row["ps_id"]),
+            institutes=int(row["institute_name"]),
+            states=int(row["institute_state"]),
+            winning_teams=int(row["winning_teams"]),
+            year_counts=year_counts,
+            category_counts=category_counts,
+            theme_counts=theme_counts,
+            state_counts=state_counts,
+        )
+
+    def problem_statements(
+        self, df: pd.DataFrame, query: FilterQuery, nunique: DistinctCounter = exact_nunique
+    ) -> ProblemStatementsView:
+        f = self._filtered(query)
+        summary = (
+            f.filter(pl.all_horizontal(pl.col(PS_KEY_COLUMNS).is_not_null()))
+            .group_by(PS_KEY_COLUMNS)
+            .agg(
+                pl.col("team_id").count().cast(pl.Int64).alias("teams"),
+                pl.col("institute_name").drop_nulls().n_unique().cast(pl.Int64).alias("institutes"),
+                pl.col("institute_state").drop_nulls().n_unique().cast(pl.Int64).alias("states"),
+                pl.col("is_winner").sum().cast(pl.Int64).alias("winners"),
+                pl.col("total_submission").max(),
+                pl.col("max_submission").max(),
+            )
+            .with_columns(
+                (
+                    pl.col("total_submission")
+                    / pl.when(pl.col("max_submission") != 0).then(pl.col("max_submission"))
+                ).alias("submission_ratio")
+            )
+            .sort(PS_KEY_COLUMNS)
+        )
+        ps_counts = (
+            f.filter(pl.col("ps_id").is_not_null() & pl.col("problem_statement_title").is_not_null())
+            .group_by(["ps_id", "problem_statement_title"])
+            .agg(pl.col("team_id").count().cast(pl.Int64).alias("Teams"))
+            .sort(["Teams", "ps_id", "problem_statement_title"], descending=[True, False, False])
+            .head(20)
+        )
+        scalars, avg_teams, ps_counts, org_counts, dept_counts, summary = _collect(
+            f.select(
+                self._nunique("ps_id"),
+                self._nunique("organization"),
+                self._nunique("department"),
+            ),
+            self._mean_group_size(f, "ps_id"),
+            ps_counts,
+            self._counts(f, "organization", "Organization", limit=15),
+            self._counts(f, "department", "Department", limit=15),
+            summary,
+        )
+        row = scalars.iloc[0]
+        return ProblemStatementsView(
+            unique_ps=int(row["ps_id"]),
+            organizations=int(row["organization"]),
+            departments=int(row["department"]),
+            avg_teams=float(avg_teams["avg_teams"].iloc[0]),
+            ps_counts=ps_counts,
+            org_counts=org_counts,
+            dept_counts=dept_counts,
+            summary=summary,
+        )
+
+    def institutes(
+        self, df: pd.DataFrame, query: FilterQuery, nunique: DistinctCounter = exact_nunique
+    ) -> InstitutesView:
+        f = self._filtered(query)
+        state_counts = self._counts(
+            f, "institute_state", "institute_state", count="team_id", limit=15
+        )
+        # Category shares within the top 10 states.
+        state_category_share = (
+            f.join(state_counts.head(10).select("institute_state"), on="institute_state", how="semi")
+            .filter(pl.col("category").is_not_null())
+            .group_by(["institute_state", "category"])
+            .agg(pl.len().cast(pl.Int64).alias("count"))
+            .with_columns(
+                (pl.col("count") / pl.col("count").sum().over("institute_state")).alias("share")
+            )
+            .sort(["institute_state", "category"])
+        )
+        keys = ["institute_name", "institute_city", "institute_state"]
+        summary = (
+            f.filter(pl.all_horizontal(pl.col(keys).is_not_null()))
+            .group_by(keys)
+            .agg(
+                pl.col("team_id").count().cast(pl.Int64).alias("teams"),
+                pl.col("ps_id").drop_nulls().n_unique().cast(pl.Int64).alias("unique_ps"),
+                pl.col("is_ps_winner").sum().cast(pl.Int64).alias("winners"),
+            )
+            .with_columns((pl.col("winners") / pl.col("teams")).alias("win_rate"))
+            .sort(keys)
+        )
+        scalars, avg_teams, inst_counts, state_counts, state_category_share, summary = _collect(
+            f.select(
+                self._nunique("institute_name"),
+                self._nunique("institute_city"),
+                self._nunique("institute_state"),
+            ),
+            self._mean_group_size(f, "institute_name"),
+            self._counts(f, "institute_name", "institute_name", count="team_id", limit=15),
+            state_counts,
+            state_category_share,
+            summary,
+        )
+        row = scalars.iloc[0]
+        return InstitutesView(
+            institutes=int(row["institute_name"]),
+            cities=int(row["institute_city"]),
+            states=int(row["institute_state"]),
+            avg_teams=float(avg_teams["avg_teams"].iloc[0]),
+            inst_counts=inst_counts,
+            state_counts=state_counts,
+            state_category_share=state_category_share,
+            summary=summary,
+        )
+
+    def teams(
+        self, df: pd.DataFrame, query: FilterQuery, nunique: DistinctCounter = exact_nunique
+    ) -> TeamsView:
+        f = self._filtered(query)
+        winners = f.filter(pl.col("is_winner"))
+        scalars, winner_scalars, status_counts, prize_counts = _collect(
+            f.select(self._nunique("team_id")),
+            winners.select(
+                pl.col("team_id").drop_nulls().n_unique().cast(pl.Int64).alias("winning_teams"),
+                pl.col("prize_money").sum().cast(pl.Float64).alias("total_prize"),
+            ),
+            f.filter(pl.col("status").is_not_null())
+            .group_by("status")
+            .agg(
+                pl.len().cast(pl.Int64).alias("Teams"),
+                pl.col("prize_money").max().alias("Prize"),
+            )
+            .rename({"status": "Status"})
+            .sort(["Teams", "Status"], descending=[True, False]),
+            winners.filter(pl.col("prize_money").is_not_null())
+            .group_by(pl.col("prize_money").cast(pl.Int64).alias("Prize Amount"))
+            .agg(pl.len().cast(pl.Int64).alias("Teams"))
+            .sort("Prize Amount", descending=True),
+        )
+        return TeamsView(
+            total_teams=int(scalars["team_id"].iloc[0]),
+            winning_teams=int(winner_scalars["winning_teams"].iloc[0]),
+            total_prize=float(winner_scalars["total_prize"].iloc[0]),
+            status_counts=order_status_counts(status_counts),
+            prize_counts=prize_counts,
+        )
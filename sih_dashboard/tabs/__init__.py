@@ -1,4 +1,6 @@
 """Tab renderers.
 
 Each tab module exposes a `render(df: pd.DataFrame) -> None` function.
+Aggregation lives in the matching `sih_dashboard.views` module; renderers
+only turn its view model into widgets and charts.
 """
@@ -3,8 +3,20 @@ from __future__ import annotations
 import pandas as pd
 import streamlit as st
 
-
-def render(df: pd.DataFrame) -> None:
+from ..utils.dataset import Dataset
+from ..utils.downloads import export_download_button
+from ..utils.formatting import CURRENCY_COLUMN_FORMAT
+from ..utils.paged_table import paged_dataframe
+from ..views.data_explorer import (
+    DEFAULT_COLUMNS,
+    attribute_columns,
+    explore,
+    export_filename,
+    status_options,
+)
+
+
+def render(df: pd.DataFrame, dataset: Dataset) -> None:
     """Render the Data Explorer tab for flexible, user-driven exploration."""
 
     st.header("🔬 Interactive Data Explorer")
@@ -14,21 +26,10 @@ def render(df: pd.DataFrame) -> None:
         st.warning("No records match the current filter configuration.")
         return
 
-    st.info(f"**Current Dataset View:** {len(df):,} records × {len(df.columns)} attributes")
-
-    all_columns = df.columns.tolist()
-    default_columns = [
-        "edition_year",
-        "ps_id",
-        "problem_statement_title",
-        "category",
-        "team_name",
-        "status",
-        "prize_money",
-        "institute_name",
-        "institute_state",
-    ]
-    default_columns = [c for c in default_columns if c in all_columns]
+    all_columns = attribute_columns(df)
+    st.info(f"**Current Dataset View:** {len(df):,} records × {len(all_columns)} attributes")
+
+    default_columns = [c for c in DEFAULT_COLUMNS if c in all_columns]
 
     selected_columns = st.multiselect(
         "Select Data Attributes to Display",
@@ -40,25 +41,20 @@ def render(df: pd.DataFrame) -> None:
         st.warning("At least one data attribute must be selected for display.")
         return
 
-    display_df = df[selected_columns].copy()
-
     st.divider()
 
     # ---------------- Row-level Filters ----------------
     col1, col2 = st.columns(2)
 
     with col1:
-        status_order = ["Winner", "Joint Winner", "Shortlisted", "Waitlist"]
-        available_status = [s for s in status_order if s in df["status"].unique()]
-
         status_filter = st.multiselect(
             "Filter by Team Status",
-            options=available_status,
+            options=status_options(df),
             default=[],
         )
 
     with col2:
-        if "prize_money" in display_df.columns:
+        if "prize_money" in selected_columns:
             min_prize = st.number_input(
                 "Minimum Prize Amount (₹) — Awarded Teams Only",
                 min_value=0,
@@ -68,14 +64,6 @@ def render(df: pd.DataFrame) -> None:
         else:
             min_prize = None
 
-    if status_filter:
-        display_df = display_df[display_df["status"].isin(status_filter)]
-
-    if min_prize is not None and "prize_money" in display_df.columns:
-        display_df = display_df[
-            (display_df["prize_money"].fillna(0) >= min_prize)
-        ]
-
     st.divider()
 
     # ---------------- Sorting ----------------
@@ -91,25 +79,26 @@ def render(df: pd.DataFrame) -> None:
             horizontal=True,
         )
 
+    display_df = explore(df, selected_columns, status_filter, min_prize)
+    # Widget values (besides the sidebar filters) that shape `display_df`.
+    params = (tuple(selected_columns), tuple(status_filter), min_prize)
     ascending = sort_order == "Ascending"
 
-    if sort_column:
-        display_df = display_df.sort_values(
-            by=sort_column,
-            ascending=ascending,
-            na_position="last",
-        )
-
     st.subheader("📄 Filtered Dataset Preview")
 
     # ---------------- Display ----------------
-    st.dataframe(
+    order = paged_dataframe(
         display_df,
+        key="data_explorer",
+        params=params,
+        sort_column=sort_column,
+        ascending=ascending,
+        sort_index=dataset.sort_index,
         width="stretch",
         height=520,
         column_config={
             "prize_money": st.column_config.NumberColumn(
-                "Prize Money (₹)", format="₹%,.0f"
+                "Prize Money (₹)", format=CURRENCY_COLUMN_FORMAT
             )
         }
         if "prize_money" in display_df.columns
@@ -119,19 +108,12 @@ def render(df: pd.DataFrame) -> None:
     # ---------------- Download ----------------
     st.divider()
 
-    csv = display_df.to_csv(index=False).encode("utf-8")
-
-    years = sorted(df["edition_year"].unique()) if "edition_year" in df.columns else []
-    year_part = (
-        f"{years[0]}-{years[-1]}" if len(years) > 1 else str(years[0]) if years else "unknown"
-    )
-
-    filename = f"sih_{year_part}_filtered_dataset_{len(display_df)}_records.csv"
-
-    st.download_button(
-        "📥 Download Filtered Dataset (CSV)",
-        data=csv,
-        file_name=filename,
-        mime="text/csv",
+    export_download_button(
+        "📥 Download Filtered Dataset",
+        display_df,
+        export="data_explorer",
+        params=(*params, sort_column, ascending),
+        order=order,
+        file_stem=export_filename(df, len(display_df)),
         width="stretch",
     )
@@ -2,186 +2,16 @@ from __future__ import annotations
 
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
 
+from ..utils.charts import DONUT_COLORS, gradient_bar_chart
+from ..utils.dataset import Dataset
+from ..utils.filters import cached_aggregate, distinct_counter
+from ..utils.instrumentation import plotly_chart
+from ..utils.query_engine import filter_query, load_query_engine
 
-# Modern color schemes
-COLOR_SCHEMES = {
-    'gradient_blue': ['#667eea', '#764ba2'],
-    'gradient_purple': ['#f093fb', '#4facfe'],
-    'gradient_orange': ['#ff9a56', '#ff6a88', '#feca57'],
-    'gradient_green': ['#56ab2f', '#a8e063'],
-    'vibrant': ['#f857a6', '#ff5858', '#fdbb2d', '#22c1c3', '#667eea', '#f093fb'],
-    'ocean': ['#2E3192', '#1BFFFF', '#4facfe'],
-    'sunset': ['#ff6e7f', '#bfe9ff', '#ffeaa7'],
-}
 
-DONUT_COLORS = [
-    "#2563EB",  # Blue
-    "#7C3AED",  # Purple
-    "#10B981",  # Emerald
-    "#F59E0B",  # Amber
-    "#EF4444",  # Red
-    "#0EA5E9",  # Sky
-    "#14B8A6",  # Teal
-]
-
-
-# Chart layout template
-import plotly.graph_objects as go
-
-# =========================
-# Chart layout template
-# =========================
-CHART_LAYOUT = {
-    'plot_bgcolor': 'rgba(0,0,0,0)',
-    'paper_bgcolor': 'rgba(0,0,0,0)',
-    'font': {
-        'family': 'Inter, system-ui, sans-serif',
-        'size': 12,
-        'color': '#E6F1FF'  # better for dark theme
-    },
-    # ⬇ Increased right margin to avoid text cutoff
-    'margin': {'l': 60, 'r': 120, 't': 60, 'b': 40},
-    'hoverlabel': {
-        'bgcolor': '#0F172A',        # dark background
-        'bordercolor': '#4DA3FF',    # subtle blue border
-        'font': {
-            'family': 'Inter, system-ui, sans-serif',
-            'size': 13,
-            'color': '#E6F1FF'        # readable light text
-        }
-    },
-
-}
-
-
-def create_gradient_bar_chart(
-    data,
-    x,
-    y,
-    title,
-    orientation='v',
-    color_scheme='gradient_blue'
-):
-    """Create a modern bar chart with safe label rendering (no clipping)."""
-
-    colors = COLOR_SCHEMES.get(color_scheme, COLOR_SCHEMES['gradient_blue'])
-    n_bars = len(data)
-
-    bar_colors = (
-        colors[:n_bars]
-        if n_bars <= len(colors)
-        else [colors[i % len(colors)] for i in range(n_bars)]
-    )
-
-    fig = go.Figure()
-
-    # =========================
-    # Horizontal Bar Chart
-    # =========================
-    if orientation == 'h':
-        display_labels = [truncate_text(label, 35) for label in data[y]]
-
-        fig.add_trace(
-            go.Bar(
-                y=display_labels,
-                x=data[x],
-                orientation='h',
-                marker=dict(
-                    color=bar_colors,
-                    line=dict(color='rgba(255,255,255,0.2)', width=1),
-                ),
-                text=data[x],
-                textposition='outside',
-                textfont=dict(size=11, color='#E6F1FF'),
-                cliponaxis=False,  # ✅ CRITICAL FIX
-                hovertemplate='<b>%{customdata}</b><br>total Teams: %{x:,}<extra></extra>',
-                customdata=data[y],
-            )
-        )
-
-        max_val = data[x].max()
-
-        fig.update_layout(
-            **CHART_LAYOUT,
-            title=dict(text=title, font=dict(size=16, weight='bold'), x=0),
-            showlegend=False,
-            height=350,
-        )
-
-        # ⬇ Add axis padding so labels never touch edge
-        fig.update_xaxes(
-            range=[0, max_val * 1.12],
-            showgrid=True,
-            gridcolor='rgba(128,128,128,0.1)',
-            title=None
-        )
-
-        fig.update_yaxes(
-            showgrid=False,
-            title=None,
-            categoryorder='total ascending'
-        )
-
-    # =========================
-    # Vertical Bar Chart
-    # =========================
-    else:
-        display_labels = [truncate_text(label, 20) for label in data[x]]
-
-        fig.add_trace(
-            go.Bar(
-                x=display_labels,
-                y=data[y],
-                marker=dict(
-                    color=bar_colors,
-                    line=dict(color='rgba(255,255,255,0.2)', width=1),
-                ),
-                text=data[y],
-                textposition='outside',
-                textfont=dict(size=11, color='#E6F1FF'),
-                cliponaxis=False,  # ✅ CRITICAL FIX
-                hovertemplate='<b>%{customdata}</b><br>Teams: %{y:,}<extra></extra>',
-                customdata=data[x],
-            )
-        )
-
-        max_val = data[y].max()
-
-        fig.update_layout(
-            **CHART_LAYOUT,
-            title=dict(text=title, font=dict(size=16, weight='bold'), x=0),
-            showlegend=False,
-            height=350,
-        )
-
-        fig.update_yaxes(
-            range=[0, max_val * 1.12],
-            showgrid=True,
-            gridcolor='rgba(128,128,128,0.1)',
-            title=None
-        )
-
-        fig.update_xaxes(
-            showgrid=False,
-            title=None
-        )
-
-    return fig
-
-
-
-def truncate_text(text: str, max_length: int = 30) -> str:
-    """Truncate long text and add ellipsis."""
-    if len(str(text)) > max_length:
-        return str(text)[:max_length] + "..."
-    return str(text)
-
-
-
-def render(df: pd.DataFrame) -> None:
+def render(df: pd.DataFrame, dataset: Dataset) -> None:
     st.header("📊 SIH 2025 — Submission & Results Overview")
 
     if df.empty:
@@ -214,7 +44,10 @@ def render(df: pd.DataFrame) -> None:
     # --- Enhanced Key Metrics with Icons and Colors ---
     col1, col2, col3, col4, col5 = st.columns(5)
 
-    winning_teams = df[df["status"].isin(["Winner", "Joint Winner"])].shape[0]
+    view = cached_aggregate(
+        "overview",
+        lambda: load_query_engine(dataset).overview(df, filter_query(), distinct_counter(dataset)),
+    )
 
     with col1:
         st.markdown(
@@ -223,7 +56,7 @@ def render(df: pd.DataFrame) -> None:
        padding: 20px; border-radius: 10px; text-align: center;
        box-shadow: 0 10px 30px rgba(5, 150, 105, 0.25);">
                 <div style="font-size: 2rem;">👥</div>
-                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">{len(df):,}</div>
+                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">{view.total_teams:,}</div>
                 <div style="color: rgba(255,255,255,0.9); font-size: 0.85rem;">Total Team Submissions</div>
             </div>
             """,
@@ -237,7 +70,7 @@ def render(df: pd.DataFrame) -> None:
        padding: 20px; border-radius: 10px; text-align: center;
        box-shadow: 0 10px 30px rgba(124, 58, 237, 0.25);">
                 <div style="font-size: 2rem;">🧩</div>
-                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">{df['ps_id'].nunique():,}</div>
+                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">{view.unique_ps:,}</div>
                 <div style="color: rgba(255,255,255,0.9); font-size: 0.85rem;">Unique Problem Statements</div>
             </div>
             """,
@@ -251,7 +84,7 @@ def render(df: pd.DataFrame) -> None:
        padding: 20px; border-radius: 10px; text-align: center;
        box-shadow: 0 10px 30px rgba(217, 119, 6, 0.25);">
                 <div style="font-size: 2rem;">🏫</div>
-                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">{df['institute_name'].nunique():,}</div>
+                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">{view.institutes:,}</div>
                 <div style="color: rgba(255,255,255,0.9); font-size: 0.85rem;">Participating Institutes</div>
             </div>
             """,
@@ -265,7 +98,7 @@ def render(df: pd.DataFrame) -> None:
        padding: 20px; border-radius: 10px; text-align: center;
        box-shadow: 0 10px 30px rgba(37, 99, 235, 0.25);">
                 <div style="font-size: 2rem;">📍</div>
-                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">{df['institute_state'].nunique():,}</div>
+                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">{view.states:,}</div>
                 <div style="color: rgba(255,255,255,0.9); font-size: 0.85rem;">Participating States</div>
             </div>
             """,
@@ -279,7 +112,7 @@ def render(df: pd.DataFrame) -> None:
        padding: 20px; border-radius: 10px; text-align: center;
        box-shadow: 0 10px 30px rgba(180, 83, 9, 0.25);">
                 <div style="font-size: 2rem;">🏆</div>
-                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">{winning_teams:,}</div>
+                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">{view.winning_teams:,}</div>
                 <div style="color: rgba(255,255,255,0.9); font-size: 0.85rem;">Declared Winning Teams</div>
             </div>
             """,
@@ -293,33 +126,22 @@ def render(df: pd.DataFrame) -> None:
     col1, col2 = st.columns(2)
 
     with col1:
-        year_counts = (
-            df["edition_year"]
-            .value_counts()
-            .sort_index()
-            .reset_index(name="Teams")
-            .rename(columns={"edition_year": "Edition Year"})
-        )
-
-        fig1 = create_gradient_bar_chart(
-            year_counts,
+        fig1 = gradient_bar_chart(
+            view.year_counts,
             x="Edition Year",
             y="Teams",
             title="📅 Team Submissions Across SIH Editions",
             orientation='v',
-            color_scheme='gradient_blue'
+            color_scheme='gradient_blue',
+            label_length=20,
+            height=350,
+            axis_padding=1.12,
         )
-        st.plotly_chart(fig1, width="stretch")
+        plotly_chart(fig1, width="stretch")
 
     with col2:
-        cat_counts = (
-            df["category"]
-            .value_counts()
-            .reset_index(name="Teams")
-        )
-    
         fig2 = px.pie(
-            cat_counts,
+            view.category_counts,
             names="category",
             values="Teams",
             hole=0.5,
@@ -348,45 +170,35 @@ def render(df: pd.DataFrame) -> None:
         )
 
     
-        st.plotly_chart(fig2, width="stretch")
+        plotly_chart(fig2, width="stretch")
 
 
     col3, col4 = st.columns(2)
 
     with col3:
-        theme_counts = (
-            df["theme"]
-            .value_counts()
-            .head(10)
-            .reset_index(name="Teams")
-            .rename(columns={"theme": "Theme"})
-        )
-
-        fig3 = create_gradient_bar_chart(
-            theme_counts,
+        fig3 = gradient_bar_chart(
+            view.theme_counts,
             x="Teams",
             y="Theme",
             title="🎨 Top 10 Themes by Submission Volume",
             orientation='h',
-            color_scheme='gradient_orange'
+            color_scheme='gradient_orange',
+            label_length=35,
+            height=350,
+            axis_padding=1.12,
         )
-        st.plotly_chart(fig3, width="stretch")
+        plotly_chart(fig3, width="stretch")
 
     with col4:
-        state_counts = (
-            df["institute_state"]
-            .value_counts()
-            .head(10)
-            .reset_index(name="Teams")
-            .rename(columns={"institute_state": "State"})
-        )
-
-        fig4 = create_gradient_bar_chart(
-            state_counts,
+        fig4 = gradient_bar_chart(
+            view.state_counts,
             x="Teams",
             y="State",
             title="🗺️ Top 10 States by Participation Volume",
             orientation='h',
-            color_scheme='gradient_green'
+            color_scheme='gradient_green',
+            label_length=35,
+            height=350,
+            axis_padding=1.12,
         )
-        st.plotly_chart(fig4, width="stretch")
\ No newline at end of file
+        plotly_chart(fig4, width="stretch")
\ No newline at end of file
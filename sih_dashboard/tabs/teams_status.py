@@ -5,68 +5,23 @@ import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
-
-# Modern color schemes
-COLOR_SCHEMES = {
-    'status': ['#667eea', '#f093fb', '#ffeaa7', '#ff6b6b', '#4ecdc4'],
-    'gradient_gold': ['#f7b733', '#fc4a1a'],
-    'gradient_teal': ['#11998e', '#38ef7d'],
-    'vibrant': ['#f857a6', '#ff5858', '#fdbb2d', '#22c1c3', '#667eea'],
-}
-
-DONUT_COLORS = [
-    "#2563EB",  # Blue
-    "#7C3AED",  # Purple
-    "#10B981",  # Emerald
-    "#F59E0B",  # Amber
-    "#EF4444",  # Red
-    "#0EA5E9",  # Sky
-    "#14B8A6",  # Teal
-]
-
-# Chart layout template
-CHART_LAYOUT = {
-    # Transparent backgrounds (blend with Streamlit dark UI)
-    'plot_bgcolor': 'rgba(0,0,0,0)',
-    'paper_bgcolor': 'rgba(0,0,0,0)',
-
-    # Global font (dark-theme readable)
-    'font': {
-        'family': 'Inter, system-ui, sans-serif',
-        'size': 12,
-        'color': '#E6F1FF'
-    },
-
-    # ⬇ Increased right margin to avoid number clipping
-    'margin': {
-        'l': 60,
-        'r': 140,   # FIX: was too small (40)
-        't': 60,
-        'b': 40},
-
-    # ⬇ Dark-theme hover tooltip (NO white box)
-    'hoverlabel': {
-        'bgcolor': 'rgba(15, 23, 42, 0.95)',  # dark navy
-        'bordercolor': '#4DA3FF',             # subtle accent
-        'font': {
-            'family': 'Inter, system-ui, sans-serif',
-            'size': 13,
-            'color': '#E6F1FF'
-        }
-    },
-}
-
-
-
-def truncate_text(text: str, max_length: int = 40) -> str:
-    """Truncate long text and add ellipsis."""
-    text_str = str(text)
-    if len(text_str) > max_length:
-        return text_str[:max_length] + "..."
-    return text_str
-
-
-def render(df: pd.DataFrame) -> None:
+from ..utils.charts import chart_layout
+from ..utils.dataset import Dataset
+from ..utils.downloads import export_download_button
+from ..utils.filters import cached_aggregate, distinct_counter
+from ..utils.formatting import (
+    CURRENCY_COLUMN_FORMAT,
+    format_currency,
+    format_percent,
+    truncate_columns,
+)
+from ..utils.instrumentation import plotly_chart
+from ..utils.paged_table import paged_dataframe
+from ..utils.query_engine import filter_query, load_query_engine
+from ..views.teams_status import team_table
+
+
+def render(df: pd.DataFrame, dataset: Dataset) -> None:
     """Render Teams & Outcome analysis tab (dataset-aligned)."""
 
     st.header("👥 Teams & Outcomes — Performance Analysis")
@@ -75,17 +30,10 @@ def render(df: pd.DataFrame) -> None:
         st.warning("No team records match the current filter criteria.")
         return
 
-    df = df.copy()
-
-    # ---- Canonical outcome definition ----
-    df["is_winner"] = df["status"].isin(['Winner', 'Joint Winner', 'Consolation Prize', 'Third Prize', 'Second Prize', 'Future Innovators Award', 'First Prize',
-       'Girls Achiever Award', 'Quantum Frontier Award'])
-
-    total_teams = df["team_id"].nunique()
-    winning_teams = df[df["is_winner"]]["team_id"].nunique()
-    win_rate = (winning_teams / total_teams) * 100 if total_teams else 0
-
-    total_prize = df.loc[df["is_winner"], "prize_money"].sum(skipna=True)
+    view = cached_aggregate(
+        "teams_status",
+        lambda: load_query_engine(dataset).teams(df, filter_query(), distinct_counter(dataset)),
+    )
 
     # ---- Enhanced Top-level metrics with gradient cards ----
     col1, col2, col3, col4 = st.columns(4)
@@ -97,7 +45,7 @@ def render(df: pd.DataFrame) -> None:
        padding: 20px; border-radius: 10px; text-align: center;
        box-shadow: 0 10px 30px rgba(5, 150, 105, 0.25);">
                 <div style="font-size: 2rem;">👥</div>
-                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">{total_teams:,}</div>
+                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">{view.total_teams:,}</div>
                 <div style="color: rgba(255,255,255,0.9); font-size: 0.85rem;">Total Participating Teams</div>
             </div>
             """,
@@ -111,7 +59,7 @@ def render(df: pd.DataFrame) -> None:
        padding: 20px; border-radius: 10px; text-align: center;
        box-shadow: 0 10px 30px rgba(124, 58, 237, 0.25);">
                 <div style="font-size: 2rem;">🏆</div>
-                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">{winning_teams:,}</div>
+                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">{view.winning_teams:,}</div>
                 <div style="color: rgba(255,255,255,0.9); font-size: 0.85rem;">Teams With Declared Awards</div>
             </div>
             """,
@@ -125,7 +73,7 @@ def render(df: pd.DataFrame) -> None:
        padding: 20px; border-radius: 10px; text-align: center;
        box-shadow: 0 10px 30px rgba(37, 99, 235, 0.25);">
                 <div style="font-size: 2rem;">📊</div>
-                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">{win_rate:.2f}%</div>
+                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">{format_percent(view.win_rate, 2)}</div>
                 <div style="color: rgba(255,255,255,0.9); font-size: 0.85rem;">Award Conversion Rate</div>
             </div>
             """,
@@ -139,7 +87,7 @@ def render(df: pd.DataFrame) -> None:
        padding: 20px; border-radius: 10px; text-align: center;
        box-shadow: 0 10px 30px rgba(217, 119, 6, 0.25);">
                 <div style="font-size: 2rem;">🏦</div>
-                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">₹{total_prize:,.0f}</div>
+                <div style="color: white; font-size: 1.8rem; font-weight: bold; margin: 5px 0;">{format_currency(view.total_prize)}</div>
                 <div style="color: rgba(255,255,255,0.9); font-size: 0.85rem;">Total Prize Amount Distributed</div>
             </div>
             """,
@@ -154,66 +102,7 @@ def render(df: pd.DataFrame) -> None:
 
     with col1:
         # ---- Status Distribution (Absolute Count Bar Chart) ----
-        status_counts = (
-            df["status"]
-            .value_counts()
-            .reset_index(name="Teams")
-            .rename(columns={"status": "Status"})
-        )
-
-        # Prize amount per status (if applicable). Most statuses should map to a single prize value;
-        # if multiple values exist, we pick the maximum (still useful and deterministic).
-        prize_money_numeric = pd.to_numeric(df["prize_money"], errors="coerce")
-        status_prize = (
-            prize_money_numeric.groupby(df["status"], dropna=False)
-            .max()
-            .reset_index()
-            .rename(columns={"status": "Status", "prize_money": "Prize"})
-        )
-
-        status_counts = status_counts.merge(status_prize, on="Status", how="left")
-        status_counts["PrizeLabel"] = status_counts["Prize"].apply(
-            lambda v: f"₹{v:,.0f}" if pd.notna(v) else "None"
-        )
-
-        # Define the exact order based on your actual status values
-        STATUS_ORDER = [
-            "Winner",
-            "Joint Winner",
-            "First Prize",
-            "Second Prize",
-            "Third Prize",
-            "Consolation Prize",
-            "Future Innovators Award",
-            "Girls Achiever Award",  # Note: "Achiever" not "Achievers"
-            "Quantum Frontier Award",
-            "Shortlisted",
-            "Waitlist",
-        ]
-
-        # Normalize labels to handle inconsistencies
-        status_counts["Status"] = (
-            status_counts["Status"].fillna("Unknown").astype(str).str.strip()
-        )
-
-        # Keep your preferred order, but include any extra statuses present in data
-        observed = (
-            status_counts.sort_values("Teams", ascending=False)["Status"].tolist()
-        )
-        observed_unique: list[str] = []
-        for s in observed:
-            if s not in observed_unique:
-                observed_unique.append(s)
-
-        categories = [s for s in STATUS_ORDER if s in observed_unique] + [
-            s for s in observed_unique if s not in STATUS_ORDER
-        ]
-        status_counts["Status"] = pd.Categorical(
-            status_counts["Status"],
-            categories=categories,
-            ordered=True,
-        )
-        status_counts = status_counts.sort_values("Teams", ascending=False)
+        status_counts = view.status_counts
 
         # Color mapping for each status
         STATUS_COLORS = {
@@ -259,7 +148,7 @@ def render(df: pd.DataFrame) -> None:
                 font=dict(size=16, weight='bold'),
                 x=0,
             ),
-            **CHART_LAYOUT,
+            **chart_layout(margin_right=140),
             xaxis=dict(
                 title="Teams Count",
                 showgrid=True,
@@ -278,21 +167,13 @@ def render(df: pd.DataFrame) -> None:
             showlegend=False,
         )
 
-        st.plotly_chart(fig, width="stretch")
+        plotly_chart(fig, width="stretch")
 
     with col2:
         # ---- Prize Money Distribution (Discrete Horizontal Bar Chart) ----
-        prize_df = df[df["is_winner"] & df["prize_money"].notna()]
-
-        if not prize_df.empty:
-            prize_counts = (
-                prize_df["prize_money"]
-                .astype(int)
-                .value_counts()
-                .sort_index(ascending=False)  # Highest prize first
-                .reset_index(name="Teams")
-                .rename(columns={"prize_money": "Prize Amount"})
-            )
+        prize_counts = view.prize_counts
+
+        if not prize_counts.empty:
 
             # Create gradient colors based on prize amount (higher = more golden)
             max_prize = prize_counts["Prize Amount"].max()
@@ -309,7 +190,7 @@ def render(df: pd.DataFrame) -> None:
 
             fig2 = go.Figure(
                 go.Bar(
-                    y=[f"₹{v:,.0f}" for v in prize_counts["Prize Amount"]],
+                    y=[format_currency(v) for v in prize_counts["Prize Amount"]],
                     x=prize_counts["Teams"],
                     orientation="h",
                     marker=dict(
@@ -334,7 +215,7 @@ def render(df: pd.DataFrame) -> None:
                     font=dict(size=16, weight="bold"),
                     x=0,
                 ),
-                **CHART_LAYOUT,
+                **chart_layout(margin_right=140),
                 xaxis=dict(
                     title="Number of Awarded Teams",
                     showgrid=True,
@@ -353,7 +234,7 @@ def render(df: pd.DataFrame) -> None:
                 showlegend=False,
             )
 
-            st.plotly_chart(fig2, width="stretch")
+            plotly_chart(fig2, width="stretch")
 
         else:
             st.info("No prize money data available for winning teams.")
@@ -371,46 +252,29 @@ def render(df: pd.DataFrame) -> None:
         help="Search is case-insensitive and applies to visible records"
     )
 
-    teams_df = df[
-        [
-            "team_id",
-            "team_name",
-            "team_leader_name",
-            "status",
-            "ps_id",
-            "problem_statement_title",
-            "category",
-            "theme",
-            "prize_money",
-            "institute_name",
-            "institute_state",
-        ]
-    ].copy()
-
-    # Apply search filter
-    if search:
-        teams_df = teams_df[
-            teams_df["team_name"].str.contains(search, case=False, na=False)
-            | teams_df["team_leader_name"].str.contains(search, case=False, na=False)
-        ]
-
-    # Sort by prize money
-    teams_df = teams_df.sort_values(
-        by=["prize_money"],
-        ascending=False,
-        na_position="last",
-    )
-
-    # Truncate long text columns for better display
-    display_df = teams_df.copy()
-    display_df["team_name"] = display_df["team_name"].apply(lambda x: truncate_text(x, 30))
-    display_df["team_leader_name"] = display_df["team_leader_name"].apply(lambda x: truncate_text(x, 25))
-    display_df["problem_statement_title"] = display_df["problem_statement_title"].apply(lambda x: truncate_text(x, 50))
-    display_df["institute_name"] = display_df["institute_name"].apply(lambda x: truncate_text(x, 40))
+    teams_df = team_table(df, search, dataset.search_index)
+
+    def format_page(page: pd.DataFrame) -> pd.DataFrame:
+        # Truncate long text columns for better display (visible rows only)
+        return truncate_columns(
+            page,
+            {
+                "team_name": 30,
+                "team_leader_name": 25,
+                "problem_statement_title": 50,
+                "institute_name": 40,
+            },
+        )
 
-    # Enhanced dataframe display with better column configuration
-    st.dataframe(
-        display_df,
+    # Paged table, highest prize first, with better column configuration
+    order = paged_dataframe(
+        teams_df,
+        key="teams_status",
+        params=(search,),
+        sort_column="prize_money",
+        ascending=False,
+        sort_index=dataset.sort_index,
+        format_page=format_page,
         width="stretch",
         height=500,
         column_config={
@@ -452,7 +316,7 @@ def render(df: pd.DataFrame) -> None:
             ),
             "prize_money": st.column_config.NumberColumn(
                 "Prize Amount (INR)",
-                format="₹%,.0f",
+                format=CURRENCY_COLUMN_FORMAT,
                 width="medium"
             ),
             "institute_name": st.column_config.TextColumn(
@@ -474,14 +338,15 @@ def render(df: pd.DataFrame) -> None:
     with col_info:
         st.info(
             f"📊 Displaying **{len(teams_df):,}** teams based on current filters "
-            f"out of **{total_teams:,}** total participating teams"
+            f"out of **{view.total_teams:,}** total participating teams"
         )    
     with col_download:
-        csv = teams_df.to_csv(index=False).encode('utf-8')
-        st.download_button(
-            label="Download Team-Level Dataset (CSV)",
-            data=csv,
-            file_name="teams_data.csv",
-            mime="text/csv",
+        export_download_button(
+            "Download Team-Level Dataset",
+            teams_df,
+            export="teams_status",
+            params=(search,),
+            order=order,
+            file_stem="teams_data",
             width="stretch"
         )
\ No newline at end of file
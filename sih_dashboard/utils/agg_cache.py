@@ -0,0 +1,131 @@
+"""Process-wide cache for filter-dependent aggregates.
+
+Streamlit runs every session in the same process, so a module-level cache is
+shared by all of them: users looking at the same filter selection reuse the
+same value counts / summary tables instead of recomputing them.
+
+No Streamlit calls here; keys are built by the caller (see
+`filters.cached_aggregate`).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from .config import AGGREGATE_CACHE_MAX_BYTES, AGGREGATE_CACHE_MAX_ENTRIES
+
+
+T = TypeVar("T")
+
+
+def _approx_nbytes(value: Any) -> int:
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return value.nbytes + sum(sys.getsizeof(v) for v in value.ravel())
+        return value.nbytes
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        # View models: count the frames and arrays they hold.
+        return sys.getsizeof(value) + sum(
+            _approx_nbytes(getattr(value, f.name)) for f in dataclasses.fields(value)
+        )
+    if callable(getattr(value, "to_plotly_json", None)):
+        # Plotly figures: count the arrays and labels of the traces and layout.
+        return sys.getsizeof(value) + _approx_nbytes(value.to_plotly_json())
+    if isinstance(value, (tuple, list)):
+        return sum(_approx_nbytes(v) for v in value)
+    if isinstance(value, dict):
+        return sum(_approx_nbytes(v) for v in value.values())
+    return sys.getsizeof(value)
+
+
+class AggregateCache:
+    """Thread-safe LRU bounded by entry count and approximate size."""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return the cached value for `key`, computing it on a miss.
+
+        Cached values are shared between sessions and must not be mutated.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Compute outside the lock; concurrent misses may duplicate work once.
+        value = compute()
+        nbytes = _approx_nbytes(value)
+        if nbytes > self.max_bytes:
+            return value
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._nbytes -= previous[1]
+            self._entries[key] = (value, nbytes)
+            self._nbytes += nbytes
+            while len(self._entries) > self.max_entries or self._nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._nbytes -= evicted
+        return value
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._nbytes,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+
+def filter_signature(selections: dict[str, Any], dataset_version: str) -> str:
+    """Canonical hash of the applied filter selections for one dataset version.
+
+    List selections are order-insensitive and text searches are
+    case-insensitive, so equivalent filter states share a signature.
+    """
+    canonical: dict[str, Any] = {}
+    for key in sorted(selections):
+        value = selections[key]
+        if not value:
+            continue
+        if isinstance(value, str):
+            canonical[key] = value.lower()
+        else:
+            canonical[key] = sorted(str(v) for v in value)
+
+    payload = json.dumps([dataset_version, canonical], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+# Shared by every Streamlit session in this process.
+AGGREGATE_CACHE = AggregateCache(AGGREGATE_CACHE_MAX_ENTRIES, AGGREGATE_CACHE_MAX_BYTES)
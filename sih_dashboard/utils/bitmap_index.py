@@ -0,0 +1,202 @@
+"""Packed-bitmap index over the sidebar filter columns.
+
+Built once per dataset (no Streamlit calls here) from one stable sort of
+each column's value codes. Every filter selection becomes a packed row
+bitmap, filters combine with AND, and cascading widget options are read
+from the index instead of re-scanning the frame. Low-cardinality columns
+keep a dense bitmap per value (options from popcounts); high-cardinality
+ones keep sorted row ids per value, so memory stays linear in the rows.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+# Bytes -> number of set bits (fallback for NumPy < 2.0 without bitwise_count).
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(packed: np.ndarray, axis: int = -1) -> np.ndarray:
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(packed).sum(axis=axis, dtype=np.int64)
+    return _POPCOUNT_TABLE[packed].sum(axis=axis, dtype=np.int64)
+
+
+# Columns with at most this many distinct values keep one packed bitmap per
+# value (k * n/8 bytes, no more than the 4n bytes of row ids); the others
+# keep their row ids grouped by value.
+DENSE_MAX_VALUES = 32
+
+
+def _bits(rows: np.ndarray) -> np.ndarray:
+    """Bit of each row within its byte of a packed mask."""
+    return (0x80 >> (rows & 7)).astype(np.uint8)
+
+
+@dataclass(frozen=True)
+class ColumnBitmaps:
+    """Sorted distinct values of one column and the rows holding each value.
+
+    Low-cardinality columns keep one packed bitmap per value (`bitmaps`);
+    the others keep row ids grouped by value, ascending within a value
+    (`rows[offsets[i]:offsets[i + 1]]` hold `values[i]`).
+    """
+
+    values: list
+    positions: dict  # value -> position in `values`
+    bitmaps: np.ndarray | None = None  # shape (len(values), n_bytes), dtype uint8
+    rows: np.ndarray | None = None  # int32 row ids
+    offsets: np.ndarray | None = None  # int64, len(values) + 1
+
+    @classmethod
+    def from_rows(cls, values: list, grouped: np.ndarray, counts: np.ndarray, n_rows: int) -> "ColumnBitmaps":
+        """Entry for `values` from row ids grouped by value (`counts` rows each)."""
+        positions = {v: i for i, v in enumerate(values)}
+        if len(values) > DENSE_MAX_VALUES:
+            offsets = np.zeros(len(values) + 1, dtype=np.int64)
+            np.cumsum(counts, out=offsets[1:])
+            return cls(values, positions, rows=grouped.astype(np.int32), offsets=offsets)
+        bitmaps = np.zeros((len(values), (n_rows + 7) // 8), dtype=np.uint8)
+        value_rows = np.repeat(np.arange(len(values)), counts)
+        np.bitwise_or.at(bitmaps, (value_rows, grouped >> 3), _bits(grouped))
+        return cls(values, positions, bitmaps=bitmaps)
+
+    def grouped_rows(self, n_rows: int) -> tuple[np.ndarray, np.ndarray]:
+        """Row ids grouped by value and the number of rows per value."""
+        if self.bitmaps is None:
+            return self.rows, np.diff(self.offsets)
+        members = [np.flatnonzero(np.unpackbits(b, count=n_rows)) for b in self.bitmaps]
+        return (
+            np.concatenate(members) if members else np.empty(0, dtype=np.int64),
+            np.array([len(m) for m in members], dtype=np.int64),
+        )
+
+
+class BitmapIndex:
+    """Per-column, per-value row sets for a fixed frame.
+
+    Masks are packed uint8 arrays (`np.packbits` layout). `None` stands for
+    "no filter applied" so the unfiltered path never touches the index.
+    """
+
+    def __init__(self, n_rows: int, columns: dict[str, ColumnBitmaps]):
+        self.n_rows = n_rows
+        self.columns = columns
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, columns: list[str]) -> "BitmapIndex":
+        index: dict[str, ColumnBitmaps] = {}
+        for col in columns:
+            if col not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[col], sort=True)
+            # Narrow codes sort by radix; one stable sort groups the rows by
+            # value, ascending within each value.
+            codes = codes.astype(np.int16 if len(uniques) < 2**15 else np.int32)
+            valid = np.flatnonzero(codes >= 0)
+            grouped = valid[np.argsort(codes[valid], kind="stable")]
+            counts = np.bincount(codes[valid], minlength=len(uniques))
+            index[col] = ColumnBitmaps.from_rows(pd.Index(uniques).tolist(), grouped, counts, len(df))
+        return cls(len(df), index)
+
+    def updated(self, changes: dict[str, tuple[np.ndarray, list, list]]) -> "BitmapIndex":
+        """A copy with rows moved between values: `{column: (rows, old values, new values)}`.
+
+        Bitmap columns flip only the bits of those rows, in copies of their
+        bitmaps; row-id columns merge the moved rows into their new groups.
+        Other columns are shared. Values gaining their first row are added
+        and values losing their last row dropped, so the result equals a
+        fresh `build` over the updated frame.
+        """
+        index = dict(self.columns)
+        for column, (rows, old, new) in changes.items():
+            col = self.columns.get(column)
+            if col is None:
+                continue
+            values = sorted(set(col.values).union(new))
+            positions = {v: i for i, v in enumerate(values)}
+            rows = np.asarray(rows, dtype=np.int64)
+            added = np.array([positions[v] for v in new], dtype=np.int64)
+
+            if col.bitmaps is not None:
+                bitmaps = np.zeros((len(values), col.bitmaps.shape[1]), dtype=np.uint8)
+                bitmaps[[positions[v] for v in col.values]] = col.bitmaps
+                byte, bit = rows >> 3, _bits(rows)
+                cleared = np.array([positions[v] for v in old], dtype=np.int64)
+                np.bitwise_and.at(bitmaps, (cleared, byte), ~bit)
+                np.bitwise_or.at(bitmaps, (added, byte), bit)
+                emptied = {i for i in np.unique(cleared) if not bitmaps[i].any()}
+                present = [i for i in range(len(values)) if i not in emptied]
+                values = [values[i] for i in present]
+                updated = ColumnBitmaps(values, {v: i for i, v in enumerate(values)}, bitmaps=bitmaps[present])
+                if len(values) > DENSE_MAX_VALUES:
+                    updated = ColumnBitmaps.from_rows(values, *updated.grouped_rows(self.n_rows), self.n_rows)
+                index[column] = updated
+                continue
+
+            # (value, row) keys of the kept entries are sorted; merge the moved rows in.
+            grouped, counts = col.grouped_rows(self.n_rows)
+            remap = np.array([positions[v] for v in col.values], dtype=np.int64)
+            moved = np.zeros(self.n_rows, dtype=bool)
+            moved[rows] = True
+            keys = np.repeat(remap, counts) * self.n_rows + grouped
+            keys = keys[~moved[grouped]]
+            inserted = np.sort(added * self.n_rows + rows)
+            keys = np.insert(keys, np.searchsorted(keys, inserted), inserted)
+            value_of, grouped = np.divmod(keys, self.n_rows)
+            counts = np.bincount(value_of, minlength=len(values))
+            present = np.flatnonzero(counts)
+            index[column] = ColumnBitmaps.from_rows(
+                [values[i] for i in present], grouped, counts[present], self.n_rows
+            )
+        return BitmapIndex(self.n_rows, index)
+
+    def values(self, column: str, mask: np.ndarray | None = None) -> list:
+        """Sorted values of `column` that occur in at least one row of `mask`."""
+        col = self.columns[column]
+        if mask is None or not col.values:
+            return list(col.values)
+        if col.bitmaps is not None:
+            hits = _popcount(np.bitwise_and(col.bitmaps, mask))
+        else:
+            # Whether any row of each value's group is selected.
+            hits = np.maximum.reduceat(np.unpackbits(mask, count=self.n_rows)[col.rows], col.offsets[:-1])
+        return [v for v, n in zip(col.values, hits) if n]
+
+    def select(self, column: str, selected: list) -> np.ndarray:
+        """Bitmap of rows whose `column` value is any of `selected`."""
+        col = self.columns[column]
+        positions = [col.positions[v] for v in selected if v in col.positions]
+        if not positions:
+            return np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+        if col.bitmaps is not None:
+            return np.bitwise_or.reduce(col.bitmaps[positions], axis=0)
+        rows = np.zeros(self.n_rows, dtype=bool)
+        for i in positions:
+            rows[col.rows[col.offsets[i] : col.offsets[i + 1]]] = True
+        return np.packbits(rows)
+
+    @staticmethod
+    def intersect(mask: np.ndarray | None, other: np.ndarray) -> np.ndarray:
+        return other if mask is None else np.bitwise_and(mask, other)
+
+    def filter(self, selections: dict[str, list]) -> np.ndarray | None:
+        """Mask of rows matching every non-empty `{column: values}` selection."""
+        mask: np.ndarray | None = None
+        for column, selected in selections.items():
+            if selected:
+                mask = self.intersect(mask, self.select(column, selected))
+        return mask
+
+    def count(self, mask: np.ndarray | None) -> int:
+        return self.n_rows if mask is None else int(_popcount(mask))
+
+    def rows(self, mask: np.ndarray | None) -> np.ndarray:
+        """Row positions selected by `mask` (ascending)."""
+        if mask is None:
+            return np.arange(self.n_rows)
+        return np.flatnonzero(np.unpackbits(mask, count=self.n_rows))
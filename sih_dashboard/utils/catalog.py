@@ -0,0 +1,181 @@
+"""Dataset catalog: one source per SIH edition under the data directory (no Streamlit calls here).
+
+Editions are discovered from the file layout alone, without reading data:
+- hive-style Parquet partitions, `<root>/[<name>/]edition_year=YYYY/*.parquet`
+  (the year lives in the directory name, as `write_partitions` lays it out);
+- CSV files named with their year, e.g. `sih_2025_problem_statements_team_outcomes.csv`.
+
+Result deltas (see `delta.py`) are CSVs under `<root>/deltas/`, also named
+with their year; each edition lists those of its year in name order.
+
+A partition takes precedence over a CSV of the same year, and the first
+CSV of a year (in name order) over later ones. Files passed over this way,
+and CSVs without a year in their name, are reported in `Catalog.warnings`
+instead of being loaded. A selection of
+years maps to the sources of those editions only (`Catalog.source`), so
+the app loads and caches each edition once and never reads unselected
+years. Each edition carries a stamp (sizes and mtimes of its files), so a
+rewritten file is a new source and never served from a stale cache.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Iterable
+
+import pandas as pd
+
+
+PARTITION_COLUMN = "edition_year"
+
+DELTA_DIRECTORY = "deltas"
+
+# (path, stamp) of each delta file applied to an edition, in order.
+Deltas = tuple[tuple[str, str], ...]
+
+# (path, stamp, deltas) of the editions making up one loaded dataset, in year order.
+DataSource = tuple[tuple[str, str, Deltas], ...]
+
+_PARTITION_PATTERN = re.compile(rf"^{PARTITION_COLUMN}=(\d{{4}})$")
+_FILE_YEAR_PATTERN = re.compile(r"(?<!\d)((?:19|20)\d{2})(?!\d)")
+
+
+@dataclass(frozen=True)
+class Edition:
+    year: int
+    path: str  # partition directory or CSV file
+    stamp: str  # changes whenever one of its files is rewritten
+    deltas: Deltas = ()
+
+    @property
+    def key(self) -> tuple[str, str, Deltas]:
+        return (self.path, self.stamp, self.deltas)
+
+
+@dataclass(frozen=True)
+class Catalog:
+    """The editions found under a data directory, one per year."""
+
+    editions: tuple[Edition, ...]  # sorted by year
+    warnings: tuple[str, ...] = ()  # data files that were not catalogued, and why
+
+    @property
+    def years(self) -> list[int]:
+        return [edition.year for edition in self.editions]
+
+    def source(self, years: Iterable[int] = ()) -> DataSource:
+        """Keys of the editions in `years` (every edition when empty).
+
+        Raises FileNotFoundError when no edition matches.
+        """
+        wanted = set(years)
+        keys = tuple(e.key for e in self.editions if not wanted or e.year in wanted)
+        if not keys:
+            raise FileNotFoundError(f"No SIH edition found for years {sorted(wanted) or 'any'}.")
+        return keys
+
+
+def partition_year(path: str | Path) -> int | None:
+    """Edition year of an `edition_year=YYYY` partition directory (None otherwise)."""
+    match = _PARTITION_PATTERN.match(Path(path).name)
+    return int(match.group(1)) if match else None
+
+
+def file_year(path: str | Path) -> int | None:
+    """Year in a CSV file name, e.g. 2025 for `sih_2025_grand_finale_result_clean.csv`."""
+    match = _FILE_YEAR_PATTERN.search(Path(path).stem)
+    return int(match.group(1)) if match else None
+
+
+def partition_files(path: str | Path) -> list[Path]:
+    """Parquet files of a partition directory, in name order."""
+    return sorted(p for p in Path(path).glob("*.parquet") if not p.name.startswith((".", "_")))
+
+
+def _stamp(files: list[Path]) -> str:
+    stats = ((path.name, path.stat()) for path in files)
+    return ";".join(f"{name}:{stat.st_size}:{stat.st_mtime_ns}" for name, stat in stats)
+
+
+def discover_editions(root: str | Path) -> Catalog:
+    """Catalog of the editions stored under `root` (see module docstring).
+
+    Cheap enough to poll: it lists directories and stats files, skipping
+    hidden ones (such as the prepared-copy cache) and partition contents.
+    """
+    root = Path(root)
+    found: dict[int, Edition] = {}
+    warnings: list[str] = []
+
+    def name(path: str | Path) -> str:
+        return Path(path).relative_to(root).as_posix()
+
+    for path in sorted(root.glob("*.csv")):
+        year = file_year(path)
+        if year is None:
+            warnings.append(f"Skipped {name(path)}: no edition year (e.g. 2025) in the file name.")
+        elif year in found:
+            warnings.append(
+                f"Skipped {name(path)}: {name(found[year].path)} already holds the {year} edition."
+            )
+        else:
+            found[year] = Edition(year, str(path), _stamp([path]))
+    for directory, subdirs, _ in os.walk(root):
+        subdirs[:] = sorted(d for d in subdirs if not d.startswith((".", "_")))
+        year = partition_year(directory)
+        if year is None:
+            continue
+        subdirs.clear()
+        files = partition_files(directory)
+        if not files:
+            continue
+        if year in found:
+            warnings.append(
+                f"Skipped {name(found[year].path)}: the partition {name(directory)} "
+                f"holds the {year} edition."
+            )
+        found[year] = Edition(year, directory, _stamp(files))
+    deltas: dict[int, list[tuple[str, str]]] = {}
+    for path in sorted((root / DELTA_DIRECTORY).glob("*.csv")):
+        year = file_year(path)
+        if year in found:
+            deltas.setdefault(year, []).append((str(path), _stamp([path])))
+        elif year is None:
+            warnings.append(f"Skipped delta {name(path)}: no edition year in the file name.")
+        else:
+            warnings.append(f"Skipped delta {name(path)}: there is no {year} edition to apply it to.")
+    for year, keys in deltas.items():
+        found[year] = replace(found[year], deltas=tuple(keys))
+    return Catalog(tuple(found[year] for year in sorted(found)), tuple(warnings))
+
+
+def read_partition(path: str | Path) -> pd.DataFrame:
+    """Raw frame of one partition, with its `edition_year` column restored."""
+    # The year comes from the directory name, not pyarrow's partition discovery.
+    df = pd.read_parquet(partition_files(path), partitioning=None)
+    if PARTITION_COLUMN not in df.columns:
+        df.insert(0, PARTITION_COLUMN, partition_year(path))
+    return df
+
+
+def write_partitions(df: pd.DataFrame, root: str | Path) -> Path:
+    """Write a raw SIH frame as one `edition_year=YYYY` partition per edition.
+
+    Existing partitions of the years in `df` are replaced; other years are
+    left alone, so editions can be added one at a time.
+    """
+    root = Path(root)
+    for year, part in df.groupby(PARTITION_COLUMN, sort=True):
+        directory = root / f"{PARTITION_COLUMN}={int(year)}"
+        directory.mkdir(parents=True, exist_ok=True)
+        target = directory / "part-0.parquet"
+        tmp_path = target.with_suffix(f".{os.getpid()}.tmp")
+        part.drop(columns=PARTITION_COLUMN).to_parquet(tmp_path, index=False, compression="zstd")
+        os.replace(tmp_path, target)
+        for stale in partition_files(directory):
+            if stale != target:
+                stale.unlink()
+    return root
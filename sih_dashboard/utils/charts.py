@@ -0,0 +1,209 @@
+"""Plotly chart factory shared by the tabs (no Streamlit calls here).
+
+Figures are built from the NumPy arrays of small aggregate frames, never by
+iterating rows, and memoized in the process-wide aggregate cache under
+(chart kind, hash of the plotted columns, layout parameters). Identical
+charts in later reruns or other sessions reuse the same `go.Figure`, so
+cached figures are shared and must not be mutated: pass every layout
+difference (height, margins) as a parameter instead of calling
+`update_layout` on the result.
+
+Only construction is saved: `st.plotly_chart` accepts figures (or dicts it
+turns back into validated figures), not JSON, so each rendered chart is
+still serialised once per rerun (timed by `instrumentation.plotly_chart`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Callable, Hashable, Sequence
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from .agg_cache import AGGREGATE_CACHE
+from .formatting import truncate_labels
+
+
+COLOR_SCHEMES = {
+    'gradient_blue': ['#667eea', '#764ba2'],
+    'gradient_purple': ['#667eea', '#764ba2', '#f093fb'],
+    'gradient_orange': ['#ff9a56', '#ff6a88', '#feca57'],
+    'gradient_green': ['#56ab2f', '#a8e063'],
+    'gradient_teal': ['#11998e', '#38ef7d'],
+    'gradient_pink': ['#f857a6', '#ff5858'],
+    'gold_teal': ['#fdbb2d', '#22c1c3'],
+    'vibrant': ['#f857a6', '#ff5858', '#fdbb2d', '#22c1c3', '#667eea', '#f093fb'],
+}
+
+DONUT_COLORS = [
+    "#2563EB",  # Blue
+    "#7C3AED",  # Purple
+    "#10B981",  # Emerald
+    "#F59E0B",  # Amber
+    "#EF4444",  # Red
+    "#0EA5E9",  # Sky
+    "#14B8A6",  # Teal
+]
+
+FONT_FAMILY = 'Inter, system-ui, sans-serif'
+
+# Dark-theme layout template (transparent backgrounds blend with the Streamlit UI).
+CHART_LAYOUT = {
+    'plot_bgcolor': 'rgba(0,0,0,0)',
+    'paper_bgcolor': 'rgba(0,0,0,0)',
+    'font': {'family': FONT_FAMILY, 'size': 12, 'color': '#E6F1FF'},
+    # Wide right margin so outside bar labels are not clipped.
+    'margin': {'l': 60, 'r': 120, 't': 60, 'b': 40},
+    'hoverlabel': {
+        'bgcolor': 'rgba(15, 23, 42, 0.95)',
+        'bordercolor': '#4DA3FF',
+        'font': {'family': FONT_FAMILY, 'size': 13, 'color': '#E6F1FF'},
+    },
+}
+
+
+def chart_layout(margin_right: int | None = None) -> dict:
+    """`CHART_LAYOUT` with its own margin dict, optionally a different right margin."""
+    layout = dict(CHART_LAYOUT, margin=dict(CHART_LAYOUT['margin']))
+    if margin_right is not None:
+        layout['margin']['r'] = margin_right
+    return layout
+
+
+def data_hash(data: pd.DataFrame, columns: Sequence[str]) -> str:
+    """Content hash of `columns` of `data` (values, order and column names)."""
+    digest = hashlib.sha1(repr(list(columns)).encode("utf-8"))
+    if len(data):
+        hashed = pd.util.hash_pandas_object(data[list(columns)], index=False)
+        digest.update(hashed.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def memoized_figure(
+    kind: str,
+    data: pd.DataFrame,
+    columns: Sequence[str],
+    params: tuple[Hashable, ...],
+    build: Callable[[], go.Figure],
+) -> go.Figure:
+    """Figure for (`kind`, plotted data, `params`), built only on a cache miss.
+
+    `params` must hold everything besides `columns` of `data` that `build`
+    reads (titles, colors, sizes).
+    """
+    key = ("figure", kind, data_hash(data, columns), params)
+    return AGGREGATE_CACHE.get_or_compute(key, build)
+
+
+def _cycle(colors: Sequence[str], n: int) -> list[str]:
+    return [colors[i] for i in np.arange(n) % len(colors)]
+
+
+def gradient_bar_chart(
+    data: pd.DataFrame,
+    x: str,
+    y: str,
+    title: str,
+    *,
+    orientation: str = 'h',
+    color_scheme: str = 'gradient_blue',
+    label_length: int = 40,
+    height: int = 500,
+    axis_padding: float = 1.15,
+    margin_right: int | None = None,
+    hover_data: Sequence[str] = (),
+) -> go.Figure:
+    """Bar chart with outside value labels that never clip.
+
+    `orientation='h'` plots `data[x]` against the category labels in
+    `data[y]`; `'v'` plots `data[y]` against the labels in `data[x]`. Labels
+    are truncated to `label_length` on the axis; the hover shows the full
+    label plus the `hover_data` columns.
+    """
+    hover_data = tuple(hover_data)
+    params = (
+        x, y, title, orientation, color_scheme, label_length,
+        height, axis_padding, margin_right, hover_data,
+    )
+    return memoized_figure(
+        "gradient_bar",
+        data,
+        [x, y, *hover_data],
+        params,
+        lambda: _build_gradient_bar_chart(data, *params),
+    )
+
+
+def _build_gradient_bar_chart(
+    data: pd.DataFrame,
+    x: str,
+    y: str,
+    title: str,
+    orientation: str,
+    color_scheme: str,
+    label_length: int,
+    height: int,
+    axis_padding: float,
+    margin_right: int | None,
+    hover_data: tuple[str, ...],
+) -> go.Figure:
+    horizontal = orientation == 'h'
+    label_col, value_col = (y, x) if horizontal else (x, y)
+    labels = data[label_col].to_numpy()
+    values = data[value_col].to_numpy()
+    value_ref = '%{x:,}' if horizontal else '%{y:,}'
+
+    if hover_data:
+        customdata = np.column_stack(
+            [labels.astype(object)] + [data[col].to_numpy(dtype=object) for col in hover_data]
+        )
+        hover_text = f"<b>%{{customdata[0]}}</b><br><br>Teams:&nbsp;&nbsp;{value_ref}" + "".join(
+            f"<br>{col}: %{{customdata[{i}]}}" for i, col in enumerate(hover_data, start=1)
+        )
+    else:
+        customdata = labels
+        hover_text = f"<b>%{{customdata}}</b><br><br>Teams:&nbsp;&nbsp;{value_ref}"
+
+    display_labels = truncate_labels(labels, label_length)
+    colors = COLOR_SCHEMES.get(color_scheme, COLOR_SCHEMES['gradient_blue'])
+
+    fig = go.Figure(
+        go.Bar(
+            x=values if horizontal else display_labels,
+            y=display_labels if horizontal else values,
+            orientation=orientation,
+            marker=dict(
+                color=_cycle(colors, len(values)),
+                line=dict(color='rgba(255,255,255,0.2)', width=1),
+            ),
+            text=values,
+            textposition='outside',
+            textfont=dict(size=11, color='#E6F1FF'),
+            cliponaxis=False,
+            hovertemplate=hover_text + "<extra></extra>",
+            customdata=customdata,
+        )
+    )
+    fig.update_layout(
+        **chart_layout(margin_right),
+        title=dict(text=title, font=dict(size=16, weight='bold'), x=0),
+        showlegend=False,
+        height=height,
+    )
+
+    # Axis padding so the outside labels never touch the edge.
+    value_axis = dict(
+        range=[0, values.max() * axis_padding if len(values) else 1],
+        showgrid=True,
+        gridcolor='rgba(128,128,128,0.1)',
+        title=None,
+    )
+    if horizontal:
+        fig.update_xaxes(**value_axis)
+        fig.update_yaxes(showgrid=False, title=None, categoryorder='total ascending')
+    else:
+        fig.update_yaxes(**value_axis)
+        fig.update_xaxes(showgrid=False, title=None)
+    return fig
@@ -3,7 +3,60 @@
 Keep this file side-effect free (no Streamlit calls).
 """
 
-DATA_PATH = "data/sih_2025_problem_statements_team_outcomes.csv"
+import os
+
+# Dataset catalog root: one edition per `edition_year=YYYY` Parquet partition
+# directory (hive layout) or per CSV named with its year, such as
+# `sih_2025_problem_statements_team_outcomes.csv` (see utils/catalog.py).
+DATA_DIR = "data"
+
+# Hot reload: the catalog is re-checked on filesystem events (with watchdog)
+# and every SIH_RELOAD_INTERVAL_S seconds; changed editions are rebuilt in a
+# background thread and swapped in once their files have been unchanged for
+# RELOAD_SETTLE_S seconds and the rebuild is done. 0 turns reloading off.
+RELOAD_INTERVAL_S = float(os.environ.get("SIH_RELOAD_INTERVAL_S", "5"))
+RELOAD_SETTLE_S = 1.0
+
+# Loaded edition selections kept per process; each selection spanning several
+# editions is one combined dataset (single editions are cached separately).
+DATASET_CACHE_MAX_ENTRIES = 4
+
+# Directory (relative to the dataset file) holding prepared Arrow copies.
+PREPARED_CACHE_DIR = ".cache"
+
+# Streaming CSV ingestion: sources larger than INGEST_STREAMING_MIN_BYTES are
+# read in chunks sized so one raw chunk and its cleaning copies stay within
+# INGEST_MEMORY_LIMIT_BYTES.
+INGEST_MEMORY_LIMIT_BYTES = int(os.environ.get("SIH_INGEST_MEMORY_MB", "256")) * 1024 * 1024
+INGEST_STREAMING_MIN_BYTES = int(os.environ.get("SIH_INGEST_STREAMING_MIN_MB", "32")) * 1024 * 1024
+
+# Repeated string columns stored as pandas Categoricals (sorted categories).
+CATEGORICAL_COLUMNS = [
+    "ps_id",
+    "problem_statement_title",
+    "category",
+    "theme",
+    "organization",
+    "department",
+    "status",
+    "aishe_code",
+    "institute_name",
+    "institute_city",
+    "institute_state",
+]
+
+# Session-state key holding the canonical hash of the applied filters.
+FILTER_SIGNATURE_KEY = "_filter_signature"
+
+# Session-state key holding the applied selections ({dataset column: values}).
+ACTIVE_FILTERS_KEY = "_active_filters"
+
+# Session-state key holding the data source (edition paths) the year filter selected.
+DATASET_SOURCE_KEY = "_dataset_source"
+
+# Bounds for the process-wide aggregate cache shared across sessions.
+AGGREGATE_CACHE_MAX_ENTRIES = 512
+AGGREGATE_CACHE_MAX_BYTES = 256 * 1024 * 1024
 
 # Session-state keys used by sidebar filters.
 FILTER_STATE_KEYS = [
@@ -18,3 +71,86 @@ FILTER_STATE_KEYS = [
     "ps",
     "inst",
 ]
+
+# Sidebar multiselect key -> dataset column, in cascade order.
+FILTER_COLUMNS = {
+    "year": "edition_year",
+    "cat": "category",
+    "theme": "theme",
+    "org": "organization",
+    "dept": "department",
+    "status": "status",
+    "state": "institute_state",
+    "city": "institute_city",
+}
+
+# Free-text columns served by the trigram search index.
+SEARCH_COLUMNS = [
+    "ps_id",
+    "problem_statement_title",
+    "institute_name",
+    "team_name",
+    "team_leader_name",
+]
+
+# Approximate distinct counts (HyperLogLog) for KPI cards. Opt-in; frames
+# smaller than APPROX_DISTINCT_MIN_ROWS are always counted exactly.
+APPROX_DISTINCT_ENABLED = os.environ.get("SIH_APPROX_DISTINCT", "0") == "1"
+APPROX_DISTINCT_ERROR = float(os.environ.get("SIH_APPROX_DISTINCT_ERROR", "0.02"))
+APPROX_DISTINCT_MIN_ROWS = 100_000
+
+# Opt-in per-rerun profiling: SIH_PROFILE=1 or the ?profile=1 query parameter.
+# Stage timings are shown in a sidebar panel and appended to PROFILE_LOG_PATH.
+PROFILE_ENABLED = os.environ.get("SIH_PROFILE", "0") == "1"
+PROFILE_QUERY_PARAM = "profile"
+PROFILE_LOG_PATH = os.environ.get("SIH_PROFILE_LOG", "profile.jsonl")
+
+# Columns whose distinct counts are shown on KPI cards (sketched in approximate mode).
+DISTINCT_COLUMNS = [
+    "team_id",
+    "ps_id",
+    "organization",
+    "department",
+    "institute_name",
+    "institute_city",
+    "institute_state",
+]
+
+# Download exports are encoded on click, EXPORT_CHUNK_ROWS rows at a time, and
+# kept in the aggregate cache per filter signature.
+EXPORT_CHUNK_ROWS = 50_000
+
+# Columns with a load-time sort permutation (int32 per row each); paged tables
+# sorted by other columns sort the filtered frame instead.
+SORT_INDEX_COLUMNS = [
+    "edition_year",
+    "ps_id",
+    "problem_statement_title",
+    "category",
+    "team_id",
+    "team_name",
+    "status",
+    "prize_money",
+    "institute_name",
+    "institute_state",
+]
+
+# Paged tables: rows sent to the browser per page.
+TABLE_PAGE_SIZES = [50, 100, 250, 500]
+TABLE_DEFAULT_PAGE_SIZE = 100
+
+# Sidebar text search key -> dataset column (case-insensitive substring match).
+SEARCH_FILTER_COLUMNS = {
+    "ps": "problem_statement_title",
+    "inst": "institute_name",
+}
+
+# Engine for the tab aggregations: "pandas" (default, over the in-memory
+# frame), "duckdb" (grouped SQL over a prepared Parquet copy, multithreaded
+# and spilling to disk past SIH_DUCKDB_MEMORY_LIMIT) or "polars" (lazy
+# queries over the same copy, sized by POLARS_MAX_THREADS). The optional
+# engines need their package and fall back to pandas without it.
+# SIH_DUCKDB_THREADS=0 uses every core.
+QUERY_ENGINE = os.environ.get("SIH_QUERY_ENGINE", "pandas").lower()
+DUCKDB_THREADS = int(os.environ.get("SIH_DUCKDB_THREADS", "0"))
+DUCKDB_MEMORY_LIMIT = os.environ.get("SIH_DUCKDB_MEMORY_LIMIT", "")
@@ -2,25 +2,86 @@
 
 Rules:
 - No Streamlit calls at import time.
-- Caching is applied on the function that reads from disk.
+- Caching is applied on the functions that read from disk (`load_edition`, one
+  read-only copy of each edition per process shared by every session).
+- Editions come from the dataset catalog (`catalog.discover_editions`); a
+  dataset is the editions the year filter selects (`load_dataset`).
+- The catalog is watched for changes (`load_catalog_watcher`): changed
+  editions are rebuilt in the background and swapped in once ready; result
+  deltas are applied to the loaded edition instead (see `load_edition`).
+- Large CSVs are streamed in bounded chunks (see `read_csv_chunked`).
+- The cleaned frame is persisted next to the source file (Arrow IPC) so cold
+  starts can memory-map it instead of re-parsing and re-cleaning the CSV.
 """
 
 from __future__ import annotations
 
+import hashlib
+import os
+import re
 import warnings
+from pathlib import Path
+from typing import Callable
+
 import numpy as np
 import pandas as pd
 import streamlit as st
+from pandas.api.types import union_categoricals
+
+from .config import (
+    CATEGORICAL_COLUMNS,
+    DATASET_CACHE_MAX_ENTRIES,
+    INGEST_MEMORY_LIMIT_BYTES,
+    INGEST_STREAMING_MIN_BYTES,
+    PREPARED_CACHE_DIR,
+    QUERY_ENGINE,
+    RELOAD_INTERVAL_S,
+    RELOAD_SETTLE_S,
+)
+from .catalog import Catalog, DataSource, Deltas, partition_files, read_partition
+from .dataset import Dataset
+from .delta import Delta, apply_delta, chain_version, read_delta, upsert_frame
+from .profiling import note
+from .reload import CatalogWatcher
+from .status import add_outcome_columns
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - optional dependency
+    feather = None
 
 
 warnings.filterwarnings("ignore")
 
 
-@st.cache_data
-def load_data(filepath: str) -> pd.DataFrame:
-    """Load and prepare the SIH dataset."""
-    df = pd.read_csv(filepath)
+# Bump whenever `prepare_data` changes so stale prepared files are ignored.
+PREPARE_VERSION = 3
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Rows parsed up front to pin column dtypes and estimate bytes per row.
+_INGEST_SAMPLE_ROWS = 10_000
+_INGEST_MIN_CHUNK_ROWS = 1_000
+# Raw chunk + cleaned copy + temporaries of `prepare_data`, per row.
+_INGEST_WORKING_COPIES = 4
+
 
+def _split_submissions(df: pd.DataFrame, always: bool = False) -> None:
+    """Add `submissions_received` / `submissions_limit` parsed from `total_submission`.
+
+    Only when some value has an 'a/b' form, unless `always` (used to align
+    streamed chunks with the rest of the file).
+    """
+    split = df["total_submission"].astype(str).str.split("/", expand=True)
+    if split.shape[1] < 2 and not always:
+        return
+    split = split.reindex(columns=[0, 1])
+    df["submissions_received"] = pd.to_numeric(split[0], errors="coerce").fillna(0).astype(int)
+    df["submissions_limit"] = pd.to_numeric(split[1], errors="coerce").fillna(0).astype(int)
+
+
+def prepare_data(df: pd.DataFrame) -> pd.DataFrame:
+    """Clean a raw SIH frame (as read from CSV) for analysis."""
     # Strip whitespace from string-like columns (preserve NaN; avoid forcing numeric dtypes to string)
     obj_cols = df.select_dtypes(include=["object"]).columns
     for col in obj_cols:
@@ -38,24 +99,446 @@ def load_data(filepath: str) -> pd.DataFrame:
 
     # Parse total_submission (e.g., '500/500' -> submissions_received, submissions_limit)
     if "total_submission" in df.columns:
-        split = df["total_submission"].astype(str).str.split("/", expand=True)
-        if split.shape[1] >= 2:
-            df[["submissions_received", "submissions_limit"]] = split.iloc[:, :2]
-            df["submissions_received"] = (
-                pd.to_numeric(df["submissions_received"], errors="coerce").fillna(0).astype(int)
-            )
-            df["submissions_limit"] = (
-                pd.to_numeric(df["submissions_limit"], errors="coerce").fillna(0).astype(int)
-            )
+        _split_submissions(df)
 
     # Fill missing values for display (object columns only; keep numeric columns numeric)
     obj_cols = df.select_dtypes(include=["object"]).columns
     if len(obj_cols) > 0:
         df[obj_cols] = df[obj_cols].fillna("Unknown")
 
+    # Encode repeated strings as categoricals so filters/groupbys work on integer codes
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.Categorical(df[col], categories=sorted(df[col].unique()))
+
+    # Derive award flags/tiers once instead of re-classifying status strings per rerun
+    if "status" in df.columns:
+        df = add_outcome_columns(df)
+
+    return df
+
+
+def _chunk_dtypes(sample: pd.DataFrame) -> tuple[dict, list[str]]:
+    """Dtypes pinning every chunk to the sample's schema.
+
+    Integer columns are read as float (a later chunk may have gaps) and
+    restored afterwards; columns that look non-numeric or empty in the
+    sample are read as strings.
+    """
+    dtypes: dict = {}
+    int_columns: list[str] = []
+    for col, dtype in sample.dtypes.items():
+        if pd.api.types.is_integer_dtype(dtype):
+            int_columns.append(col)
+            dtypes[col] = "float64"
+        elif pd.api.types.is_float_dtype(dtype) and sample[col].notna().any():
+            dtypes[col] = "float64"
+        else:
+            dtypes[col] = str
+    return dtypes, int_columns
+
+
+def _concat_prepared(chunks: list[pd.DataFrame], int_columns: list[str]) -> pd.DataFrame:
+    """Combine cleaned chunks column by column, releasing each chunk column once copied."""
+    columns = list(dict.fromkeys(col for chunk in chunks for col in chunk.columns))
+    if "submissions_received" in columns:
+        # Chunks without any 'a/b' value skipped the split; parse them too.
+        for chunk in chunks:
+            if "submissions_received" not in chunk.columns:
+                _split_submissions(chunk, always=True)
+
+    combined: dict[str, pd.Series | pd.Categorical] = {}
+    for col in columns:
+        parts = [chunk.pop(col) for chunk in chunks]
+        if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            # Chunk-local categories -> one sorted category set, codes remapped.
+            combined[col] = union_categoricals(parts, sort_categories=True)
+        else:
+            values = pd.concat(parts, ignore_index=True)
+            if col in int_columns and values.notna().all():
+                values = values.astype(np.int64)
+            combined[col] = values
+    return pd.DataFrame(combined)
+
+
+def read_csv_chunked(
+    filepath: str, memory_limit_bytes: int = INGEST_MEMORY_LIMIT_BYTES
+) -> pd.DataFrame:
+    """Read and clean a CSV in bounded chunks; equivalent to `prepare_data(pd.read_csv(...))`.
+
+    Each chunk is cleaned and categorical-encoded while only it is resident
+    as raw text, so peak memory is the compact result plus one chunk's
+    working set rather than several copies of the whole raw frame.
+    """
+    sample = pd.read_csv(filepath, nrows=_INGEST_SAMPLE_ROWS)
+    row_bytes = max(sample.memory_usage(deep=True).sum() / max(len(sample), 1), 1.0)
+    chunk_rows = max(
+        _INGEST_MIN_CHUNK_ROWS, int(memory_limit_bytes // (_INGEST_WORKING_COPIES * row_bytes))
+    )
+    dtypes, int_columns = _chunk_dtypes(sample)
+    del sample
+
+    try:
+        chunks = [
+            prepare_data(chunk)
+            for chunk in pd.read_csv(filepath, dtype=dtypes, chunksize=chunk_rows)
+        ]
+    except ValueError:
+        # A column numeric in the sample holds text further down the file.
+        return _read_csv_chunked_as_text(filepath, dtypes, chunk_rows)
+    return _concat_prepared(chunks, int_columns)
+
+
+def _read_csv_chunked_as_text(filepath: str, dtypes: dict, chunk_rows: int) -> pd.DataFrame:
+    """`read_csv_chunked` with no pinned numeric dtypes.
+
+    Every column is read as text. A column the sample took for numeric is
+    converted back after the concat (int when whole and complete, as
+    `pd.read_csv` infers it over the whole file) unless some raw value in
+    any chunk is not a number; then it stays text, as in an eager read.
+    """
+    numeric = [col for col, dtype in dtypes.items() if dtype is not str]
+    text: set[str] = set()
+    chunks = []
+    for chunk in pd.read_csv(filepath, dtype=str, chunksize=chunk_rows):
+        for col in numeric:
+            raw = chunk[col]
+            if (raw.notna() & pd.to_numeric(raw, errors="coerce").isna()).any():
+                text.add(col)
+        chunks.append(prepare_data(chunk))
+    df = _concat_prepared(chunks, [])
+
+    for col in numeric:
+        if col in text or not pd.api.types.is_string_dtype(df[col].dtype):
+            continue  # text, or already converted by `prepare_data`
+        # Missing values were filled for display while the column was text.
+        df[col] = pd.to_numeric(df[col].mask(df[col] == "Unknown"))
+    return df
+
+
+def _source_files(filepath: str) -> list[Path]:
+    path = Path(filepath)
+    return partition_files(path) if path.is_dir() else [path]
+
+
+def source_fingerprint(filepath: str) -> str:
+    """Return a key identifying the source contents and cleaning logic.
+
+    Combines size, mtime and a SHA-256 of the bytes with `PREPARE_VERSION`,
+    for a CSV file or for each Parquet file of a partition directory.
+    """
+    key = hashlib.sha256()
+    for path in _source_files(filepath):
+        stat = path.stat()
+        digest = hashlib.sha256()
+        with open(path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        key.update(f"{stat.st_size}:{stat.st_mtime_ns}:{PREPARE_VERSION}:".encode())
+        key.update(digest.digest())
+    return key.hexdigest()[:16]
+
+
+def prepared_cache_path(filepath: str, fingerprint: str, suffix: str = ".arrow") -> Path:
+    """Location of the prepared (cleaned) copy of `filepath`."""
+    source = Path(filepath)
+    return source.parent / PREPARED_CACHE_DIR / f"{source.stem}-{fingerprint}{suffix}"
+
+
+def _read_prepared(path: Path) -> pd.DataFrame | None:
+    if feather is None or not path.exists():
+        return None
+    try:
+        return feather.read_table(path, memory_map=True).to_pandas()
+    except Exception:
+        # Corrupt/partial file: fall back to re-preparing from the source.
+        return None
+
+
+def _replace_prepared(path: Path, write: Callable[[Path], None]) -> bool:
+    """Atomically (re)write a prepared file and drop older versions of it."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        write(tmp_path)
+        os.replace(tmp_path, path)
+        # Drop prepared copies of older versions of the same source only:
+        # `<stem>-<fingerprint><suffix>`, so `sih-2023-delta-…` survives `sih-2023`.
+        stem = path.stem.rsplit("-", 1)[0]
+        same_source = re.compile(re.escape(stem) + r"-[0-9a-f]{16}" + re.escape(path.suffix))
+        for stale in path.parent.glob(f"{stem}-*{path.suffix}"):
+            if stale != path and same_source.fullmatch(stale.name):
+                stale.unlink(missing_ok=True)
+        return True
+    except OSError:
+        # Read-only deployments still work, just without the on-disk cache.
+        return False
+
+
+def _write_prepared(df: pd.DataFrame, path: Path) -> None:
+    if feather is None:
+        return
+    _replace_prepared(path, lambda tmp: feather.write_feather(df, tmp, compression="uncompressed"))
+
+
+def prepared_parquet(filepath: str, dataset: Dataset) -> Path | None:
+    """Parquet copy of one prepared edition, for engines that scan files.
+
+    Written once per source fingerprint; None if it cannot be written.
+    """
+    path = prepared_cache_path(filepath, dataset.version, ".parquet")
+    if path.exists():
+        return path
+    if feather is None:
+        return None
+    written = _replace_prepared(
+        path, lambda tmp: dataset.frame.to_parquet(tmp, index=False, compression="zstd")
+    )
+    return path if written else None
+
+
+def read_dataset(filepath: str, fingerprint: str | None = None) -> pd.DataFrame:
+    """Load one prepared edition, re-cleaning the source only when it changed.
+
+    `filepath` is a CSV file or an `edition_year=YYYY` partition directory.
+    """
+    if fingerprint is None:
+        fingerprint = source_fingerprint(filepath)
+    cache_path = prepared_cache_path(filepath, fingerprint)
+
+    df = _read_prepared(cache_path)
+    if df is not None:
+        return df
+
+    if os.path.isdir(filepath):
+        df = prepare_data(read_partition(filepath))
+    elif os.path.getsize(filepath) > INGEST_STREAMING_MIN_BYTES:
+        df = read_csv_chunked(filepath)
+    else:
+        df = prepare_data(pd.read_csv(filepath))
+    _write_prepared(df, cache_path)
     return df
 
 
+def _is_text(dtype) -> bool:
+    return pd.api.types.is_string_dtype(dtype) and not isinstance(dtype, pd.CategoricalDtype)
+
+
+def combine_editions(editions: list[Dataset]) -> Dataset:
+    """One dataset over several prepared editions (in the given order)."""
+    frames = [edition.frame.copy(deep=False) for edition in editions]
+    columns = list(dict.fromkeys(col for frame in frames for col in frame.columns))
+    for col in columns:
+        present = [frame for frame in frames if col in frame.columns]
+        like = present[0][col].dtype
+        # Columns only some editions have: "Unknown" text or missing numbers,
+        # as `prepare_data` fills them (submission counts are re-split).
+        if len(present) < len(frames) and not col.startswith("submissions_"):
+            for frame in frames:
+                if col in frame.columns:
+                    continue
+                if isinstance(like, pd.CategoricalDtype):
+                    codes = np.zeros(len(frame), dtype=np.int8)
+                    frame[col] = pd.Categorical.from_codes(codes, categories=["Unknown"])
+                else:
+                    frame[col] = "Unknown" if _is_text(like) else np.nan
+        # Text in one edition and numbers in another ('a/b' submission
+        # counts): text throughout, as one CSV holding both would read.
+        dtypes = {frame[col].dtype for frame in frames if col in frame.columns}
+        if len(dtypes) > 1 and any(_is_text(dtype) for dtype in dtypes):
+            for frame in present:
+                frame[col] = frame[col].astype("str")
+    return Dataset.build(_concat_prepared(frames, []), combined_version(editions))
+
+
+def combined_version(editions: list[Dataset]) -> str:
+    """Version of the dataset combining `editions` (follows each edition's version)."""
+    return hashlib.sha256(":".join(e.version for e in editions).encode()).hexdigest()[:16]
+
+
+# `Dataset.derived` name under which `load_dataset` records the editions.
+_EDITIONS = "editions"
+
+# Newest dataset built per edition path (or multi-edition selection) and the
+# source it was built from: the base for applying further deltas in place.
+_LATEST: dict[object, tuple[DataSource, Dataset]] = {}
+
+
+# Why each malformed delta file, by (path, stamp), was skipped.
+_DELTA_ERRORS: dict[tuple[str, str], str] = {}
+
+
+def _read_delta(key: tuple[str, str]) -> Delta | None:
+    """The delta file at `key`, or None (the error recorded) when it cannot be read."""
+    path, _ = key
+    try:
+        return read_delta(path)
+    except ValueError as exc:
+        _DELTA_ERRORS[key] = f"{Path(path).name}: {exc}"
+        return None
+
+
+def delta_errors(source: DataSource) -> list[str]:
+    """Errors of the delta files of `source` that were skipped, in order."""
+    return [_DELTA_ERRORS[key] for _, _, deltas in source for key in deltas if key in _DELTA_ERRORS]
+
+
+def _new_deltas(previous: DataSource, source: DataSource) -> Deltas | None:
+    """Delta files `source` adds to `previous` (None if anything else differs)."""
+    if [key[:2] for key in previous] != [key[:2] for key in source]:
+        return None
+    added: Deltas = ()
+    for (_, _, applied), (_, _, deltas) in zip(previous, source):
+        if deltas[: len(applied)] != applied:
+            return None
+        added += deltas[len(applied) :]
+    return added
+
+
+def _updated(name: object, source: DataSource, version: str | None = None) -> Dataset | None:
+    """The latest dataset of `name` with the deltas `source` adds applied, if possible."""
+    latest = _LATEST.get(name)
+    if latest is None:
+        return None
+    keys = _new_deltas(latest[0], source)
+    if keys is None:
+        return None
+    deltas = list(filter(None, map(_read_delta, keys)))
+    dataset = latest[1]
+    for i, delta in enumerate(deltas):
+        dataset = apply_delta(dataset, delta, version if i == len(deltas) - 1 else None)
+        if dataset is None:
+            return None
+    note("load_dataset.delta_applied")
+    return dataset
+
+
+def _remember(name: object, source: DataSource, dataset: Dataset) -> Dataset:
+    _LATEST.pop(name, None)
+    _LATEST[name] = (source, dataset)
+    # One entry per edition path; multi-edition selections are bounded like `load_dataset`.
+    for key in [key for key in _LATEST if isinstance(key, tuple)][:-DATASET_CACHE_MAX_ENTRIES]:
+        del _LATEST[key]
+    return dataset
+
+
+@st.cache_resource
+def load_edition(filepath: str, stamp: str, deltas: Deltas = ()) -> Dataset:
+    """One edition and its filter indexes, loaded once per process and `stamp`.
+
+    `stamp` (see `catalog.Edition`) only keys the cache: a rewritten file is
+    loaded afresh. Every session shares the same read-only frame (see
+    `dataset.Dataset`); nothing is copied per session or per rerun.
+
+    `deltas` (result updates, see `delta.py`) newer than the ones the
+    current version of the edition already has are applied to it in place
+    of a reload, at a cost that follows the delta; deltas adding rows or
+    changing keys re-apply every delta to the prepared edition instead.
+    Malformed delta files are skipped (see `delta_errors`).
+    """
+    note("load_edition.cache_miss")
+    source = ((filepath, stamp, deltas),)
+    dataset = _updated(filepath, source)
+    if dataset is None:
+        version = source_fingerprint(filepath)
+        df = read_dataset(filepath, version)
+        for delta in filter(None, map(_read_delta, deltas)):
+            df, version = upsert_frame(df, delta), chain_version(version, delta)
+        dataset = Dataset.build(df, version)
+    return _remember(filepath, source, dataset)
+
+
+@st.cache_resource(max_entries=DATASET_CACHE_MAX_ENTRIES)
+def load_dataset(source: DataSource) -> Dataset:
+    """The dataset of the editions in `source` (see `catalog.Catalog.source`).
+
+    A single edition is served as loaded. Several are combined from the
+    cached editions, so a new edition only reads its own files; new deltas
+    are applied to the previous combination as to an edition.
+
+    The result records its editions (`dataset_editions`), so structures
+    built from them later (e.g. the query engine's Parquet copies) use the
+    same snapshot even after the catalog watcher has swapped the files.
+    """
+    editions = [load_edition(*key) for key in source]
+    if len(editions) == 1:
+        dataset = editions[0]
+    else:
+        paths = tuple(path for path, _, _ in source)
+        dataset = _updated(paths, source, combined_version(editions))
+        if dataset is None:
+            note("load_dataset.combine")
+            dataset = combine_editions(editions)
+        _remember(paths, source, dataset)
+    dataset.seed(_EDITIONS, (source, tuple(editions)))
+    return dataset
+
+
+def dataset_editions(dataset: Dataset) -> tuple[DataSource, tuple[Dataset, ...]]:
+    """The source `dataset` was loaded from and its edition datasets, in order."""
+    return dataset.built(_EDITIONS) or ((), ())
+
+
+def _warm_catalog(catalog: Catalog) -> None:
+    """Build the default (every edition) view's dataset and indexes."""
+    dataset = load_dataset(catalog.source())
+    dataset.sort_index
+    # Only the pandas engine aggregates from the fact table; DuckDB and
+    # Polars would hold it next to their own working memory unused.
+    if QUERY_ENGINE == "pandas":
+        dataset.ps_fact_table
+
+
+def _release_editions(previous: Catalog, current: Catalog) -> None:
+    """Drop the replaced default view and the editions `current` no longer serves."""
+    if previous.editions:
+        load_dataset.clear(previous.source())
+    for edition in set(previous.editions) - set(current.editions):
+        load_edition.clear(*edition.key)
+    for path in {e.path for e in previous.editions} - {e.path for e in current.editions}:
+        _LATEST.pop(path, None)
+
+
+@st.cache_resource
+def load_catalog_watcher(root: str) -> CatalogWatcher:
+    """The process-wide watcher keeping the catalog of `root` current."""
+    return CatalogWatcher(
+        root,
+        _warm_catalog,
+        interval=RELOAD_INTERVAL_S,
+        settle=RELOAD_SETTLE_S,
+        on_swap=_release_editions,
+    ).start()
+
+
+def observed_values(series: pd.Series) -> list:
+    """Sorted distinct values present in `series` (skips unused categories)."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = np.unique(series.cat.codes.to_numpy())
+        codes = codes[codes >= 0]
+        return series.cat.categories[codes].tolist()
+    return sorted(series.dropna().unique())
+
+
+def ranked_counts(counts: pd.Series) -> pd.Series:
+    """`counts` most frequent first, ties by label (the order every query engine uses).
+
+    Labels compare as text, level by level for a MultiIndex, so categoricals
+    rank like the strings the DuckDB and Polars engines group on.
+    """
+    labels = [
+        counts.index.get_level_values(level).astype(str).to_numpy(dtype=str)
+        for level in reversed(range(counts.index.nlevels))
+    ]
+    return counts.iloc[np.lexsort([*labels, -counts.to_numpy()])]
+
+
+def observed_counts(series: pd.Series) -> pd.Series:
+    """`value_counts()` without the zero rows categoricals report for unused categories."""
+    counts = series.value_counts()
+    return ranked_counts(counts[counts > 0])
+
+
 def validate_required_columns(df: pd.DataFrame, required: set[str]) -> set[str]:
     """Return missing required columns."""
     return required - set(df.columns)
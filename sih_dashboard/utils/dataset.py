@@ -0,0 +1,133 @@
+"""The base dataset, shared read-only by every session (no Streamlit calls here).
+
+One `Dataset` is held per process and edition (see `data.load_edition`):
+the prepared frame plus the indexes the sidebar filters run on. The frame's
+NumPy buffers are marked read-only, so an in-place write raises instead of
+leaking into other sessions; pandas copy-on-write means frames derived
+from it only allocate the columns they change. Filtering produces base row
+positions, and only the selected rows are ever materialised.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from .bitmap_index import BitmapIndex
+from .config import (
+    APPROX_DISTINCT_ERROR,
+    DISTINCT_COLUMNS,
+    FILTER_COLUMNS,
+    SEARCH_COLUMNS,
+    SORT_INDEX_COLUMNS,
+)
+from .hll import DistinctSketches
+from .ps_summary import PSFactTable, build_ps_fact_table
+from .sort_index import SortIndex
+from .text_index import SearchIndex
+
+T = TypeVar("T")
+
+
+def _read_only(series: pd.Series) -> np.ndarray | pd.api.extensions.ExtensionArray:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = np.array(series.cat.codes.to_numpy())
+        codes.flags.writeable = False
+        return pd.Categorical.from_codes(codes, dtype=series.dtype, validate=False)
+    if isinstance(series.dtype, np.dtype):
+        values = series.to_numpy(copy=True)
+        values.flags.writeable = False
+        return values
+    # Arrow-backed strings and other extension arrays are immutable already.
+    return series.array
+
+
+def freeze_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """`df` rebuilt column by column on read-only buffers (consumes `df`)."""
+    index = df.index
+    columns = {col: _read_only(df.pop(col)) for col in list(df.columns)}
+    return pd.DataFrame(columns, index=index, copy=False)
+
+
+def replace_columns(df: pd.DataFrame, columns: dict[str, pd.Series]) -> pd.DataFrame:
+    """Frozen `df` with `columns` replaced by read-only copies (the rest are shared)."""
+    replaced = {col: _read_only(columns[col]) if col in columns else df[col] for col in df.columns}
+    return pd.DataFrame(replaced, index=df.index, copy=False)
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """Prepared frame (positional RangeIndex, read-only) and its filter indexes."""
+
+    frame: pd.DataFrame
+    version: str  # `data.source_fingerprint` of the source file (and applied deltas)
+    filter_index: BitmapIndex
+    search_index: SearchIndex
+    # Structures built on first use (sort index, fact table, sketches, row
+    # keys, query engine); `delta.apply_delta` carries the indexes over to
+    # the next version.
+    _derived: dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, version: str) -> "Dataset":
+        frame = freeze_frame(df.reset_index(drop=True))
+        return cls(
+            frame=frame,
+            version=version,
+            filter_index=BitmapIndex.build(frame, list(FILTER_COLUMNS.values())),
+            search_index=SearchIndex.build(frame, SEARCH_COLUMNS),
+        )
+
+    def derived(self, name: str, build: Callable[[], T]) -> T:
+        """`build()`, run once per dataset and shared by every session."""
+        value = self._derived.get(name)
+        if value is None:
+            with self._lock:
+                value = self._derived.get(name)
+                if value is None:
+                    value = self._derived[name] = build()
+        return value
+
+    def built(self, name: str) -> Any | None:
+        """The `derived` structure `name` if it has been built, else None."""
+        return self._derived.get(name)
+
+    def seed(self, name: str, value: Any) -> None:
+        """Install `name` built elsewhere (e.g. updated from the previous version)."""
+        self._derived[name] = value
+
+    @property
+    def sort_index(self) -> SortIndex:
+        """Sort permutations of the sortable table columns (built on first use)."""
+        return self.derived("sort_index", lambda: SortIndex.build(self.frame, SORT_INDEX_COLUMNS))
+
+    @property
+    def ps_fact_table(self) -> PSFactTable:
+        """Problem-statement fact table (built on first use)."""
+        return self.derived("ps_fact_table", lambda: build_ps_fact_table(self.frame))
+
+    @property
+    def distinct_sketches(self) -> DistinctSketches:
+        """HyperLogLog sketches per filter value (built on first use of approximate mode)."""
+        return self.derived(
+            "distinct_sketches",
+            lambda: DistinctSketches.build(
+                self.frame, list(FILTER_COLUMNS.values()), DISTINCT_COLUMNS, APPROX_DISTINCT_ERROR
+            ),
+        )
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.frame)
+
+    def select(self, rows: np.ndarray | None) -> pd.DataFrame:
+        """Rows at base positions `rows` (the base frame itself for None).
+
+        The result keeps the base positions as index labels.
+        """
+        return self.frame if rows is None else self.frame.take(rows)
@@ -0,0 +1,360 @@
+"""Incremental result updates (no Streamlit calls here).
+
+A delta is a small CSV of changed team rows for one edition, such as the
+grand-finale results `scripts/scrape_winning_teams.py` writes (status,
+prize money, ...), named with its year like the editions it updates (see
+`catalog.discover_editions`). Rows are matched on (`ps_id`, `team_id`), or
+(`ps_id`, `idea_id`) where the team id is missing or unknown; the columns
+a delta carries replace the matched row's values, cleaned as `prepare_data`
+cleans the full CSV, and rows matching nothing are appended.
+
+`apply_delta` derives the next version of a loaded `Dataset` at a cost
+that follows the delta: only the changed columns are copied (the rest are
+shared), filter bitmaps flip the changed rows' bits, the search index adds
+the new distinct values, and the sort permutations and problem-statement
+fact table, when built, re-place only the changed rows and re-aggregate
+only their problem statements. Deltas that add rows or change grouping
+keys (problem statements, institutes, ids) fall back to `upsert_frame` and
+a rebuild.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from .catalog import file_year
+from .config import FILTER_COLUMNS, SEARCH_COLUMNS, SORT_INDEX_COLUMNS
+from .dataset import Dataset, replace_columns
+from .ps_summary import PS_KEY_COLUMNS, update_ps_fact_table
+from .status import AWARD_TIER_NONE, AWARD_TIER_WINNER, OUTCOME_COLUMNS, award_tiers
+
+
+# Id columns a delta row is matched on (with `ps_id` and the edition year), in order.
+ID_COLUMNS = ["team_id", "idea_id"]
+
+# Derived at load (`add_outcome_columns`, `_split_submissions`): never taken from a delta.
+DERIVED_COLUMNS = {
+    "edition_year",
+    *OUTCOME_COLUMNS,
+    "submissions_received",
+    "submissions_limit",
+}
+
+# Changes to these regroup rows (PS fact table, row keys): rebuild instead.
+_REBUILD_COLUMNS = {*PS_KEY_COLUMNS, *ID_COLUMNS, "institute_name", "institute_state", "total_submission"}
+
+# Inputs of the PS fact table aggregates besides the grouping keys.
+_FACT_COLUMNS = {"is_winner", "max_submission"}
+
+# Problem-statement details appended rows copy from their PS's existing rows.
+_PS_DETAIL_COLUMNS = [*PS_KEY_COLUMNS[1:], "total_submission", "max_submission"]
+
+
+@dataclass(frozen=True)
+class Delta:
+    """Cleaned rows of one delta file."""
+
+    year: int  # edition the rows belong to
+    frame: pd.DataFrame  # text as read (stripped, blanks missing); numeric ids
+    version: str  # hash of the file contents
+
+
+def read_delta(path: str | Path) -> Delta:
+    """Read a delta CSV (raises ValueError when it cannot be parsed or matched on)."""
+    path = Path(path)
+    year = file_year(path)
+    raw = path.read_bytes()
+    df = pd.read_csv(io.BytesIO(raw), dtype=str)
+    df.columns = [str(col).strip() for col in df.columns]
+    for col in df.columns:
+        df[col] = df[col].str.strip().replace({"nan": np.nan, "": np.nan})
+    if year is None or "ps_id" not in df.columns or not set(ID_COLUMNS) & set(df.columns):
+        raise ValueError(
+            "A delta needs a year in its name and ps_id plus team_id or idea_id columns."
+        )
+    ids = [col for col in ID_COLUMNS if col in df.columns]
+    for col in ids:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df = df[df["ps_id"].notna() & df[ids].notna().any(axis=1)].reset_index(drop=True)
+    return Delta(year, df, hashlib.sha256(raw).hexdigest()[:16])
+
+
+def chain_version(version: str, delta: Delta) -> str:
+    """Version of a dataset after applying `delta` to the one at `version`."""
+    return hashlib.sha256(f"{version}:{delta.version}".encode()).hexdigest()[:16]
+
+
+# ---- Row matching ----
+
+RowKeys = tuple[pd.MultiIndex, np.ndarray]
+
+
+def row_keys(frame: pd.DataFrame, id_column: str) -> RowKeys:
+    """(edition year, PS id, id) keys of `frame` and the first row holding each."""
+    keys = pd.MultiIndex.from_arrays([frame["edition_year"], frame["ps_id"], frame[id_column]])
+    first = ~keys.duplicated()
+    return keys[first], np.flatnonzero(first)
+
+
+def match_rows(
+    frame: pd.DataFrame, delta: Delta, keys: Callable[[str], RowKeys] | None = None
+) -> np.ndarray:
+    """Base row of each delta row (-1 where it matches none).
+
+    `keys(id_column)` supplies `row_keys` (e.g. memoized per dataset).
+    """
+    keys = keys or (lambda id_column: row_keys(frame, id_column))
+    rows = np.full(len(delta.frame), -1, dtype=np.int64)
+    for col in ID_COLUMNS:
+        if col not in delta.frame.columns or col not in frame.columns:
+            continue
+        ids = delta.frame[col]
+        wanted = (rows < 0) & ids.notna().to_numpy()
+        if not wanted.any():
+            continue
+        ids = ids[wanted]
+        if frame[col].dtype.kind in "iu" and (ids % 1 == 0).all():
+            ids = ids.astype(frame[col].dtype)
+        index, first = keys(col)
+        found = index.get_indexer(
+            pd.MultiIndex.from_arrays(
+                [np.full(len(ids), delta.year), delta.frame["ps_id"][wanted].to_numpy(), ids.to_numpy()]
+            )
+        )
+        rows[wanted] = np.where(found >= 0, first[found], -1)
+    return rows
+
+
+# ---- Column updates ----
+
+
+def _holds_text(dtype) -> bool:
+    return isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(dtype)
+
+
+def delta_values(values: pd.Series, like: pd.Series) -> pd.Series:
+    """Delta `values` cleaned for a column like `like`, as `prepare_data` would."""
+    if _holds_text(like.dtype):
+        return values.astype(object).where(values.notna(), "Unknown")
+    numbers = pd.to_numeric(values, errors="coerce")
+    if like.dtype.kind in "iu" and numbers.notna().all() and (numbers % 1 == 0).all():
+        numbers = numbers.astype(like.dtype)
+    return numbers
+
+
+def _same(current: pd.Series, values: pd.Series) -> np.ndarray:
+    a = current.astype(object).to_numpy()
+    b = values.astype(object).to_numpy()
+    return (a == b) | (pd.isna(a) & pd.isna(b))
+
+
+def assign_rows(series: pd.Series, rows: np.ndarray, values: pd.Series) -> pd.Series:
+    """A copy of `series` with `rows` set to `values`.
+
+    Categoricals keep sorted categories holding exactly the values in use,
+    as `prepare_data` encodes them.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories
+        codes = series.cat.codes.to_numpy().astype(np.int64)
+        added = pd.Index(pd.unique(values.to_numpy())).difference(categories)
+        if len(added):
+            grown = categories.append(added).sort_values()
+            codes = np.where(codes >= 0, grown.get_indexer(categories)[codes], -1)
+            categories = grown
+        codes[rows] = categories.get_indexer(values.to_numpy())
+        used = np.bincount(codes[codes >= 0], minlength=len(categories)) > 0
+        if not used.all():
+            codes = np.where(codes >= 0, (np.cumsum(used) - 1)[codes], -1)
+            categories = categories[used]
+        values = pd.Categorical.from_codes(codes, categories=categories)
+        return pd.Series(values, index=series.index, name=series.name)
+    if isinstance(series.dtype, np.dtype):
+        array = series.to_numpy(copy=True)
+        if array.dtype.kind in "iub" and (values.isna().any() or values.dtype.kind == "f"):
+            array = array.astype(np.float64)
+        array[rows] = values.to_numpy()
+        return pd.Series(array, index=series.index, name=series.name)
+    updated = series.copy()
+    updated.iloc[rows] = values.to_numpy()
+    return updated
+
+
+def _column_updates(
+    frame: pd.DataFrame, rows: np.ndarray, updates: pd.DataFrame
+) -> tuple[dict[str, pd.Series], dict[str, np.ndarray]]:
+    """Updated columns of `frame` and the rows whose value changed, per column.
+
+    `rows` are the base rows of `updates` (distinct); outcome columns follow
+    changed statuses.
+    """
+    columns: dict[str, pd.Series] = {}
+    changed: dict[str, np.ndarray] = {}
+    for col in updates.columns:
+        if col in DERIVED_COLUMNS or col == "ps_id" or col not in frame.columns:
+            continue
+        values = delta_values(updates[col], frame[col])
+        differs = ~_same(frame[col].iloc[rows], values)
+        if col in ID_COLUMNS:
+            # A missing id only means the row was matched on the other one.
+            differs &= values.notna().to_numpy()
+        if differs.any():
+            changed[col] = rows[differs]
+            columns[col] = assign_rows(frame[col], changed[col], values[differs])
+    if "status" in columns and "award_tier" in frame.columns:
+        at = changed["status"]
+        tiers = award_tiers(columns["status"].iloc[at])
+        for col, values in (
+            ("award_tier", tiers),
+            ("is_winner", tiers > AWARD_TIER_NONE),
+            ("is_ps_winner", tiers == AWARD_TIER_WINNER),
+        ):
+            columns[col] = assign_rows(frame[col], at, pd.Series(values))
+            changed[col] = at
+    return columns, changed
+
+
+def _last_per_row(rows: np.ndarray) -> np.ndarray:
+    """Mask keeping the last delta row naming each base row."""
+    return ~pd.Series(rows).duplicated(keep="last").to_numpy()
+
+
+# ---- Applying deltas ----
+
+
+def apply_delta(dataset: Dataset, delta: Delta, version: str | None = None) -> Dataset | None:
+    """The next version of `dataset` with `delta` applied, or None to rebuild.
+
+    None when the delta adds rows or changes grouping keys (see
+    `_REBUILD_COLUMNS`). The result's version is `version`, or `dataset`'s
+    chained with the delta's.
+    """
+    frame = dataset.frame
+    rows = match_rows(
+        frame,
+        delta,
+        lambda col: dataset.derived(f"row_keys.{col}", lambda: row_keys(frame, col)),
+    )
+    if (rows < 0).any():
+        return None
+    keep = _last_per_row(rows)
+    columns, changed = _column_updates(frame, rows[keep], delta.frame[keep].reset_index(drop=True))
+    if _REBUILD_COLUMNS & changed.keys():
+        return None
+
+    updated_frame = replace_columns(frame, columns)
+    updated = Dataset(
+        frame=updated_frame,
+        version=version or chain_version(dataset.version, delta),
+        filter_index=dataset.filter_index.updated(
+            {
+                col: (at, frame[col].iloc[at].tolist(), updated_frame[col].iloc[at].tolist())
+                for col, at in changed.items()
+                if col in FILTER_COLUMNS.values()
+            }
+        ),
+        search_index=dataset.search_index.updated(
+            updated_frame, {col: at for col, at in changed.items() if col in SEARCH_COLUMNS}
+        ),
+    )
+    for col in ID_COLUMNS:
+        if (keys := dataset.built(f"row_keys.{col}")) is not None:
+            updated.seed(f"row_keys.{col}", keys)
+    if (sort_index := dataset.built("sort_index")) is not None:
+        updated.seed(
+            "sort_index",
+            sort_index.updated(
+                updated_frame, {col: at for col, at in changed.items() if col in SORT_INDEX_COLUMNS}
+            ),
+        )
+    if (fact := dataset.built("ps_fact_table")) is not None:
+        fact_rows = [at for col, at in changed.items() if col in _FACT_COLUMNS]
+        if fact_rows:
+            fact = update_ps_fact_table(fact, updated_frame, np.unique(np.concatenate(fact_rows)))
+        updated.seed("ps_fact_table", fact)
+    return updated
+
+
+def upsert_frame(df: pd.DataFrame, delta: Delta) -> pd.DataFrame:
+    """`df` (a prepared frame) with `delta` applied, rebuilding what changed.
+
+    Same values as `apply_delta`; also takes new rows, appended after the
+    existing ones with their problem statement's details.
+    """
+    rows = match_rows(df, delta)
+    matched = rows >= 0
+    keep = matched & _last_per_row(rows)
+    columns, _ = _column_updates(df, rows[keep], delta.frame[keep].reset_index(drop=True))
+    df = replace_columns(df, columns)
+
+    new = delta.frame[~matched]
+    ids = [col for col in ID_COLUMNS if col in new.columns]
+    new = new.drop_duplicates(subset=["ps_id", *ids], keep="last").reset_index(drop=True)
+    if new.empty:
+        return df
+    return _append_rows(df, new, delta.year)
+
+
+def _next_serials(df: pd.DataFrame, new: pd.DataFrame, year: int) -> pd.Series:
+    """`serial_no` of the delta rows `new`: continuing their problem statement's list."""
+    edition = (df["edition_year"] == year).to_numpy()
+    last = pd.Series(df["serial_no"].to_numpy()[edition]).groupby(df["ps_id"].to_numpy()[edition]).max()
+    start = last.reindex(new["ps_id"].to_numpy()).fillna(0).to_numpy()
+    return pd.Series(start + new.groupby("ps_id").cumcount().to_numpy() + 1, index=new.index)
+
+
+def _append_rows(df: pd.DataFrame, new: pd.DataFrame, year: int) -> pd.DataFrame:
+    """`df` followed by the delta rows `new` of edition `year`, cleaned like `df`."""
+    ps_rows = pd.MultiIndex.from_arrays([df["edition_year"], df["ps_id"]])
+    first = ~ps_rows.duplicated()
+    found = ps_rows[first].get_indexer(pd.MultiIndex.from_arrays([np.full(len(new), year), new["ps_id"]]))
+    source = np.flatnonzero(first)[np.maximum(found, 0)] if len(df) else np.zeros(len(new), dtype=int)
+    known = found >= 0
+
+    added: dict[str, pd.Series] = {}
+    for col in df.columns:
+        like = df[col]
+        if col == "edition_year":
+            values = pd.Series(np.full(len(new), year, dtype=like.dtype))
+        elif col in new.columns and col not in DERIVED_COLUMNS:
+            values = delta_values(new[col], like)
+        elif col == "serial_no":
+            values = _next_serials(df, new, year)
+        else:
+            values = pd.Series("Unknown" if _holds_text(like.dtype) else np.nan, index=new.index)
+            if col in _PS_DETAIL_COLUMNS and known.any():
+                values = values.astype(object)
+                values[known] = like.iloc[source[known]].astype(object).to_numpy()
+                if not _holds_text(like.dtype):
+                    values = pd.to_numeric(values)
+        if like.dtype.kind in "iu" and values.notna().all() and (values % 1 == 0).all():
+            # Whole numbers keep the column's dtype; missing ones make it
+            # float, as `prepare_data` reads a blank in an integer column.
+            values = values.astype(like.dtype)
+        added[col] = values
+    if "status" in added and "award_tier" in added:
+        tiers = award_tiers(added["status"])
+        added["award_tier"] = pd.Series(tiers)
+        added["is_winner"] = pd.Series(tiers > AWARD_TIER_NONE)
+        added["is_ps_winner"] = pd.Series(tiers == AWARD_TIER_WINNER)
+
+    combined: dict[str, pd.Series | pd.Categorical] = {}
+    for col in df.columns:
+        like = df[col]
+        if isinstance(like.dtype, pd.CategoricalDtype):
+            values = added[col].astype(str)
+            part = pd.Categorical(values, categories=sorted(values.unique()))
+            combined[col] = pd.api.types.union_categoricals([like.array, part], sort_categories=True)
+        else:
+            values = added[col]
+            if _holds_text(like.dtype):
+                values = values.astype(like.dtype)
+            combined[col] = pd.concat([like, values], ignore_index=True)
+    return pd.DataFrame(combined)
@@ -0,0 +1,92 @@
+"""Download buttons whose files are generated on click.
+
+Streamlit calls the `data` callable from a server thread when the button is
+pressed, not during the rerun, so everything it needs (the frame, the filter
+signature, profiling on/off) is captured while rendering.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Hashable
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from .agg_cache import AGGREGATE_CACHE
+from .config import FILTER_SIGNATURE_KEY
+from .export import available_formats, encode, unavailable_formats
+from .instrumentation import profiled_callback, profiling_enabled
+
+
+def export_download_button(
+    label: str,
+    df: pd.DataFrame,
+    *,
+    export: str,
+    params: tuple[Hashable, ...] = (),
+    order: np.ndarray | None = None,
+    file_stem: str,
+    **kwargs: Any,
+) -> None:
+    """Format picker plus `st.download_button` for `df`, encoded only when clicked.
+
+    `order` (row positions, e.g. from `paged_table.paged_dataframe`) selects
+    and orders the exported rows; the reordered frame is only built on click.
+
+    The encoded file is shared across sessions under (`export`, format, filter
+    signature, `params`); `params` must hold every widget value besides the
+    sidebar filters that shapes `df` (search text, sort, selected columns).
+    """
+    formats = {f.key: f for f in available_formats()}
+    fmt = formats[
+        st.selectbox(
+            "Export Format",
+            list(formats),
+            format_func=lambda key: formats[key].label,
+            key=f"_export_format_{export}",
+        )
+    ]
+    n_rows = len(df) if order is None else len(order)
+    too_large = fmt.max_rows is not None and n_rows > fmt.max_rows
+    if too_large:
+        st.caption(f"{fmt.label} holds at most {fmt.max_rows:,} rows; pick another format.")
+    if missing := unavailable_formats():
+        st.caption(
+            "Unavailable here: "
+            + ", ".join(f"{f.label} (`pip install {f.requires}`)" for f in missing)
+            + "."
+        )
+
+    signature = st.session_state.get(FILTER_SIGNATURE_KEY)
+    key = None if signature is None else ("export", export, fmt.key, signature, params)
+    profile = profiling_enabled()
+
+    def build() -> bytes:
+        with profiled_callback(
+            f"download.{fmt.key}", profile, export=export, rows=n_rows
+        ) as detail:
+            computed = False
+
+            def run() -> bytes:
+                nonlocal computed
+                computed = True
+                return encode(df if order is None else df.take(order), fmt)
+
+            if key is None:
+                data = run()
+                detail["cache"] = "off"
+            else:
+                data = AGGREGATE_CACHE.get_or_compute(key, run)
+                detail["cache"] = "miss" if computed else "hit"
+            detail["bytes"] = len(data)
+            return data
+
+    st.download_button(
+        f"{label} ({fmt.label})",
+        data=build,
+        file_name=file_stem + fmt.extension,
+        mime=fmt.mime,
+        disabled=too_large,
+        **kwargs,
+    )
@@ -0,0 +1,198 @@
+"""Encoders for the download-button exports.
+
+No Streamlit calls here (see `downloads` for the button glue). Every format
+is written into one buffer piece by piece (CSV in row chunks, Arrow in record
+batches), so the whole file never exists twice as text and bytes.
+
+Parquet and Arrow IPC need pyarrow, zstd-compressed CSV needs `zstandard`
+and XLSX needs `xlsxwriter` or `openpyxl` (all in requirements.txt); formats
+whose dependency is missing are left out of `available_formats()` and listed
+by `unavailable_formats()` for the UI to mention.
+"""
+
+from __future__ import annotations
+
+import gzip
+import importlib.util
+import io
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Iterator
+
+import pandas as pd
+
+from .config import EXPORT_CHUNK_ROWS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import xlsxwriter
+except ImportError:  # pragma: no cover - optional dependency
+    xlsxwriter = None
+
+
+# Last data row Excel can hold (one row is taken by the header).
+XLSX_MAX_ROWS = 1_048_575
+
+_XLSX_ENGINE = next(
+    (name for name in ("xlsxwriter", "openpyxl") if importlib.util.find_spec(name) is not None),
+    None,
+)
+
+
+def iter_csv_chunks(df: pd.DataFrame, chunk_rows: int = EXPORT_CHUNK_ROWS) -> Iterator[bytes]:
+    """UTF-8 CSV of `df` (header first, no index), `chunk_rows` rows per piece."""
+    if df.empty:
+        yield df.to_csv(index=False).encode("utf-8")
+        return
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start : start + chunk_rows]
+        yield chunk.to_csv(index=False, header=start == 0).encode("utf-8")
+
+
+def _write_csv(df: pd.DataFrame, out: BinaryIO) -> None:
+    for piece in iter_csv_chunks(df):
+        out.write(piece)
+
+
+def _write_csv_gzip(df: pd.DataFrame, out: BinaryIO) -> None:
+    # mtime=0 keeps the output byte-identical for identical frames.
+    with gzip.GzipFile(fileobj=out, mode="wb", compresslevel=6, mtime=0) as gz:
+        _write_csv(df, gz)
+
+
+def _write_csv_zstd(df: pd.DataFrame, out: BinaryIO) -> None:
+    with zstandard.ZstdCompressor(level=3).stream_writer(out, closefd=False) as zst:
+        _write_csv(df, zst)
+
+
+def _arrow_table(df: pd.DataFrame) -> "pa.Table":
+    # Categorical columns become dictionary arrays (codes + one copy of each label).
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def _write_parquet(df: pd.DataFrame, out: BinaryIO) -> None:
+    pq.write_table(
+        _arrow_table(df),
+        out,
+        compression="zstd",
+        row_group_size=EXPORT_CHUNK_ROWS,
+    )
+
+
+def _write_arrow(df: pd.DataFrame, out: BinaryIO) -> None:
+    table = _arrow_table(df)
+    options = pa.ipc.IpcWriteOptions(compression="zstd")
+    with pa.ipc.new_file(out, table.schema, options=options) as writer:
+        for batch in table.to_batches(max_chunksize=EXPORT_CHUNK_ROWS):
+            writer.write_batch(batch)
+
+
+def _write_xlsx(df: pd.DataFrame, out: BinaryIO) -> None:
+    if xlsxwriter is None:
+        with pd.ExcelWriter(out, engine=_XLSX_ENGINE) as writer:
+            df.to_excel(writer, index=False, sheet_name="data")
+        return
+    # Constant-memory mode flushes each finished row, so rows are written in
+    # order through the worksheet API (`to_excel` writes column by column,
+    # and cells of already flushed rows would be dropped).
+    workbook = xlsxwriter.Workbook(out, {"constant_memory": True})
+    sheet = workbook.add_worksheet("data")
+    sheet.write_row(0, 0, [str(col) for col in df.columns], workbook.add_format({"bold": True}))
+    for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+        chunk = df.iloc[start : start + EXPORT_CHUNK_ROWS].astype(object)
+        rows = chunk.where(chunk.notna(), None).to_numpy().tolist()
+        for i, row in enumerate(rows, start=start + 1):
+            sheet.write_row(i, 0, row)
+    workbook.close()
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    key: str
+    label: str
+    extension: str
+    mime: str
+    write: Callable[[pd.DataFrame, BinaryIO], None]
+    available: bool = True
+    requires: str = ""  # package(s) to install when not available
+    max_rows: int | None = None
+
+
+EXPORT_FORMATS: dict[str, ExportFormat] = {
+    f.key: f
+    for f in [
+        ExportFormat("csv", "CSV", ".csv", "text/csv", _write_csv),
+        ExportFormat("csv.gz", "CSV (gzip)", ".csv.gz", "application/gzip", _write_csv_gzip),
+        ExportFormat(
+            "csv.zst",
+            "CSV (zstd)",
+            ".csv.zst",
+            "application/zstd",
+            _write_csv_zstd,
+            available=zstandard is not None,
+            requires="zstandard",
+        ),
+        ExportFormat(
+            "parquet",
+            "Parquet",
+            ".parquet",
+            "application/vnd.apache.parquet",
+            _write_parquet,
+            available=pq is not None,
+            requires="pyarrow",
+        ),
+        ExportFormat(
+            "arrow",
+            "Arrow IPC",
+            ".arrow",
+            "application/vnd.apache.arrow.file",
+            _write_arrow,
+            available=pa is not None,
+            requires="pyarrow",
+        ),
+        ExportFormat(
+            "xlsx",
+            "Excel (XLSX)",
+            ".xlsx",
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            _write_xlsx,
+            available=_XLSX_ENGINE is not None,
+            requires="xlsxwriter",
+            max_rows=XLSX_MAX_ROWS,
+        ),
+    ]
+}
+
+
+def available_formats() -> list[ExportFormat]:
+    """Formats whose optional dependencies are installed (CSV first)."""
+    return [f for f in EXPORT_FORMATS.values() if f.available]
+
+
+def unavailable_formats() -> list[ExportFormat]:
+    """Formats hidden because their optional dependency is not installed."""
+    return [f for f in EXPORT_FORMATS.values() if not f.available]
+
+
+def encode(df: pd.DataFrame, fmt: ExportFormat | str) -> bytes:
+    """`df` (without its index) encoded as `fmt`."""
+    if isinstance(fmt, str):
+        fmt = EXPORT_FORMATS[fmt]
+    if not fmt.available:
+        raise ValueError(f"Export format {fmt.key!r} needs {fmt.requires!r} (not installed).")
+    if fmt.max_rows is not None and len(df) > fmt.max_rows:
+        raise ValueError(f"{fmt.label} exports are limited to {fmt.max_rows:,} rows.")
+    buffer = io.BytesIO()
+    fmt.write(df, buffer)
+    return buffer.getvalue()
+
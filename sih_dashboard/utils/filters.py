@@ -5,11 +5,31 @@ Note: session_state is global in Streamlit; shared keys work across tabs.
 
 from __future__ import annotations
 
+from typing import Callable, TypeVar
+
+import numpy as np
 import pandas as pd
 import streamlit as st
 
-from .config import FILTER_STATE_KEYS
-
+from ..views.base import DistinctCounter
+from .agg_cache import AGGREGATE_CACHE, filter_signature
+from .bitmap_index import BitmapIndex
+from .config import (
+    ACTIVE_FILTERS_KEY,
+    APPROX_DISTINCT_ENABLED,
+    APPROX_DISTINCT_MIN_ROWS,
+    DATASET_SOURCE_KEY,
+    FILTER_COLUMNS,
+    FILTER_SIGNATURE_KEY,
+    FILTER_STATE_KEYS,
+    SEARCH_FILTER_COLUMNS,
+)
+from .catalog import Catalog, DataSource
+from .dataset import Dataset
+from .profiling import stage
+
+
+T = TypeVar("T")
 
 FILTER_DEFAULTS: dict[str, object] = {
     "year": [],
@@ -51,7 +71,79 @@ def _coerce_multiselect_state_to_options(key: str, options: list) -> None:
         st.session_state[key] = cleaned
 
 
-def render_sidebar_filters(df: pd.DataFrame) -> pd.DataFrame:
+def cached_aggregate(name: str, compute: Callable[[], T]) -> T:
+    """Memoize `compute()` for the current filter state, shared across sessions.
+
+    Only for values derived from the sidebar-filtered frame alone; the result
+    is shared and must not be mutated by the caller.
+    """
+    signature = st.session_state.get(FILTER_SIGNATURE_KEY)
+    with stage(f"aggregate.{name}") as detail:
+        if signature is None:
+            detail["cache"] = "off"
+            return compute()
+
+        computed = False
+
+        def run() -> T:
+            nonlocal computed
+            computed = True
+            return compute()
+
+        value = AGGREGATE_CACHE.get_or_compute((name, signature), run)
+        detail["cache"] = "miss" if computed else "hit"
+        return value
+
+
+def distinct_counter(dataset: Dataset) -> DistinctCounter:
+    """`df[column].nunique()` for sidebar-filtered frames of `dataset`.
+
+    In approximate mode (SIH_APPROX_DISTINCT=1) large frames are answered
+    from the dataset's HyperLogLog sketches; small frames, and filter states
+    sketches cannot express, are counted exactly.
+    """
+
+    def filtered_nunique(df: pd.DataFrame, column: str) -> int:
+        if APPROX_DISTINCT_ENABLED and len(df) >= APPROX_DISTINCT_MIN_ROWS:
+            active = st.session_state.get(ACTIVE_FILTERS_KEY)
+            if active is not None:
+                estimate = dataset.distinct_sketches.estimate(column, active)
+                if estimate is not None:
+                    return estimate
+        return int(df[column].nunique())
+
+    return filtered_nunique
+
+
+def _multiselect_filter(
+    index: BitmapIndex,
+    mask: np.ndarray | None,
+    label: str,
+    key: str,
+    selections: dict[str, object],
+) -> np.ndarray | None:
+    """Render one cascading multiselect and narrow `mask` by its selection."""
+    column = FILTER_COLUMNS[key]
+    options = index.values(column, mask)
+    _coerce_multiselect_state_to_options(key, options)
+    selected = st.sidebar.multiselect(label, options, key=key)
+    selections[key] = selected
+    if selected:
+        mask = index.intersect(mask, index.select(column, selected))
+    return mask
+
+
+def render_edition_filter(
+    catalog: Catalog, reload_error: str | None = None
+) -> tuple[DataSource, list[int]]:
+    """Render the sidebar header and the Edition Year filter over `catalog`.
+
+    Runs before any data is loaded: the options are the catalogued
+    editions. `reload_error` is the catalog watcher's last failure, shown
+    while `catalog` is the last data that loaded. Returns the selected
+    years and the source holding only their editions (every edition when
+    none is selected) for `data.load_dataset`.
+    """
     st.sidebar.header("🔍 Filters")
 
     st.sidebar.button(
@@ -60,12 +152,10 @@ def render_sidebar_filters(df: pd.DataFrame) -> pd.DataFrame:
         on_click=reset_filters,
     )
 
-    filtered_df = df.copy()
-
     # ---- Core Filters ----
     st.sidebar.subheader("📌 Core")
 
-    years = sorted(filtered_df["edition_year"].unique())
+    years = catalog.years
     if len(years) <= 1:
         # With a single available year, a multiselect can look "stuck".
         # Show an indicator instead (no tags), and treat it as unfiltered.
@@ -76,80 +166,108 @@ def render_sidebar_filters(df: pd.DataFrame) -> pd.DataFrame:
             disabled=True,
             key="_year_single",
         )
-        selected_years: list = []
+        selected = []
     else:
         _coerce_multiselect_state_to_options("year", years)
-        selected_years = st.sidebar.multiselect("Edition Year", years, key="year")
-        if selected_years:
-            filtered_df = filtered_df[filtered_df["edition_year"].isin(selected_years)]
-
-    categories = sorted(filtered_df["category"].unique())
-    _coerce_multiselect_state_to_options("cat", categories)
-    selected_categories = st.sidebar.multiselect("Category", categories, key="cat")
-    if selected_categories:
-        filtered_df = filtered_df[filtered_df["category"].isin(selected_categories)]
-
-    themes = sorted(filtered_df["theme"].unique())
-    _coerce_multiselect_state_to_options("theme", themes)
-    selected_themes = st.sidebar.multiselect("Theme", themes, key="theme")
-    if selected_themes:
-        filtered_df = filtered_df[filtered_df["theme"].isin(selected_themes)]
+        selected = st.sidebar.multiselect("Edition Year", years, key="year")
+
+    if reload_error:
+        st.sidebar.error(f"Reloading the data failed, showing the last loaded data. {reload_error}")
+    for warning in catalog.warnings:
+        st.sidebar.warning(warning)
+
+    source = catalog.source(selected)
+    previous = st.session_state.get(DATASET_SOURCE_KEY)
+    if previous is not None and previous != source and [key[0] for key in previous] == [key[0] for key in source]:
+        # Same editions, new files: the catalog watcher swapped in a reload.
+        st.toast("🔄 The dataset was updated.")
+    st.session_state[DATASET_SOURCE_KEY] = source
+    return source, selected
+
+
+def render_sidebar_filters(dataset: Dataset, years: list[int]) -> np.ndarray | None:
+    """Render the sidebar filters below the Edition Year over `dataset`.
+
+    `years` is the Edition Year selection (from `render_edition_filter`).
+
+    Returns the base row positions of the selection (None when nothing is
+    filtered); `selected_frame` materialises them.
+    """
+    df = dataset.frame
+    index = dataset.filter_index
+    search_index = dataset.search_index
+
+    # Packed row bitmap of the current selection; None means "all rows".
+    mask: np.ndarray | None = None
+    # Applied selections, hashed into the filter signature for shared caches.
+    selections: dict[str, object] = {}
+
+    # The dataset holds only the selected editions; rows of other years are
+    # filtered only when an edition's file contains several years.
+    if years:
+        selections["year"] = years
+        year_column = FILTER_COLUMNS["year"]
+        if set(index.values(year_column)) - set(years):
+            mask = index.select(year_column, years)
+
+    mask = _multiselect_filter(index, mask, "Category", "cat", selections)
+    mask = _multiselect_filter(index, mask, "Theme", "theme", selections)
 
     # ---- Organization ----
     st.sidebar.subheader("🏛 Organization")
 
-    organizations = sorted(filtered_df["organization"].unique())
-    _coerce_multiselect_state_to_options("org", organizations)
-    selected_orgs = st.sidebar.multiselect("Organization", organizations, key="org")
-    if selected_orgs:
-        filtered_df = filtered_df[filtered_df["organization"].isin(selected_orgs)]
-
-    departments = sorted(filtered_df["department"].unique())
-    _coerce_multiselect_state_to_options("dept", departments)
-    selected_depts = st.sidebar.multiselect("Department", departments, key="dept")
-    if selected_depts:
-        filtered_df = filtered_df[filtered_df["department"].isin(selected_depts)]
+    mask = _multiselect_filter(index, mask, "Organization", "org", selections)
+    mask = _multiselect_filter(index, mask, "Department", "dept", selections)
 
     # ---- Outcome ----
     st.sidebar.subheader("🏆 Outcome")
 
-    statuses = sorted(filtered_df["status"].unique())
-    _coerce_multiselect_state_to_options("status", statuses)
-    selected_statuses = st.sidebar.multiselect("Status", statuses, key="status")
-    if selected_statuses:
-        filtered_df = filtered_df[filtered_df["status"].isin(selected_statuses)]
+    mask = _multiselect_filter(index, mask, "Status", "status", selections)
 
     # ---- Geography ----
     st.sidebar.subheader("🌍 Geography")
 
-    states = sorted(filtered_df["institute_state"].unique())
-    _coerce_multiselect_state_to_options("state", states)
-    selected_states = st.sidebar.multiselect("Institute State", states, key="state")
-    if selected_states:
-        filtered_df = filtered_df[filtered_df["institute_state"].isin(selected_states)]
-
-    cities = sorted(filtered_df["institute_city"].unique())
-    _coerce_multiselect_state_to_options("city", cities)
-    selected_cities = st.sidebar.multiselect("Institute City", cities, key="city")
-    if selected_cities:
-        filtered_df = filtered_df[filtered_df["institute_city"].isin(selected_cities)]
+    mask = _multiselect_filter(index, mask, "Institute State", "state", selections)
+    mask = _multiselect_filter(index, mask, "Institute City", "city", selections)
 
     # ---- Search ----
     st.sidebar.subheader("🔎 Search")
 
     ps_search = st.sidebar.text_input("Problem Statement Title", key="ps")
+    selections["ps"] = ps_search
     if ps_search:
-        filtered_df = filtered_df[
-            filtered_df["problem_statement_title"].str.contains(ps_search, case=False, na=False)
-        ]
+        hits = search_index.contains(df["problem_statement_title"], ps_search)
+        mask = index.intersect(mask, np.packbits(hits))
 
     institute_search = st.sidebar.text_input("Institute Name", key="inst")
+    selections["inst"] = institute_search
     if institute_search:
-        filtered_df = filtered_df[
-            filtered_df["institute_name"].str.contains(institute_search, case=False, na=False)
-        ]
+        hits = search_index.contains(df["institute_name"], institute_search)
+        mask = index.intersect(mask, np.packbits(hits))
+
+    rows = None if mask is None else index.rows(mask)
+    # Text searches are recorded as {column: text}; they have no sketches, so
+    # approximate distinct counts fall back to exact counting.
+    st.session_state[ACTIVE_FILTERS_KEY] = {
+        FILTER_COLUMNS.get(key) or SEARCH_FILTER_COLUMNS[key]: value
+        for key, value in selections.items()
+        if value
+    }
+    st.session_state[FILTER_SIGNATURE_KEY] = filter_signature(selections, dataset.version)
 
     st.sidebar.divider()
-    st.sidebar.metric("📊 Filtered Records", f"{len(filtered_df):,}")
+    st.sidebar.metric("📊 Filtered Records", f"{dataset.n_rows if rows is None else len(rows):,}")
+
+    return rows
 
-    return filtered_df
+
+def selected_frame(dataset: Dataset, rows: np.ndarray | None) -> pd.DataFrame:
+    """The sidebar-filtered frame for `rows` (from `render_sidebar_filters`).
+
+    The unfiltered view is the shared base frame itself; a selection is
+    materialised once per filter signature and shared by every session
+    looking at it. Either way the frame must not be mutated.
+    """
+    if rows is None:
+        return dataset.frame
+    return cached_aggregate("selection", lambda: dataset.select(rows))
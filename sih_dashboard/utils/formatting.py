@@ -0,0 +1,69 @@
+"""Display formatting shared by the tabs (no Streamlit calls here).
+
+Truncation works on whole columns: categorical columns truncate each
+category once and map the result through the codes, other columns use
+vectorized string slicing. Scalar helpers are memoized per distinct value.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+
+ELLIPSIS = "..."
+
+# `st.column_config.NumberColumn` format for rupee amounts.
+CURRENCY_COLUMN_FORMAT = "₹%,.0f"
+
+
+@lru_cache(maxsize=65_536)
+def truncate_text(text: str, max_length: int = 40) -> str:
+    """Truncate long text and add ellipsis."""
+    text_str = str(text)
+    if len(text_str) > max_length:
+        return text_str[:max_length] + ELLIPSIS
+    return text_str
+
+
+def _truncate_strings(values: pd.Series, max_length: int) -> pd.Series:
+    too_long = values.str.len() > max_length
+    if not too_long.any():
+        return values
+    return values.where(~too_long, values.str.slice(0, max_length) + ELLIPSIS)
+
+
+def truncate_series(series: pd.Series, max_length: int) -> pd.Series:
+    """`truncate_text` over a column; missing values stay missing."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        labels = _truncate_strings(series.cat.categories.astype(str).to_series(), max_length)
+        codes = series.cat.codes.to_numpy()
+        values = labels.to_numpy(dtype=object)[codes]
+        values[codes < 0] = np.nan
+        return pd.Series(values, index=series.index, name=series.name)
+    return _truncate_strings(series.astype("str"), max_length)
+
+
+def truncate_columns(df: pd.DataFrame, max_lengths: dict[str, int]) -> pd.DataFrame:
+    """Copy of `df` with each `{column: max_length}` truncated for display."""
+    return df.assign(
+        **{col: truncate_series(df[col], n) for col, n in max_lengths.items() if col in df.columns}
+    )
+
+
+def truncate_labels(values: Iterable, max_length: int) -> list[str]:
+    """Truncated chart labels (memoized per distinct label)."""
+    return [truncate_text(v, max_length) for v in values]
+
+
+@lru_cache(maxsize=4_096)
+def format_currency(amount: float) -> str:
+    """Rupee amount without decimals, e.g. 150000 -> "₹150,000"."""
+    return f"₹{amount:,.0f}"
+
+
+def format_percent(value: float, decimals: int = 1) -> str:
+    return f"{value:.{decimals}f}%"
@@ -0,0 +1,173 @@
+"""HyperLogLog sketches for approximate distinct counts.
+
+Used by the optional approximate-distinct mode (see `config.APPROX_DISTINCT_*`).
+Sketches are precomputed per filter-dimension value, so the distinct count
+of a filtered view becomes a register-wise max (union) of a few sketches
+instead of hashing the whole filtered column again.
+
+No Streamlit calls here.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+
+
+MIN_PRECISION = 4
+MAX_PRECISION = 16
+
+
+def precision_for_error(relative_error: float) -> int:
+    """Smallest precision whose standard error (1.04 / sqrt(2**p)) is within bound."""
+    p = math.ceil(math.log2((1.04 / relative_error) ** 2))
+    return max(MIN_PRECISION, min(MAX_PRECISION, p))
+
+
+def hash_values(series: pd.Series) -> np.ndarray:
+    """Stable 64-bit hashes of `series` values (categoricals hash each category once)."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        category_hashes = pd.util.hash_array(series.cat.categories.to_numpy())
+        return category_hashes[series.cat.codes.to_numpy()]
+    return pd.util.hash_array(series.to_numpy())
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Vectorized `int.bit_length` for uint64 (exact: works on 32-bit halves)."""
+    hi = (values >> np.uint64(32)).astype(np.float64)
+    lo = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(hi > 0, 32 + np.frexp(hi)[1], np.frexp(lo)[1])
+
+
+def register_updates(hashes: np.ndarray, precision: int) -> tuple[np.ndarray, np.ndarray]:
+    """Register index and rank (position of the first set bit) for each hash."""
+    tail_bits = 64 - precision
+    index = (hashes >> np.uint64(tail_bits)).astype(np.int64)
+    tail = hashes & np.uint64((1 << tail_bits) - 1)
+    rank = (tail_bits - _bit_length(tail) + 1).astype(np.uint8)
+    return index, rank
+
+
+def estimate_cardinality(registers: np.ndarray) -> float:
+    """HyperLogLog estimate (with linear counting for small cardinalities)."""
+    m = registers.shape[-1]
+    if m >= 128:
+        alpha = 0.7213 / (1 + 1.079 / m)
+    else:
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}[m]
+
+    raw = alpha * m * m / np.sum(np.ldexp(1.0, -registers.astype(np.int64)))
+    zeros = int(np.count_nonzero(registers == 0))
+    if raw <= 2.5 * m and zeros:
+        return m * math.log(m / zeros)
+    return float(raw)
+
+
+class HyperLogLog:
+    """Mergeable HyperLogLog sketch."""
+
+    def __init__(self, precision: int, registers: np.ndarray | None = None):
+        self.precision = precision
+        self.registers = (
+            registers if registers is not None else np.zeros(1 << precision, dtype=np.uint8)
+        )
+
+    @classmethod
+    def from_hashes(cls, hashes: np.ndarray, precision: int) -> "HyperLogLog":
+        sketch = cls(precision)
+        index, rank = register_updates(hashes, precision)
+        np.maximum.at(sketch.registers, index, rank)
+        return sketch
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision.")
+        return HyperLogLog(self.precision, np.maximum(self.registers, other.registers))
+
+    def estimate(self) -> float:
+        return estimate_cardinality(self.registers)
+
+
+class DistinctSketches:
+    """Per-dimension-value sketches of the distinct-count target columns.
+
+    `registers[dimension]` has shape (n_values, n_targets, 2**precision);
+    `totals` holds the unfiltered sketch of every target.
+    """
+
+    def __init__(
+        self,
+        precision: int,
+        targets: list[str],
+        dimensions: dict[str, dict],
+        registers: dict[str, np.ndarray],
+        totals: np.ndarray,
+    ):
+        self.precision = precision
+        self.targets = targets
+        self.dimensions = dimensions  # dimension column -> {value: row in registers}
+        self.registers = registers
+        self.totals = totals
+
+    @classmethod
+    def build(
+        cls,
+        df: pd.DataFrame,
+        dimensions: list[str],
+        targets: list[str],
+        relative_error: float,
+    ) -> "DistinctSketches":
+        precision = precision_for_error(relative_error)
+        m = 1 << precision
+        targets = [t for t in targets if t in df.columns]
+
+        updates = [register_updates(hash_values(df[t]), precision) for t in targets]
+
+        totals = np.zeros((len(targets), m), dtype=np.uint8)
+        for t, (index, rank) in enumerate(updates):
+            np.maximum.at(totals[t], index, rank)
+
+        positions: dict[str, dict] = {}
+        registers: dict[str, np.ndarray] = {}
+        for dim in dimensions:
+            if dim not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[dim], sort=True)
+            valid = codes >= 0
+            dim_registers = np.zeros((len(uniques), len(targets), m), dtype=np.uint8)
+            for t, (index, rank) in enumerate(updates):
+                np.maximum.at(dim_registers[:, t, :], (codes[valid], index[valid]), rank[valid])
+            positions[dim] = {v: i for i, v in enumerate(pd.Index(uniques).tolist())}
+            registers[dim] = dim_registers
+
+        return cls(precision, targets, positions, registers, totals)
+
+    def estimate(self, column: str, selections: dict[str, list]) -> int | None:
+        """Approximate distinct count of `column` under `selections`.
+
+        `selections` maps dimension column -> selected values. Returns None
+        when sketches cannot answer (unknown column, several active
+        dimensions - unions cannot express intersections - or an
+        unsketched dimension); callers then count exactly.
+        """
+        if column not in self.targets:
+            return None
+        target = self.targets.index(column)
+
+        active = {dim: values for dim, values in selections.items() if values}
+        if not active:
+            return round(estimate_cardinality(self.totals[target]))
+        if len(active) > 1:
+            return None
+
+        (dim, values), = active.items()
+        positions = self.dimensions.get(dim)
+        if positions is None:
+            return None
+        rows = [positions[v] for v in values if v in positions]
+        if not rows:
+            return 0
+        union = self.registers[dim][rows, target, :].max(axis=0)
+        return round(estimate_cardinality(union))
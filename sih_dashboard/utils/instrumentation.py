@@ -0,0 +1,93 @@
+"""Streamlit glue for the opt-in profiling mode (see `profiling`)."""
+
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from typing import Iterator
+
+import pandas as pd
+import streamlit as st
+
+from . import profiling
+from .config import PROFILE_ENABLED, PROFILE_LOG_PATH, PROFILE_QUERY_PARAM
+
+
+def profiling_enabled() -> bool:
+    return PROFILE_ENABLED or st.query_params.get(PROFILE_QUERY_PARAM) == "1"
+
+
+@contextmanager
+def profiled_rerun() -> Iterator[None]:
+    """Profile the enclosed rerun when enabled: log it and show the sidebar panel."""
+    if not profiling_enabled():
+        yield
+        return
+
+    profile = profiling.start({"pid": os.getpid()})
+    completed = False
+    try:
+        with profile.stage("rerun"):
+            yield
+        completed = True
+    finally:
+        profiling.finish()
+        profiling.write_jsonl(profile, PROFILE_LOG_PATH)
+    if completed:
+        render_profile_panel(profile)
+
+
+@contextmanager
+def profiled_callback(name: str, enabled: bool, **detail) -> Iterator[dict]:
+    """Log work done outside a rerun (e.g. deferred downloads) as its own profile.
+
+    `enabled` must be read during the rerun (`profiling_enabled()`), since
+    query params are unavailable from the server thread running the callback.
+    """
+    if not enabled:
+        yield detail
+        return
+
+    profile = profiling.start({"pid": os.getpid(), "trigger": name})
+    try:
+        with profile.stage(name, **detail) as d:
+            yield d
+    finally:
+        profiling.finish()
+        profiling.write_jsonl(profile, PROFILE_LOG_PATH)
+
+
+def plotly_chart(fig, **kwargs):
+    """`st.plotly_chart`, timed as a stage (covers figure serialisation)."""
+    with profiling.stage("plotly_chart", traces=len(fig.data)):
+        return st.plotly_chart(fig, **kwargs)
+
+
+def render_profile_panel(profile: profiling.RerunProfile) -> None:
+    records = sorted(profile.records, key=lambda r: r.offset)
+    table = pd.DataFrame(
+        {
+            "Stage": ["\u2003" * r.depth + r.stage for r in records],  # em-space indent
+            "ms": [r.seconds * 1000 for r in records],
+            "RSS Δ (MB)": [
+                None if r.rss_delta_bytes is None else r.rss_delta_bytes / 2**20 for r in records
+            ],
+            "Detail": [", ".join(f"{k}={v}" for k, v in r.detail.items()) for r in records],
+        }
+    )
+    rss = profiling.rss_bytes()
+
+    with st.sidebar.expander("⏱️ Rerun Profile", expanded=False):
+        st.dataframe(
+            table,
+            hide_index=True,
+            column_config={
+                "ms": st.column_config.NumberColumn("ms", format="%.1f"),
+                "RSS Δ (MB)": st.column_config.NumberColumn("RSS Δ (MB)", format="%.1f"),
+            },
+        )
+        st.caption(
+            f"Rerun `{profile.rerun_id}` · "
+            + (f"RSS {rss / 2**20:,.0f} MB · " if rss is not None else "")
+            + f"logged to `{PROFILE_LOG_PATH}`"
+        )
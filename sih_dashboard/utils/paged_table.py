@@ -0,0 +1,87 @@
+"""Server-side paged `st.dataframe`.
+
+Only the visible page is sent to the browser. The sort order of the full
+table is computed once per (filter signature, table widgets, sort column,
+direction) in the shared aggregate cache and reused while paging.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Hashable
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from .config import FILTER_SIGNATURE_KEY, TABLE_DEFAULT_PAGE_SIZE, TABLE_PAGE_SIZES
+from .filters import cached_aggregate
+from .sort_index import SortIndex, sort_order
+
+
+def paged_dataframe(
+    df: pd.DataFrame,
+    *,
+    key: str,
+    params: tuple[Hashable, ...] = (),
+    sort_column: str | None = None,
+    ascending: bool = True,
+    sort_index: SortIndex | None = None,
+    format_page: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+    **dataframe_kwargs: Any,
+) -> np.ndarray:
+    """Render one page of `df` sorted by `sort_column`, with paging controls below.
+
+    `params` must hold every widget value besides the sidebar filters that
+    shapes `df` (as for `downloads.export_download_button`). With `sort_index`
+    (only for row subsets of the base frame, whose index labels are base row
+    positions) indexed columns are ordered from the load-time permutation
+    instead of sorting `df`. `format_page`
+    (e.g. truncating long text) only runs on the visible rows. Returns the
+    row positions of the whole sorted table, for exports.
+    """
+    order = cached_aggregate(
+        f"sort.{key}:{params!r}:{sort_column}:{'asc' if ascending else 'desc'}",
+        lambda: (
+            sort_index.order(sort_column, df.index.to_numpy(), ascending)
+            if sort_index is not None and sort_column in sort_index.columns
+            else sort_order(df, sort_column, ascending)
+        ),
+    )
+
+    table = st.container()
+    col_size, col_page, col_info = st.columns([1, 1, 3])
+
+    with col_size:
+        page_size = st.selectbox(
+            "Rows per page",
+            TABLE_PAGE_SIZES,
+            index=TABLE_PAGE_SIZES.index(TABLE_DEFAULT_PAGE_SIZE),
+            key=f"_page_size_{key}",
+        )
+    n_pages = max(1, -(-len(order) // page_size))
+
+    # Back to the first page whenever the table itself changes.
+    page_key = f"_page_{key}"
+    view = (st.session_state.get(FILTER_SIGNATURE_KEY), params, sort_column, ascending, page_size)
+    if st.session_state.get(f"_page_view_{key}") != view:
+        st.session_state[f"_page_view_{key}"] = view
+        st.session_state[page_key] = 1
+    elif st.session_state.get(page_key, 1) > n_pages:
+        st.session_state[page_key] = n_pages
+
+    with col_page:
+        page = st.number_input("Page", min_value=1, max_value=n_pages, step=1, key=page_key)
+
+    start = (int(page) - 1) * page_size
+    stop = min(start + page_size, len(order))
+    with col_info:
+        st.caption(
+            f"Rows **{start + 1 if stop else 0:,}–{stop:,}** of **{len(order):,}** "
+            f"· page {int(page):,} of {n_pages:,}"
+        )
+
+    page_df = df.take(order[start:stop])
+    if format_page is not None:
+        page_df = format_page(page_df)
+    table.dataframe(page_df, **dataframe_kwargs)
+    return order
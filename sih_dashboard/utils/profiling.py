@@ -0,0 +1,141 @@
+"""Per-rerun stage timings for the opt-in profiling mode.
+
+No Streamlit calls here (see `instrumentation` for the UI glue). A
+`RerunProfile` is bound to the running script thread through a context
+variable, so instrumented code calls the module-level `stage` / `note`
+helpers, which do nothing while profiling is off.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Iterator
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def rss_bytes() -> int | None:
+    """Resident set size of this process (peak RSS where current is unavailable)."""
+    try:
+        with open("/proc/self/statm", "rb") as fh:
+            return int(fh.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is not None:
+        # ru_maxrss is KiB on Linux, bytes on macOS; only used off Linux.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return None
+
+
+@dataclass
+class StageRecord:
+    stage: str
+    depth: int
+    offset: float  # seconds from the start of the rerun
+    seconds: float
+    rss_bytes: int | None
+    rss_delta_bytes: int | None
+    detail: dict[str, Any] = field(default_factory=dict)
+
+
+class RerunProfile:
+    """Stage records of one script rerun (completion order; sort by `offset` for start order)."""
+
+    def __init__(self, meta: dict[str, Any] | None = None):
+        self.rerun_id = uuid.uuid4().hex[:12]
+        self.timestamp = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+        self.meta = meta or {}
+        self.records: list[StageRecord] = []
+        self._depth = 0
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str, **detail: Any) -> Iterator[dict[str, Any]]:
+        """Time the enclosed block. The yielded dict can be updated with details."""
+        before = rss_bytes()
+        start = time.perf_counter()
+        self._depth += 1
+        try:
+            yield detail
+        finally:
+            self._depth -= 1
+            after = rss_bytes()
+            self.records.append(
+                StageRecord(
+                    stage=name,
+                    depth=self._depth,
+                    offset=start - self._start,
+                    seconds=time.perf_counter() - start,
+                    rss_bytes=after,
+                    rss_delta_bytes=None if before is None or after is None else after - before,
+                    detail=detail,
+                )
+            )
+
+    def note(self, name: str, **detail: Any) -> None:
+        """Zero-duration marker (e.g. a cache miss inside a cached function)."""
+        offset = time.perf_counter() - self._start
+        self.records.append(StageRecord(name, self._depth, offset, 0.0, None, None, detail))
+
+    def to_records(self) -> list[dict[str, Any]]:
+        return [
+            {"rerun_id": self.rerun_id, "timestamp": self.timestamp, **self.meta, **asdict(r)}
+            for r in self.records
+        ]
+
+
+_CURRENT: ContextVar[RerunProfile | None] = ContextVar("sih_rerun_profile", default=None)
+_LOG_LOCK = threading.Lock()
+
+
+def start(meta: dict[str, Any] | None = None) -> RerunProfile:
+    """Begin profiling the current rerun."""
+    profile = RerunProfile(meta)
+    _CURRENT.set(profile)
+    return profile
+
+
+def finish() -> None:
+    _CURRENT.set(None)
+
+
+@contextmanager
+def stage(name: str, **detail: Any) -> Iterator[dict[str, Any]]:
+    """`RerunProfile.stage` on the active profile; a no-op when profiling is off."""
+    profile = _CURRENT.get()
+    if profile is None:
+        yield detail
+        return
+    with profile.stage(name, **detail) as d:
+        yield d
+
+
+def note(name: str, **detail: Any) -> None:
+    profile = _CURRENT.get()
+    if profile is not None:
+        profile.note(name, **detail)
+
+
+def write_jsonl(profile: RerunProfile, path: str) -> None:
+    """Append the profile's records to a JSON-lines log (one line per stage)."""
+    lines = "".join(json.dumps(r, default=str) + "\n" for r in profile.to_records())
+    try:
+        with _LOG_LOCK, open(path, "a", encoding="utf-8") as fh:
+            fh.write(lines)
+    except OSError:
+        # Read-only deployments still get the in-app panel.
+        pass
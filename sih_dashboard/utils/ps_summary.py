@@ -0,0 +1,179 @@
+"""Problem-statement fact table.
+
+The PS-level summary (teams, institutes, states, winners, submission ratio)
+is built once per dataset version. Filtered views are then served either
+as a slice of that base table (when every selected PS keeps all of its
+rows) or from vectorized per-group partial aggregates over integer codes,
+instead of re-grouping the raw team rows on six string keys.
+
+No Streamlit calls here.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+PS_KEY_COLUMNS = [
+    "ps_id",
+    "problem_statement_title",
+    "category",
+    "theme",
+    "organization",
+    "department",
+]
+
+
+@dataclass(frozen=True)
+class PSFactTable:
+    """Base PS summary plus the per-row codes needed for partial aggregates."""
+
+    table: pd.DataFrame
+    row_groups: np.ndarray  # base row -> PS group number (row of `table`)
+    group_rows: np.ndarray  # PS group number -> base rows in the group
+    institute_codes: np.ndarray
+    state_codes: np.ndarray
+    n_institutes: int
+    n_states: int
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.row_groups)
+
+
+def _distinct_per_group(groups: np.ndarray, codes: np.ndarray, n_codes: int, n_groups: int) -> np.ndarray:
+    """Number of distinct `codes` per group (missing codes, -1, ignored)."""
+    valid = codes >= 0
+    pairs = np.unique(groups[valid].astype(np.int64) * n_codes + codes[valid])
+    return np.bincount(pairs // n_codes, minlength=n_groups)
+
+
+def _aggregate(
+    keys: pd.DataFrame,
+    groups: np.ndarray,
+    df: pd.DataFrame,
+    institute_codes: np.ndarray,
+    state_codes: np.ndarray,
+    n_institutes: int,
+    n_states: int,
+) -> pd.DataFrame:
+    n_groups = len(keys)
+    teams = np.bincount(groups, weights=df["team_id"].notna().to_numpy(), minlength=n_groups)
+    winners = np.bincount(groups, weights=df["is_winner"].to_numpy(), minlength=n_groups)
+
+    summary = keys.copy()
+    summary["teams"] = teams.astype(np.int64)
+    summary["institutes"] = _distinct_per_group(groups, institute_codes, n_institutes, n_groups)
+    summary["states"] = _distinct_per_group(groups, state_codes, n_states, n_groups)
+    summary["winners"] = winners.astype(np.int64)
+    for col in ("total_submission", "max_submission"):
+        summary[col] = (
+            pd.Series(df[col].to_numpy()).groupby(groups).max().reindex(range(n_groups)).to_numpy()
+        )
+
+    summary["submission_ratio"] = (
+        summary["total_submission"] / summary["max_submission"].replace(0, pd.NA)
+    )
+    return summary
+
+
+def build_ps_fact_table(df: pd.DataFrame) -> PSFactTable:
+    """Summarize every problem statement of the (unfiltered) dataset."""
+    row_groups = (
+        df.groupby(PS_KEY_COLUMNS, observed=True, sort=True).ngroup().to_numpy(dtype=np.int64)
+    )
+    _, first_rows = np.unique(row_groups, return_index=True)
+    keys = df[PS_KEY_COLUMNS].iloc[first_rows].reset_index(drop=True)
+
+    institute_codes, institutes = pd.factorize(df["institute_name"])
+    state_codes, states = pd.factorize(df["institute_state"])
+
+    table = _aggregate(
+        keys,
+        row_groups,
+        df,
+        institute_codes,
+        state_codes,
+        len(institutes),
+        len(states),
+    )
+    return PSFactTable(
+        table=table,
+        row_groups=row_groups,
+        group_rows=np.bincount(row_groups, minlength=len(table)),
+        institute_codes=institute_codes,
+        state_codes=state_codes,
+        n_institutes=len(institutes),
+        n_states=len(states),
+    )
+
+
+def update_ps_fact_table(fact: PSFactTable, df: pd.DataFrame, rows: np.ndarray) -> PSFactTable:
+    """The fact table of `df`, whose `rows` changed outcome or submission columns.
+
+    Only the problem statements of those rows are re-aggregated; PS keys
+    and institute/state columns must be unchanged (the row codes are kept).
+    """
+    groups = np.unique(fact.row_groups[rows])
+    members = np.flatnonzero(np.isin(fact.row_groups, groups))
+    partial = _aggregate(
+        fact.table.loc[groups, PS_KEY_COLUMNS].reset_index(drop=True),
+        np.searchsorted(groups, fact.row_groups[members]),
+        df.take(members),
+        fact.institute_codes[members],
+        fact.state_codes[members],
+        fact.n_institutes,
+        fact.n_states,
+    )
+    table = fact.table.copy()
+    for col in partial.columns.difference(PS_KEY_COLUMNS):
+        values = table[col].to_numpy(copy=True)
+        values[groups] = partial[col].to_numpy()
+        table[col] = values
+    return PSFactTable(
+        table=table,
+        row_groups=fact.row_groups,
+        group_rows=fact.group_rows,
+        institute_codes=fact.institute_codes,
+        state_codes=fact.state_codes,
+        n_institutes=fact.n_institutes,
+        n_states=fact.n_states,
+    )
+
+
+def summarize_problem_statements(df: pd.DataFrame, fact: PSFactTable) -> pd.DataFrame:
+    """PS summary for a filtered view of the dataset `fact` was built from.
+
+    `df` must keep the base frame's positional index (as produced by the
+    sidebar filters); otherwise the summary is rebuilt from scratch.
+    """
+    if len(df) == fact.n_rows:
+        return fact.table
+
+    positions = df.index.to_numpy()
+    if positions.dtype.kind not in "iu" or (len(positions) and positions.max() >= fact.n_rows):
+        return build_ps_fact_table(df).table
+
+    groups = fact.row_groups[positions]
+    rows = np.bincount(groups, minlength=len(fact.table))
+    present = rows > 0
+
+    # Every selected PS kept all of its rows: the base rows are exact.
+    if np.array_equal(rows[present], fact.group_rows[present]):
+        return fact.table[present].reset_index(drop=True)
+
+    # Otherwise aggregate only the selected rows, renumbering present groups.
+    group_ids = np.flatnonzero(present)
+    local_groups = np.searchsorted(group_ids, groups)
+    return _aggregate(
+        fact.table.loc[present, PS_KEY_COLUMNS].reset_index(drop=True),
+        local_groups,
+        df,
+        fact.institute_codes[positions],
+        fact.state_codes[positions],
+        fact.n_institutes,
+        fact.n_states,
+    )
@@ -0,0 +1,79 @@
+"""Query engine selection for the tab aggregations (SIH_QUERY_ENGINE).
+
+An engine is created once per loaded dataset (the editions the year filter
+selected) and lives with it, so a rerun's engine always matches the frame
+and indexes of the same snapshot. DuckDB and Polars are used only when asked for and
+importable (DuckDB also needs the prepared Parquet copies it scans to be
+writable, and Polars does for editions with result deltas); otherwise the
+pandas engine serves the tabs. The copies follow the dataset version, so
+an applied delta re-exports its edition's copy.
+
+Every engine runs next to the in-memory dataset, not instead of it (see the
+`duckdb_engine` module notes).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import streamlit as st
+
+from ..engines.base import FilterQuery, QueryEngine
+from ..engines.duckdb_engine import DuckDBEngine, duckdb_available
+from ..engines.pandas_engine import PandasEngine
+from ..engines.polars_engine import PolarsEngine, polars_available, scan_prepared
+from .config import (
+    ACTIVE_FILTERS_KEY,
+    APPROX_DISTINCT_ENABLED,
+    DATA_DIR,
+    DUCKDB_MEMORY_LIMIT,
+    DUCKDB_THREADS,
+    PREPARED_CACHE_DIR,
+    QUERY_ENGINE,
+)
+from .data import dataset_editions, prepared_parquet
+from .dataset import Dataset
+from .profiling import note
+
+
+def load_query_engine(dataset: Dataset) -> QueryEngine:
+    """The configured engine for `dataset` (from `data.load_dataset`), built on first use."""
+    return dataset.derived("query_engine", lambda: _build_query_engine(dataset))
+
+
+def _build_query_engine(dataset: Dataset) -> QueryEngine:
+    source, editions = dataset_editions(dataset)
+
+    def prepared_parquets() -> list[Path | None]:
+        """Prepared Parquet copy of each edition (None where it cannot be written)."""
+        return [prepared_parquet(path, edition) for (path, _, _), edition in zip(source, editions)]
+
+    # A dataset not loaded through `load_dataset` has no edition files to scan.
+    if source and QUERY_ENGINE == "duckdb":
+        parquets = prepared_parquets() if duckdb_available() else [None]
+        if None not in parquets:
+            return DuckDBEngine(
+                parquets,
+                threads=DUCKDB_THREADS,
+                memory_limit=DUCKDB_MEMORY_LIMIT,
+                temp_directory=Path(DATA_DIR) / PREPARED_CACHE_DIR / "duckdb",
+                approx_distinct=APPROX_DISTINCT_ENABLED,
+            )
+        note("query_engine.duckdb_unavailable")
+    elif source and QUERY_ENGINE == "polars":
+        if polars_available():
+            # Without a writable cache the raw edition is cleaned lazily per
+            # query, unless result deltas have to be applied to it.
+            scans = [
+                parquet or (None if deltas else path)
+                for parquet, (path, _, deltas) in zip(prepared_parquets(), source)
+            ]
+            if None not in scans:
+                return PolarsEngine(scan_prepared(scans), approx_distinct=APPROX_DISTINCT_ENABLED)
+        note("query_engine.polars_unavailable")
+    return PandasEngine(lambda: dataset.ps_fact_table)
+
+
+def filter_query() -> FilterQuery:
+    """The applied sidebar filters of this session as engine predicates."""
+    return FilterQuery.from_selections(st.session_state.get(ACTIVE_FILTERS_KEY) or {})
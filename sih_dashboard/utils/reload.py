@@ -0,0 +1,132 @@
+"""Hot reload of the dataset catalog (no Streamlit calls here).
+
+`CatalogWatcher.catalog` is the catalog sessions render from. A background
+thread keeps it in step with the files under the data directory: it is
+woken by filesystem events (watchdog, i.e. inotify on Linux) when
+available, and polls file sizes and mtimes every `interval` seconds either
+way. A changed catalog is first warmed off the session threads (changed
+editions re-read and re-prepared, their indexes rebuilt) and only then
+published by swapping one reference, so a rerun sees either the old data
+or the new data fully built, and never waits for a load. New result deltas
+(`<root>/deltas/`) are applied to the loaded editions the same way.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from .catalog import Catalog, discover_editions
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - optional dependency
+    FileSystemEventHandler = object
+    Observer = None
+
+
+_log = logging.getLogger(__name__)
+
+
+class _WakeOnChange(FileSystemEventHandler):
+    """Wakes the watcher on events outside hidden paths (prepared copies are written there)."""
+
+    def __init__(self, root: Path, wake: threading.Event):
+        self.root = root
+        self.wake = wake
+
+    def on_any_event(self, event) -> None:
+        try:
+            parts = Path(event.src_path).relative_to(self.root).parts
+        except ValueError:
+            parts = ()
+        if not any(part.startswith((".", "_")) for part in parts):
+            self.wake.set()
+
+
+class CatalogWatcher:
+    """Publishes the catalog of `root` once `warm(catalog)` has built it.
+
+    `warm` loads whatever the sessions will ask for first; `on_swap(old,
+    new)` runs after publishing (to release the replaced editions). A warm
+    that raises (e.g. a half-copied file) keeps the last good catalog
+    published and records the error in `error` (cleared by the next swap);
+    that catalog is retried only once the files change again.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        warm: Callable[[Catalog], None],
+        *,
+        interval: float,
+        settle: float = 1.0,
+        on_swap: Callable[[Catalog, Catalog], None] | None = None,
+    ):
+        self.root = Path(root)
+        self.catalog = discover_editions(self.root)
+        self.error: str | None = None
+        self._warm = warm
+        self._on_swap = on_swap
+        self._interval = interval
+        self._settle = settle
+        self._failed: Catalog | None = None
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "CatalogWatcher":
+        """Start watching in the background (no-op when `interval` <= 0)."""
+        if self._interval <= 0 or self._thread is not None:
+            return self
+        if Observer is not None:
+            try:
+                root = self.root.resolve()
+                observer = Observer()
+                observer.schedule(_WakeOnChange(root, self._wake), str(root), recursive=True)
+                observer.daemon = True
+                observer.start()
+            except OSError:
+                # E.g. the inotify watch limit is reached: polling still runs.
+                pass
+        self._thread = threading.Thread(target=self._run, name="sih-catalog-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self._interval)
+            self._wake.clear()
+            try:
+                self.check()
+            except OSError:
+                # A file vanished mid-scan; the next pass sees the settled state.
+                pass
+            except Exception as exc:
+                # Keep the thread alive: later changes may be loadable.
+                _log.exception("Checking the catalog of %s failed", self.root)
+                self.error = f"{type(exc).__name__}: {exc}"
+
+    def check(self) -> bool:
+        """Warm and publish the catalog on disk if it changed; True if it was swapped in."""
+        catalog = discover_editions(self.root)
+        if catalog == self.catalog or catalog == self._failed:
+            return False
+        # Writers must be done: the files have to be unchanged for `settle` seconds.
+        time.sleep(self._settle)
+        if discover_editions(self.root) != catalog:
+            return False
+        try:
+            self._warm(catalog)
+        except Exception as exc:
+            self._failed = catalog
+            self.error = f"{type(exc).__name__}: {exc}"
+            return False
+        previous, self.catalog = self.catalog, catalog
+        self._failed = self.error = None
+        if self._on_swap is not None:
+            self._on_swap(previous, catalog)
+        return True
@@ -0,0 +1,170 @@
+"""Row orderings for sorted tables (no Streamlit calls here).
+
+`SortIndex` keeps one stable ascending permutation per column of the base
+frame, built at load. A filtered frame (whose index labels are base row
+positions) is then sorted by keeping the permutation entries that fall in
+the filter, which is linear in the frame size instead of n log n.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+
+def sort_order(df: pd.DataFrame, column: str | None, ascending: bool) -> np.ndarray:
+    """Positions of `df` rows sorted by `column` (stable, missing values last).
+
+    Without a column the rows keep their current order.
+    """
+    if not column:
+        return np.arange(len(df))
+    values = df[column].reset_index(drop=True)
+    return values.sort_values(ascending=ascending, kind="stable", na_position="last").index.to_numpy()
+
+
+def _sort_keys(series: pd.Series) -> tuple[Callable[[np.ndarray], np.ndarray], np.ndarray]:
+    """Comparable sort keys of `series` at given rows, and its missing mask."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        return codes.__getitem__, codes < 0
+    missing = series.isna().to_numpy()
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy().__getitem__, missing
+    return (lambda rows: series.take(rows).to_numpy(dtype=object)), missing
+
+
+def _insertion_points(
+    order: np.ndarray, key_at: Callable[[np.ndarray], np.ndarray], rows: np.ndarray
+) -> np.ndarray:
+    """Where each of `rows` goes in `order` (rows sorted by key, then position).
+
+    One vectorized binary search for all rows, probing keys only at the
+    midpoints.
+    """
+    lo = np.zeros(len(rows), dtype=np.int64)
+    hi = np.full(len(rows), len(order), dtype=np.int64)
+    keys = key_at(rows)
+    while (active := lo < hi).any():
+        mid = (lo + hi) // 2
+        probe = order[np.minimum(mid, len(order) - 1)]
+        probe_keys = key_at(probe)
+        before = (probe_keys < keys) | ((probe_keys == keys) & (probe < rows))
+        lo = np.where(active & before, mid + 1, lo)
+        hi = np.where(active & ~before, mid, hi)
+    return lo
+
+
+@dataclass(frozen=True)
+class ColumnOrder:
+    """Stable ascending order of one column, missing values last."""
+
+    ascending: np.ndarray  # int32 row positions
+    run_starts: np.ndarray  # packed bits over the first n_valid entries: a new value starts here
+    n_valid: int  # rows with a value (the rest are missing and stay last)
+
+    def descending(self) -> np.ndarray:
+        """Stable descending order: runs of equal values reversed, each run kept as is."""
+        starts = np.flatnonzero(np.unpackbits(self.run_starts, count=self.n_valid))
+        lengths = np.diff(np.append(starts, self.n_valid))
+        starts, lengths = starts[::-1], lengths[::-1]
+        out_starts = np.cumsum(lengths) - lengths
+        source = np.repeat(starts - out_starts, lengths) + np.arange(self.n_valid)
+        return np.concatenate([self.ascending[: self.n_valid][source], self.ascending[self.n_valid :]])
+
+
+class SortIndex:
+    """Per-column sort permutations of a fixed frame (positional RangeIndex)."""
+
+    def __init__(self, n_rows: int, columns: dict[str, ColumnOrder]):
+        self.n_rows = n_rows
+        self.columns = columns
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, columns: list[str]) -> "SortIndex":
+        index: dict[str, ColumnOrder] = {}
+        for col in columns:
+            if col not in df.columns:
+                continue
+            # Sorted factorize codes rank the values; missing (-1) is moved last.
+            codes, uniques = pd.factorize(df[col], sort=True)
+            codes = np.where(codes < 0, len(uniques), codes)
+            ascending = np.argsort(codes, kind="stable").astype(np.int32)
+            ranked = codes[ascending]
+            n_valid = int(np.searchsorted(ranked, len(uniques)))
+            run_starts = np.ones(n_valid, dtype=bool)
+            run_starts[1:] = ranked[1:n_valid] != ranked[: n_valid - 1]
+            index[col] = ColumnOrder(ascending, np.packbits(run_starts), n_valid)
+        return cls(len(df), index)
+
+    def updated(self, df: pd.DataFrame, changes: dict[str, np.ndarray]) -> "SortIndex":
+        """The index of `df`, whose `{column: rows}` changed since this index was built.
+
+        The changed rows are taken out of each affected permutation and
+        merged back in at their new values by a binary search that reads
+        the column only at probed positions, instead of re-sorting it; run
+        starts are recomputed only around the moved entries. Other columns
+        are shared. Equals a fresh `build` over `df`.
+        """
+        index = dict(self.columns)
+        for column, rows in changes.items():
+            col = self.columns.get(column)
+            if col is None:
+                continue
+            key_at, missing = _sort_keys(df[column])
+            rows = np.unique(rows)
+            moved = np.zeros(self.n_rows, dtype=bool)
+            moved[rows] = True
+
+            # Missing values stay last, in row order.
+            rest = col.ascending[col.n_valid :]
+            rest = rest[~moved[rest]]
+            gone = rows[missing[rows]]
+            rest = np.insert(rest, np.searchsorted(rest, gone), gone)
+
+            valid = col.ascending[: col.n_valid]
+            kept = ~moved[valid]
+            starts = np.unpackbits(col.run_starts, count=col.n_valid).astype(bool)
+            # A kept entry right after a removed one may now start a run.
+            after_removed = np.cumsum(kept)[np.flatnonzero(~kept)]
+            valid, starts = valid[kept], starts[kept]
+
+            # Equal values keep row order (the stable sort's tie-break).
+            added = rows[~missing[rows]]
+            at = _insertion_points(valid, key_at, added)
+            keys = key_at(added)
+            order = sorted(range(len(added)), key=lambda i: (at[i], keys[i], added[i]))
+            added, at = added[order], at[order]
+            valid = np.insert(valid, at, added.astype(valid.dtype))
+            starts = np.insert(starts, at, True)
+
+            inserted = at + np.arange(len(at))
+            shifted = after_removed + np.searchsorted(at, after_removed, side="right")
+            dirty = np.unique(np.concatenate([inserted, inserted + 1, shifted]))
+            dirty = dirty[dirty < len(valid)]
+            if len(dirty):
+                inner = dirty[dirty > 0]
+                starts[inner] = key_at(valid[inner]) != key_at(valid[inner - 1])
+                starts[dirty[dirty == 0]] = True
+            index[column] = ColumnOrder(
+                np.concatenate([valid, rest]).astype(np.int32), np.packbits(starts), len(valid)
+            )
+        return SortIndex(self.n_rows, index)
+
+    def order(self, column: str, rows: np.ndarray, ascending: bool) -> np.ndarray:
+        """Positions into `rows` (base row positions) sorted by `column`.
+
+        Same result as `sort_order` on the frame holding those rows.
+        """
+        col = self.columns[column]
+        perm = col.ascending if ascending else col.descending()
+        if len(rows) < self.n_rows:
+            selected = np.zeros(self.n_rows, dtype=bool)
+            selected[rows] = True
+            perm = perm[selected[perm]]
+        position = np.empty(self.n_rows, dtype=np.int32)
+        position[rows] = np.arange(len(rows), dtype=np.int32)
+        return position[perm]
@@ -0,0 +1,81 @@
+"""Submission status taxonomy.
+
+Single source of truth for which statuses count as awards. Outcome columns
+are derived once at load time (see `add_outcome_columns`) so tabs can use
+vectorized sums instead of re-running `isin` on the status strings.
+No Streamlit calls here.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+# Problem-statement winners.
+WINNER_STATUSES = ["Winner", "Joint Winner"]
+
+# Ranked prizes.
+PRIZE_STATUSES = ["First Prize", "Second Prize", "Third Prize"]
+
+# Special awards. Note: "Achiever" not "Achievers".
+SPECIAL_AWARD_STATUSES = [
+    "Consolation Prize",
+    "Future Innovators Award",
+    "Girls Achiever Award",
+    "Quantum Frontier Award",
+]
+
+# Every status that represents a declared award.
+AWARD_STATUSES = WINNER_STATUSES + PRIZE_STATUSES + SPECIAL_AWARD_STATUSES
+
+# Non-award outcomes, in display order.
+NON_AWARD_STATUSES = ["Shortlisted", "Waitlist"]
+
+# Preferred display order for status charts.
+STATUS_ORDER = AWARD_STATUSES + NON_AWARD_STATUSES
+
+# `award_tier` values (int8); higher is better.
+AWARD_TIER_NONE = 0
+AWARD_TIER_SPECIAL = 1
+AWARD_TIER_PRIZE = 2
+AWARD_TIER_WINNER = 3
+
+# Columns `add_outcome_columns` derives from `status`; internal, so the
+# Data Explorer does not offer or export them.
+OUTCOME_COLUMNS = ["award_tier", "is_winner", "is_ps_winner"]
+
+STATUS_AWARD_TIERS: dict[str, int] = {
+    **{s: AWARD_TIER_WINNER for s in WINNER_STATUSES},
+    **{s: AWARD_TIER_PRIZE for s in PRIZE_STATUSES},
+    **{s: AWARD_TIER_SPECIAL for s in SPECIAL_AWARD_STATUSES},
+}
+
+
+def award_tiers(status: pd.Series) -> np.ndarray:
+    """Vectorized status -> `award_tier` (int8) mapping."""
+    if isinstance(status.dtype, pd.CategoricalDtype):
+        # Map each category once, then gather by code.
+        category_tiers = np.array(
+            [STATUS_AWARD_TIERS.get(c, AWARD_TIER_NONE) for c in status.cat.categories]
+            + [AWARD_TIER_NONE],  # code -1 (missing)
+            dtype=np.int8,
+        )
+        return category_tiers[status.cat.codes.to_numpy()]
+    return status.map(STATUS_AWARD_TIERS).fillna(AWARD_TIER_NONE).to_numpy(dtype=np.int8)
+
+
+def add_outcome_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Add `award_tier`, `is_winner`, `is_ps_winner` and numeric `prize_money`.
+
+    - `is_winner`: any declared award (the dashboard's canonical outcome).
+    - `is_ps_winner`: declared problem-statement winner (Winner / Joint Winner).
+    """
+    tiers = award_tiers(df["status"])
+    df["award_tier"] = tiers
+    df["is_winner"] = tiers > AWARD_TIER_NONE
+    df["is_ps_winner"] = tiers == AWARD_TIER_WINNER
+
+    if "prize_money" in df.columns:
+        df["prize_money"] = pd.to_numeric(df["prize_money"], errors="coerce")
+    return df
@@ -0,0 +1,130 @@
+"""Trigram index for case-insensitive substring search.
+
+Indexes the *distinct* values of the searchable text columns (no Streamlit
+calls here). A query is answered by intersecting the posting lists of its
+trigrams and verifying the surviving candidates, so search cost follows the
+number of distinct titles/names rather than the number of rows.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """Substring index over a fixed list of distinct strings."""
+
+    def __init__(self, values: list[str]):
+        self.values = pd.Index(values)
+        self._lowered = [str(v).lower() for v in values]
+
+        postings: dict[str, list[int]] = defaultdict(list)
+        for i, text in enumerate(self._lowered):
+            for gram in _trigrams(text):
+                postings[gram].append(i)
+        self._postings = {g: np.asarray(ids, dtype=np.int64) for g, ids in postings.items()}
+
+    def extended(self, values: list[str]) -> "TrigramIndex":
+        """A copy that also indexes `values` (new values of the indexed column).
+
+        Only the postings of their trigrams are copied; existing positions
+        stay valid. Values already present or no longer in the column may be
+        listed twice or linger, which is harmless: search results are
+        matched back against the column's values.
+        """
+        added = list(dict.fromkeys(values))
+        index = object.__new__(TrigramIndex)
+        index.values = self.values.append(pd.Index(added, dtype=self.values.dtype))
+        index._lowered = self._lowered + [str(v).lower() for v in added]
+        index._postings = dict(self._postings)
+        postings: dict[str, list[int]] = defaultdict(list)
+        for i, text in enumerate(index._lowered[len(self._lowered) :], start=len(self._lowered)):
+            for gram in _trigrams(text):
+                postings[gram].append(i)
+        for gram, ids in postings.items():
+            new = np.asarray(ids, dtype=np.int64)
+            old = self._postings.get(gram)
+            index._postings[gram] = new if old is None else np.concatenate([old, new])
+        return index
+
+    def search(self, query: str) -> np.ndarray:
+        """Positions (into `values`) of values containing `query`, ignoring case."""
+        needle = query.lower()
+        if not needle:
+            return np.arange(len(self._lowered))
+
+        if len(needle) < 3:
+            # Too short for trigrams: scan the distinct values.
+            candidates = range(len(self._lowered))
+        else:
+            lists = [self._postings.get(g) for g in _trigrams(needle)]
+            if any(p is None for p in lists):
+                return np.empty(0, dtype=np.int64)
+            lists.sort(key=len)
+            candidates = reduce(lambda a, b: np.intersect1d(a, b, assume_unique=True), lists)
+
+        return np.fromiter(
+            (i for i in candidates if needle in self._lowered[i]),
+            dtype=np.int64,
+        )
+
+
+class SearchIndex:
+    """One `TrigramIndex` per searchable column of a dataset."""
+
+    def __init__(self, columns: dict[str, TrigramIndex]):
+        self.columns = columns
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, columns: list[str]) -> "SearchIndex":
+        index: dict[str, TrigramIndex] = {}
+        for col in columns:
+            if col not in df.columns:
+                continue
+            series = df[col]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                values = series.cat.categories.tolist()
+            else:
+                values = pd.unique(series.dropna().astype(str)).tolist()
+            index[col] = TrigramIndex(values)
+        return cls(index)
+
+    def updated(self, df: pd.DataFrame, changes: dict[str, np.ndarray]) -> "SearchIndex":
+        """The index of `df`, whose `{column: rows}` changed since this index was built.
+
+        Text columns index the changed rows' new values on top of the old
+        ones; categorical columns are re-indexed from their categories only
+        when those changed. Other columns are shared.
+        """
+        index = dict(self.columns)
+        for column, rows in changes.items():
+            old = self.columns.get(column)
+            if old is None:
+                continue
+            series = df[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                if not series.cat.categories.equals(old.values):
+                    index[column] = TrigramIndex(series.cat.categories.tolist())
+            else:
+                index[column] = old.extended(series.take(rows).dropna().astype(str).tolist())
+        return SearchIndex(index)
+
+    def contains(self, series: pd.Series, query: str) -> np.ndarray:
+        """Boolean row mask equivalent to `series.str.contains(query, case=False, regex=False)`."""
+        index = self.columns.get(series.name)
+        if index is None:
+            return series.astype(str).str.contains(query, case=False, regex=False).to_numpy()
+
+        matches = index.search(query)
+        if isinstance(series.dtype, pd.CategoricalDtype) and series.cat.categories.equals(index.values):
+            # Category codes are positions into the indexed values.
+            return np.isin(series.cat.codes.to_numpy(), matches)
+        return series.isin(index.values[matches]).to_numpy()
@@ -0,0 +1,7 @@
+"""Headless view models, one module per tab.
+
+Each `compute_*` function turns a sidebar-filtered frame into a frozen
+dataclass of plain data (scalars and small DataFrames). No Streamlit calls:
+they can be memoized (see `filters.cached_aggregate`), benchmarked, or run
+in a worker pool. Tab modules only turn view models into widgets and charts.
+"""
@@ -0,0 +1,16 @@
+"""Shared helpers for view models (no Streamlit calls)."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import pandas as pd
+
+
+# (frame, column) -> number of distinct values; lets the UI plug in the
+# approximate (HyperLogLog) counter without the views depending on it.
+DistinctCounter = Callable[[pd.DataFrame, str], int]
+
+
+def exact_nunique(df: pd.DataFrame, column: str) -> int:
+    return int(df[column].nunique())
@@ -0,0 +1,60 @@
+"""Data Explorer tab view models."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from ..utils.data import observed_values
+from ..utils.status import NON_AWARD_STATUSES, OUTCOME_COLUMNS, WINNER_STATUSES
+
+
+DEFAULT_COLUMNS = [
+    "edition_year",
+    "ps_id",
+    "problem_statement_title",
+    "category",
+    "team_name",
+    "status",
+    "prize_money",
+    "institute_name",
+    "institute_state",
+]
+
+
+def attribute_columns(df: pd.DataFrame) -> list[str]:
+    """Columns the explorer offers and exports (derived outcome columns left out)."""
+    return [col for col in df.columns if col not in OUTCOME_COLUMNS]
+
+
+def status_options(df: pd.DataFrame) -> list[str]:
+    """Statuses offered by the row-level status filter, in display order."""
+    present = set(observed_values(df["status"]))
+    return [s for s in WINNER_STATUSES + NON_AWARD_STATUSES if s in present]
+
+
+def explore(
+    df: pd.DataFrame,
+    columns: list[str],
+    statuses: list[str],
+    min_prize: float | None,
+) -> pd.DataFrame:
+    """Selected columns of `df`, narrowed by status / minimum prize.
+
+    Rows keep the frame's order; the paged table sorts them.
+    """
+    rows = df[df["status"].isin(statuses)] if statuses else df
+    display_df = rows[columns]
+
+    if min_prize is not None and "prize_money" in display_df.columns:
+        display_df = display_df[(display_df["prize_money"].fillna(0) >= min_prize)]
+
+    return display_df
+
+
+def export_filename(df: pd.DataFrame, n_records: int) -> str:
+    """Download name (without extension) spanning the edition years present in `df`."""
+    years = observed_values(df["edition_year"]) if "edition_year" in df.columns else []
+    year_part = (
+        f"{years[0]}-{years[-1]}" if len(years) > 1 else str(years[0]) if years else "unknown"
+    )
+    return f"sih_{year_part}_filtered_dataset_{n_records}_records"
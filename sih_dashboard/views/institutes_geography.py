@@ -0,0 +1,86 @@
+"""Institutes & Geography tab view model."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pandas as pd
+
+from ..utils.data import ranked_counts
+from ..utils.text_index import SearchIndex
+from .base import DistinctCounter, exact_nunique
+
+
+@dataclass(frozen=True)
+class InstitutesView:
+    institutes: int
+    cities: int
+    states: int
+    avg_teams: float
+    inst_counts: pd.DataFrame  # institute_name, Teams (top 15)
+    state_counts: pd.DataFrame  # institute_state, Teams (top 15)
+    state_category_share: pd.DataFrame  # institute_state, category, count, share (top 10 states)
+    summary: pd.DataFrame  # one row per institute
+
+
+def build_state_category_share(df: pd.DataFrame, top_states: pd.Series) -> pd.DataFrame:
+    """Category counts and within-state shares for the given states."""
+    state_cat = (
+        df[df["institute_state"].isin(top_states)]
+        .groupby(["institute_state", "category"], observed=True)
+        .size()
+        .reset_index(name="count")
+    )
+
+    state_totals = state_cat.groupby("institute_state", observed=True)["count"].transform("sum")
+    state_cat["share"] = state_cat["count"] / state_totals
+
+    return state_cat
+
+
+def build_institute_summary(df: pd.DataFrame) -> pd.DataFrame:
+    """Institute-level participation and outcome metrics."""
+    inst_summary = (
+        df.groupby(
+            ["institute_name", "institute_city", "institute_state"],
+            as_index=False,
+            observed=True,
+        )
+        .agg(
+            teams=("team_id", "count"),
+            unique_ps=("ps_id", "nunique"),
+            winners=("is_ps_winner", "sum"),
+        )
+    )
+
+    inst_summary["win_rate"] = inst_summary["winners"] / inst_summary["teams"]
+
+    return inst_summary
+
+
+def compute_institutes(df: pd.DataFrame, nunique: DistinctCounter = exact_nunique) -> InstitutesView:
+    teams_per_institute = df.groupby("institute_name", observed=True)["team_id"].count()
+    state_counts = (
+        ranked_counts(df.groupby("institute_state", observed=True)["team_id"].count())
+        .head(15)
+        .reset_index(name="Teams")
+    )
+    return InstitutesView(
+        institutes=nunique(df, "institute_name"),
+        cities=nunique(df, "institute_city"),
+        states=nunique(df, "institute_state"),
+        avg_teams=teams_per_institute.mean(),
+        inst_counts=(
+            ranked_counts(teams_per_institute).head(15).reset_index(name="Teams")
+        ),
+        state_counts=state_counts,
+        state_category_share=build_state_category_share(df, state_counts["institute_state"].head(10)),
+        summary=build_institute_summary(df),
+    )
+
+
+def search_institutes(summary: pd.DataFrame, query: str, search_index: SearchIndex) -> pd.DataFrame:
+    """Summary rows whose institute name contains `query` (case-insensitive)."""
+    if not query:
+        return summary
+    return summary[search_index.contains(summary["institute_name"], query)]
@@ -0,0 +1,52 @@
+"""Overview tab view model."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pandas as pd
+
+from ..utils.data import observed_counts
+from .base import DistinctCounter, exact_nunique
+
+
+@dataclass(frozen=True)
+class OverviewView:
+    total_teams: int
+    unique_ps: int
+    institutes: int
+    states: int
+    winning_teams: int
+    year_counts: pd.DataFrame  # Edition Year, Teams
+    category_counts: pd.DataFrame  # category, Teams
+    theme_counts: pd.DataFrame  # Theme, Teams (top 10)
+    state_counts: pd.DataFrame  # State, Teams (top 10)
+
+
+def compute_overview(df: pd.DataFrame, nunique: DistinctCounter = exact_nunique) -> OverviewView:
+    return OverviewView(
+        total_teams=len(df),
+        unique_ps=nunique(df, "ps_id"),
+        institutes=nunique(df, "institute_name"),
+        states=nunique(df, "institute_state"),
+        winning_teams=int(df["is_ps_winner"].sum()),
+        year_counts=(
+            observed_counts(df["edition_year"])
+            .sort_index()
+            .reset_index(name="Teams")
+            .rename(columns={"edition_year": "Edition Year"})
+        ),
+        category_counts=observed_counts(df["category"]).reset_index(name="Teams"),
+        theme_counts=(
+            observed_counts(df["theme"])
+            .head(10)
+            .reset_index(name="Teams")
+            .rename(columns={"theme": "Theme"})
+        ),
+        state_counts=(
+            observed_counts(df["institute_state"])
+            .head(10)
+            .reset_index(name="Teams")
+            .rename(columns={"institute_state": "State"})
+        ),
+    )
@@ -0,0 +1,105 @@
+"""Problem Statements tab view models."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pandas as pd
+
+from ..utils.data import observed_counts, ranked_counts
+from ..utils.ps_summary import PSFactTable, summarize_problem_statements
+from ..utils.text_index import SearchIndex
+from .base import DistinctCounter, exact_nunique
+
+
+@dataclass(frozen=True)
+class ProblemStatementsView:
+    unique_ps: int
+    organizations: int
+    departments: int
+    avg_teams: float
+    ps_counts: pd.DataFrame  # ps_id, problem_statement_title, Teams (top 20)
+    org_counts: pd.DataFrame  # Organization, Teams (top 15)
+    dept_counts: pd.DataFrame  # Department, Teams (top 15)
+    summary: pd.DataFrame  # one row per problem statement (see ps_summary)
+
+
+@dataclass(frozen=True)
+class ProblemStatementDetail:
+    ps_id: str
+    title: str
+    category: str
+    theme: str
+    organization: str
+    department: str
+    teams: int
+    institutes: int
+    states: int
+    winners: int
+    state_counts: pd.DataFrame  # State, Teams
+
+
+def compute_problem_statements(
+    df: pd.DataFrame,
+    fact: PSFactTable,
+    nunique: DistinctCounter = exact_nunique,
+) -> ProblemStatementsView:
+    """`fact` is the fact table of the unfiltered dataset `df` was filtered from."""
+    return ProblemStatementsView(
+        unique_ps=nunique(df, "ps_id"),
+        organizations=nunique(df, "organization"),
+        departments=nunique(df, "department"),
+        avg_teams=df.groupby("ps_id", observed=True)["team_id"].count().mean(),
+        ps_counts=(
+            ranked_counts(
+                df.groupby(["ps_id", "problem_statement_title"], observed=True)["team_id"].count()
+            )
+            .head(20)
+            .reset_index(name="Teams")
+        ),
+        org_counts=(
+            observed_counts(df["organization"])
+            .head(15)
+            .reset_index(name="Teams")
+            .rename(columns={"organization": "Organization"})
+        ),
+        dept_counts=(
+            observed_counts(df["department"])
+            .head(15)
+            .reset_index(name="Teams")
+            .rename(columns={"department": "Department"})
+        ),
+        summary=summarize_problem_statements(df, fact),
+    )
+
+
+def search_summary(summary: pd.DataFrame, query: str, search_index: SearchIndex) -> pd.DataFrame:
+    """Summary rows whose PS ID or title contains `query` (case-insensitive)."""
+    if not query:
+        return summary
+    return summary[
+        search_index.contains(summary["ps_id"], query)
+        | search_index.contains(summary["problem_statement_title"], query)
+    ]
+
+
+def compute_ps_detail(df: pd.DataFrame, ps_id: str) -> ProblemStatementDetail:
+    ps_df = df[df["ps_id"] == ps_id]
+    first = ps_df.iloc[0]
+    return ProblemStatementDetail(
+        ps_id=ps_id,
+        title=first["problem_statement_title"],
+        category=first["category"],
+        theme=first["theme"],
+        organization=first["organization"],
+        department=first["department"],
+        teams=len(ps_df),
+        institutes=ps_df["institute_name"].nunique(),
+        states=ps_df["institute_state"].nunique(),
+        winners=ps_df["is_ps_winner"].sum(),
+        state_counts=(
+            observed_counts(ps_df["institute_state"])
+            .reset_index(name="Teams")
+            .rename(columns={"institute_state": "State"})
+        ),
+    )
@@ -0,0 +1,132 @@
+"""Teams & Outcomes tab view models."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pandas as pd
+
+from ..utils.data import observed_counts
+from ..utils.status import STATUS_ORDER
+from ..utils.text_index import SearchIndex
+from .base import DistinctCounter, exact_nunique
+
+
+# Columns of the team-level table (and its CSV download).
+TEAM_COLUMNS = [
+    "team_id",
+    "team_name",
+    "team_leader_name",
+    "status",
+    "ps_id",
+    "problem_statement_title",
+    "category",
+    "theme",
+    "prize_money",
+    "institute_name",
+    "institute_state",
+]
+
+
+@dataclass(frozen=True)
+class TeamsView:
+    total_teams: int
+    winning_teams: int
+    total_prize: float
+    status_counts: pd.DataFrame  # Status, Teams, Prize, PrizeLabel
+    prize_counts: pd.DataFrame  # Prize Amount, Teams
+
+    @property
+    def win_rate(self) -> float:
+        """Percentage of teams with a declared award."""
+        return (self.winning_teams / self.total_teams) * 100 if self.total_teams else 0
+
+
+def build_status_counts(df: pd.DataFrame) -> pd.DataFrame:
+    """Team counts and prize label per status, in display order."""
+    status_counts = (
+        observed_counts(df["status"])
+        .reset_index(name="Teams")
+        .rename(columns={"status": "Status"})
+    )
+
+    # Prize amount per status (if applicable). Most statuses should map to a single prize value;
+    # if multiple values exist, we pick the maximum (still useful and deterministic).
+    prize_money_numeric = pd.to_numeric(df["prize_money"], errors="coerce")
+    status_prize = (
+        prize_money_numeric.groupby(df["status"], dropna=False, observed=True)
+        .max()
+        .reset_index()
+        .rename(columns={"status": "Status", "prize_money": "Prize"})
+    )
+
+    return order_status_counts(status_counts.merge(status_prize, on="Status", how="left"))
+
+
+def order_status_counts(status_counts: pd.DataFrame) -> pd.DataFrame:
+    """Prize labels and display order for (Status, Teams, Prize) rows."""
+    status_counts = status_counts.copy()
+    status_counts["PrizeLabel"] = status_counts["Prize"].apply(
+        lambda v: f"₹{v:,.0f}" if pd.notna(v) else "None"
+    )
+
+    # Normalize labels to handle inconsistencies
+    status_counts["Status"] = (
+        status_counts["Status"].fillna("Unknown").astype(str).str.strip()
+    )
+
+    # Keep your preferred order, but include any extra statuses present in data
+    observed = (
+        status_counts.sort_values(["Teams", "Status"], ascending=[False, True])["Status"].tolist()
+    )
+    observed_unique: list[str] = []
+    for s in observed:
+        if s not in observed_unique:
+            observed_unique.append(s)
+
+    categories = [s for s in STATUS_ORDER if s in observed_unique] + [
+        s for s in observed_unique if s not in STATUS_ORDER
+    ]
+    status_counts["Status"] = pd.Categorical(
+        status_counts["Status"],
+        categories=categories,
+        ordered=True,
+    )
+    status_counts = status_counts.sort_values(["Teams", "Status"], ascending=[False, True])
+
+    return status_counts
+
+
+def build_prize_counts(df: pd.DataFrame) -> pd.DataFrame:
+    """Number of awarded teams per prize amount (highest first)."""
+    prize_df = df[df["is_winner"] & df["prize_money"].notna()]
+    return (
+        prize_df["prize_money"]
+        .astype(int)
+        .value_counts()
+        .sort_index(ascending=False)  # Highest prize first
+        .reset_index(name="Teams")
+        .rename(columns={"prize_money": "Prize Amount"})
+    )
+
+
+def compute_teams(df: pd.DataFrame, nunique: DistinctCounter = exact_nunique) -> TeamsView:
+    # Canonical outcome definition: `is_winner` is derived at load (utils/status.py).
+    return TeamsView(
+        total_teams=nunique(df, "team_id"),
+        winning_teams=df[df["is_winner"]]["team_id"].nunique(),
+        total_prize=df.loc[df["is_winner"], "prize_money"].sum(skipna=True),
+        status_counts=build_status_counts(df),
+        prize_counts=build_prize_counts(df),
+    )
+
+
+def team_table(df: pd.DataFrame, query: str, search_index: SearchIndex) -> pd.DataFrame:
+    """Team rows matching `query` on team or leader name (unsorted; the table sorts by prize)."""
+    teams_df = df[TEAM_COLUMNS]
+    if query:
+        teams_df = teams_df[
+            search_index.contains(teams_df["team_name"], query)
+            | search_index.contains(teams_df["team_leader_name"], query)
+        ]
+    return teams_df
@@ -0,0 +1,19 @@
+import numpy as np
+import pandas as pd
+
+from sih_dashboard.utils.agg_cache import _approx_nbytes
+from sih_dashboard.utils.charts import gradient_bar_chart
+
+
+def test_figure_size_counts_plotted_data():
+    n = 2_000
+    data = pd.DataFrame(
+        {
+            "label": [f"Problem statement number {i}" for i in range(n)],
+            "count": np.arange(n, 0, -1),
+        }
+    )
+    fig = gradient_bar_chart(data, x="count", y="label", title="Top")
+
+    # Labels appear as axis ticks and hover data, so the figure holds them twice.
+    assert _approx_nbytes(fig) > 2 * _approx_nbytes(data["label"].to_numpy(dtype=object))
@@ -0,0 +1,38 @@
+import pandas as pd
+
+from sih_dashboard.utils.catalog import discover_editions, write_partitions
+
+
+def _csv(path, year=2025):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame({"edition_year": [year], "ps_id": ["SIH1"], "team_id": [1]}).to_csv(path, index=False)
+
+
+def test_passed_over_files_are_reported(tmp_path):
+    _csv(tmp_path / "sih_2025_a.csv")
+    _csv(tmp_path / "sih_2025_b.csv")
+    _csv(tmp_path / "teams.csv")
+    _csv(tmp_path / "sih_2024.csv", 2024)
+    write_partitions(pd.DataFrame({"edition_year": [2024], "ps_id": ["SIH1"]}), tmp_path / "sih")
+    _csv(tmp_path / "deltas" / "sih_2023_results.csv", 2023)
+
+    catalog = discover_editions(tmp_path)
+
+    assert catalog.years == [2024, 2025]
+    assert catalog.editions[1].path == str(tmp_path / "sih_2025_a.csv")
+    assert catalog.warnings == (
+        "Skipped sih_2025_b.csv: sih_2025_a.csv already holds the 2025 edition.",
+        "Skipped teams.csv: no edition year (e.g. 2025) in the file name.",
+        "Skipped sih_2024.csv: the partition sih/edition_year=2024 holds the 2024 edition.",
+        "Skipped delta deltas/sih_2023_results.csv: there is no 2023 edition to apply it to.",
+    )
+
+
+def test_clean_layout_has_no_warnings(tmp_path):
+    _csv(tmp_path / "sih_2025.csv")
+    _csv(tmp_path / "deltas" / "sih_2025_results.csv")
+
+    catalog = discover_editions(tmp_path)
+
+    assert catalog.years == [2025]
+    assert catalog.warnings == ()
@@ -0,0 +1,90 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from sih_dashboard.utils.catalog import discover_editions
+from sih_dashboard.utils.config import SORT_INDEX_COLUMNS
+from sih_dashboard.utils.data import delta_errors, load_edition, prepare_data
+from sih_dashboard.utils.dataset import Dataset
+from sih_dashboard.utils.delta import apply_delta, chain_version, read_delta, upsert_frame
+from sih_dashboard.utils.ps_summary import build_ps_fact_table
+from sih_dashboard.utils.sort_index import SortIndex
+
+
+DATA = Path(__file__).resolve().parents[1] / "data" / "sih_2025_problem_statements_team_outcomes.csv"
+
+
+@pytest.fixture(scope="module")
+def base():
+    dataset = Dataset.build(prepare_data(pd.read_csv(DATA)), "v0")
+    dataset.sort_index
+    dataset.ps_fact_table
+    return dataset
+
+
+def _write_delta(frame: pd.DataFrame, path: Path, n_rows: int, seed: int) -> None:
+    """Result updates for `n_rows` random teams: status, prize, team name and city."""
+    rng = np.random.default_rng(seed)
+    rows = frame.iloc[rng.choice(len(frame), n_rows, replace=False)]
+    delta = rows[["ps_id", "team_id", "idea_id"]].astype(str)
+    delta["status"] = rng.choice(["Winner", "Joint Winner", "Shortlisted", "Special Mention"], n_rows)
+    delta["prize_money"] = np.where(delta["status"] == "Shortlisted", "", "100000")
+    delta["team_name"] = [f"Renamed {i}" if i % 3 == 0 else name for i, name in enumerate(rows["team_name"])]
+    delta["institute_city"] = [
+        f"New City {i}" if i % 5 == 0 else city for i, city in enumerate(rows["institute_city"])
+    ]
+    delta.loc[delta.index[:2], "team_id"] = ""  # matched on idea_id
+    delta.to_csv(path, index=False)
+
+
+def _assert_same(updated: Dataset, rebuilt: Dataset) -> None:
+    assert updated.version == rebuilt.version
+    assert_frame_equal(updated.frame, rebuilt.frame)
+
+    for column, expected in rebuilt.filter_index.columns.items():
+        actual = updated.filter_index.columns[column]
+        assert actual.values == expected.values, column
+        for part in ("bitmaps", "rows", "offsets"):
+            a, b = getattr(actual, part), getattr(expected, part)
+            assert (a is None and b is None) or np.array_equal(a, b), (column, part)
+
+    for column, expected in SortIndex.build(rebuilt.frame, SORT_INDEX_COLUMNS).columns.items():
+        actual = updated.sort_index.columns[column]
+        assert np.array_equal(actual.ascending, expected.ascending), column
+        assert np.array_equal(actual.run_starts, expected.run_starts), column
+        assert actual.n_valid == expected.n_valid, column
+
+    assert_frame_equal(updated.ps_fact_table.table, build_ps_fact_table(rebuilt.frame).table)
+
+
+def test_applied_delta_matches_rebuild(base, tmp_path):
+    dataset = base
+    for seed, n_rows in enumerate([400, 5]):
+        path = tmp_path / f"sih_2025_results_{seed}.csv"
+        _write_delta(dataset.frame, path, n_rows, seed)
+        delta = read_delta(path)
+
+        updated = apply_delta(dataset, delta)
+        assert updated is not None
+        rebuilt = Dataset.build(
+            upsert_frame(dataset.frame, delta), chain_version(dataset.version, delta)
+        )
+        _assert_same(updated, rebuilt)
+        dataset = updated
+
+
+def test_malformed_delta_is_skipped(tmp_path):
+    (tmp_path / DATA.name).write_bytes(DATA.read_bytes())
+    (tmp_path / "deltas").mkdir()
+    (tmp_path / "deltas" / "sih_2025_bad.csv").write_text("ps_id,status\nSIH25001,Winner\n")
+    source = discover_editions(tmp_path).source()
+
+    dataset = load_edition(*source[0])
+
+    assert len(dataset.frame) == len(pd.read_csv(DATA))
+    assert delta_errors(source) == [
+        "sih_2025_bad.csv: A delta needs a year in its name and ps_id plus team_id or idea_id columns."
+    ]
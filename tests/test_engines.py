@@ -0,0 +1,64 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from sih_dashboard.engines.base import FilterQuery
+from sih_dashboard.engines.duckdb_engine import DuckDBEngine, duckdb_available
+from sih_dashboard.engines.pandas_engine import PandasEngine
+from sih_dashboard.engines.polars_engine import PolarsEngine, polars_available, scan_prepared
+from sih_dashboard.utils.data import prepare_data
+from sih_dashboard.utils.ps_summary import build_ps_fact_table
+
+
+DATA = Path(__file__).resolve().parents[1] / "data" / "sih_2025_problem_statements_team_outcomes.csv"
+
+# Top-N tables whose cut-off falls inside a run of equal counts.
+TOP_N = {
+    "overview": ["theme_counts", "state_counts"],
+    "problem_statements": ["ps_counts", "org_counts", "dept_counts"],
+    "institutes": ["inst_counts", "state_counts"],
+    "teams": ["status_counts"],
+}
+
+
+@pytest.fixture(scope="module")
+def prepared(tmp_path_factory):
+    df = prepare_data(pd.read_csv(DATA))
+    path = tmp_path_factory.mktemp("engines") / "sih_2025.parquet"
+    df.to_parquet(path, index=False)
+    return df, path
+
+
+def _engines(df, path):
+    engines = [PandasEngine(lambda: build_ps_fact_table(df))]
+    if duckdb_available():
+        engines.append(DuckDBEngine(path))
+    if polars_available():
+        engines.append(PolarsEngine(scan_prepared(path)))
+    if len(engines) == 1:
+        pytest.skip("neither DuckDB nor Polars is installed")
+    return engines
+
+
+def _plain(table: pd.DataFrame) -> list[tuple]:
+    return list(table.astype(str).itertuples(index=False, name=None))
+
+
+@pytest.mark.parametrize("states", [(), ("Maharashtra",)])
+def test_engines_rank_ties_alike(prepared, states):
+    df, path = prepared
+    query = FilterQuery.from_selections({"institute_state": list(states)})
+    filtered = df[df["institute_state"].isin(states)] if states else df
+    pandas_engine, *others = _engines(df, path)
+
+    for method, fields in TOP_N.items():
+        expected = getattr(pandas_engine, method)(filtered, query)
+        for engine in others:
+            view = getattr(engine, method)(filtered, query)
+            for field in fields:
+                assert _plain(getattr(view, field)) == _plain(getattr(expected, field)), (
+                    engine.name,
+                    method,
+                    field,
+                )
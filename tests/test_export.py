@@ -0,0 +1,33 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sih_dashboard.utils.export import EXPORT_FORMATS, encode
+
+
+def _frame(n_rows: int) -> pd.DataFrame:
+    rows = np.arange(n_rows)
+    return pd.DataFrame(
+        {
+            "team_id": rows + 1000,
+            "team_name": [f"Team {i}" if i % 7 else None for i in rows],
+            "prize_money": np.where(rows % 3 == 0, rows * 1000.0, np.nan),
+            "status": pd.Categorical(np.where(rows % 2 == 0, "Winner", "Shortlisted")),
+            "is_winner": rows % 2 == 0,
+        }
+    )
+
+
+@pytest.mark.parametrize("n_rows", [5, 2_500])
+def test_xlsx_round_trip(n_rows):
+    pytest.importorskip("openpyxl")  # read_excel
+    if not EXPORT_FORMATS["xlsx"].available:
+        pytest.skip("no XLSX writer installed")
+    df = _frame(n_rows)
+
+    back = pd.read_excel(io.BytesIO(encode(df, "xlsx")), sheet_name="data")
+
+    expected = df.assign(status=df["status"].astype(object))
+    pd.testing.assert_frame_equal(back, expected, check_dtype=False)
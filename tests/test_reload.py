@@ -0,0 +1,31 @@
+import time
+
+from sih_dashboard.utils.reload import CatalogWatcher
+
+
+def _wait(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return condition()
+
+
+def test_watcher_survives_unexpected_errors(tmp_path):
+    swaps = []
+
+    def on_swap(previous, current):
+        swaps.append(current)
+        if len(swaps) == 1:
+            raise RuntimeError("release failed")
+
+    watcher = CatalogWatcher(
+        tmp_path, lambda catalog: None, interval=0.05, settle=0, on_swap=on_swap
+    ).start()
+
+    (tmp_path / "sih_2024.csv").write_text("edition_year\n2024\n")
+    assert _wait(lambda: watcher.error == "RuntimeError: release failed")
+
+    (tmp_path / "sih_2025.csv").write_text("edition_year\n2025\n")
+    assert _wait(lambda: watcher.catalog.years == [2024, 2025])
+    assert watcher._thread.is_alive()
+    assert watcher.error is None